@@ -7,12 +7,14 @@ Main FastAPI application for geospatial processing services.
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from pathlib import Path
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .routes import (
+    OUTPUT_DIR,
+    UPLOAD_DIR,
     carbon_router,
     dem_router,
     earthwork_router,
@@ -20,11 +22,11 @@ from .routes import (
     optimization_router,
     reports_router,
     roads_router,
+    shutdown_compute_executor,
 )
 
 # Configuration
-UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "./uploads"))
-OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", "./output"))
+WORKER_THREADS = int(os.getenv("WORKER_THREADS", str(os.cpu_count() or 4)))
 
 
 @asynccontextmanager
@@ -33,8 +35,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    # Size the worker pool used for blocking terrain computation
+    to_thread.current_default_thread_limiter().total_tokens = WORKER_THREADS
     yield
     # Shutdown
+    shutdown_compute_executor()
 
 
 app = FastAPI(
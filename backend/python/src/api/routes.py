@@ -4,36 +4,101 @@ API Routes
 FastAPI routes for DEM processing and terrain analysis.
 """
 
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import multiprocessing
 import os
+import tempfile
+import threading
+import time
 import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import fields
+from datetime import date
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Annotated, Literal
-
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
-
-from ..parsers import get_dxf_info, parse_dxf
+from typing import Annotated, Any, Literal
+
+import aiofiles
+import numpy as np
+import pydantic_core
+from anyio import CapacityLimiter, to_thread
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict, Field
+from rasterio.io import MemoryFile
+from rasterio.windows import Window
+from rasterio.windows import bounds as window_bounds
+from shapely.geometry import shape
+
+from ..parsers import ContourLine, get_dxf_info, iter_dxf_contours, parse_dxf
 from ..terrain import (
+    AspectResult,
     DEMConfig,
+    DEMResult,
+    SlopeClassBreakpoint,
+    SlopeResult,
     SlopeUnit,
+    bbox_window,
     calculate_aspect,
     calculate_slope,
     calculate_terrain_metrics,
     classify_slope,
+    count_steep_pixels,
     generate_aspect_visualization,
     generate_dem_from_contours,
     generate_slope_visualization,
-    identify_steep_areas,
     load_dem_from_geotiff,
+    load_dem_from_npy,
+    read_dem_statistics,
+    read_dem_tile,
+    sample_dem_elevations,
     save_aspect_as_geotiff,
     save_dem_as_geotiff,
+    save_dem_as_npy,
     save_slope_as_geotiff,
 )
 
 # Configuration
-OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", "./output"))
-UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "./uploads"))
+OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", "./output")).resolve()
+UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "./uploads")).resolve()
+_OUTPUT_PREFIX = f"{OUTPUT_DIR}{os.sep}"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB reads when streaming files back
+UPLOAD_SPOOL_SIZE = 64 << 20  # 64 MiB, larger uploads roll over to disk
+DXF_EXTENSIONS = (".dxf",)
+DEM_SOURCE_EXTENSIONS = (".dxf", ".tif", ".tiff")
+DEM_CACHE_SIZE = int(os.getenv("DEM_CACHE_SIZE", "32"))
+DERIVED_CACHE_SIZE = int(os.getenv("DERIVED_CACHE_SIZE", "16"))
+REPORT_CACHE_SIZE = int(os.getenv("REPORT_CACHE_SIZE", "64"))
+QUICK_ESTIMATE_CACHE_SIZE = int(os.getenv("QUICK_ESTIMATE_CACHE_SIZE", "1024"))
+ELEVATION_BATCH_LIMIT = 10_000
+HABITAT_BATCH_LIMIT = 500
+HABITAT_BATCH_CONCURRENCY = 10  # sites analysed at once per batch request
+STATIC_MAX_AGE = 3600  # seconds clients may reuse constant reference data
+DEM_TASK_TTL = int(os.getenv("DEM_TASK_TTL", "3600"))  # seconds a finished task is kept
+
+COMPUTE_WORKERS = int(os.getenv("COMPUTE_WORKERS", str(os.cpu_count() or 2)))
+
+# pyplot keeps global figure state, so renders from worker threads are serialized
+_PLOT_LOCK = threading.Lock()
 
 
 # Pydantic models
@@ -60,6 +125,8 @@ class DEMConfigRequest(BaseModel):
 class DEMStatsResponse(BaseModel):
     """Response model for DEM statistics."""
 
+    model_config = ConfigDict(frozen=True)
+
     valid_pixels: int
     total_pixels: int
     min_elevation: float
@@ -75,6 +142,8 @@ class DEMStatsResponse(BaseModel):
 class DXFInfoResponse(BaseModel):
     """Response model for DXF file information."""
 
+    model_config = ConfigDict(frozen=True)
+
     filepath: str
     version: str
     layers: list[str]
@@ -85,6 +154,8 @@ class DXFInfoResponse(BaseModel):
 class ContourSetResponse(BaseModel):
     """Response model for parsed contours."""
 
+    model_config = ConfigDict(frozen=True)
+
     contour_count: int
     min_elevation: float
     max_elevation: float
@@ -96,6 +167,8 @@ class ContourSetResponse(BaseModel):
 class DEMGenerationResponse(BaseModel):
     """Response model for DEM generation."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     dem_id: str
     filepath: str
@@ -103,6 +176,18 @@ class DEMGenerationResponse(BaseModel):
     message: str
 
 
+class DEMTaskResponse(BaseModel):
+    """Response model for a background DEM generation task."""
+
+    model_config = ConfigDict(frozen=True)
+
+    task_id: str
+    status: Literal["pending", "running", "done", "error"]
+    result: DEMGenerationResponse | None = None
+    error: str | None = None
+    error_kind: Literal["input", "server"] | None = None
+
+
 class ElevationQueryRequest(BaseModel):
     """Request model for elevation query."""
 
@@ -110,9 +195,21 @@ class ElevationQueryRequest(BaseModel):
     y: float = Field(description="Y coordinate (latitude or northing)")
 
 
+class ElevationBatchRequest(BaseModel):
+    """Request model for a batch of elevation queries."""
+
+    points: list[ElevationQueryRequest] = Field(
+        min_length=1,
+        max_length=ELEVATION_BATCH_LIMIT,
+        description="Coordinates to query, e.g. vertices of a profile line",
+    )
+
+
 class ElevationQueryResponse(BaseModel):
     """Response model for elevation query."""
 
+    model_config = ConfigDict(frozen=True)
+
     x: float
     y: float
     elevation: float | None
@@ -123,6 +220,427 @@ class ElevationQueryResponse(BaseModel):
 dem_router = APIRouter()
 
 
+def _new_compute_executor() -> ProcessPoolExecutor:
+    """Create the process pool for CPU-bound work; spawn avoids forking GDAL state."""
+    return ProcessPoolExecutor(
+        max_workers=COMPUTE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+# DEM generation, optimization, routing, earthwork and PDF rendering run
+# in worker processes. A crashed worker (e.g. OOM on a large DEM) breaks
+# the whole pool, so it is replaced rather than left failing every request.
+compute_executor = _new_compute_executor()
+_compute_executor_lock = threading.Lock()
+DEM_TASKS: dict[str, Future] = {}
+_DEM_TASK_FINISHED: dict[str, float] = {}  # task ID -> monotonic finish time
+
+
+def _register_dem_task(task_id: str, future: Future) -> None:
+    """Track a DEM task, evicting tasks that finished over DEM_TASK_TTL ago."""
+    expired = time.monotonic() - DEM_TASK_TTL
+    for finished_id, finished_at in list(_DEM_TASK_FINISHED.items()):
+        if finished_at < expired:
+            DEM_TASKS.pop(finished_id, None)
+            _DEM_TASK_FINISHED.pop(finished_id, None)
+
+    DEM_TASKS[task_id] = future
+    future.add_done_callback(
+        lambda _: _DEM_TASK_FINISHED.__setitem__(task_id, time.monotonic())
+    )
+
+
+def _replace_compute_executor(broken: ProcessPoolExecutor) -> None:
+    """Swap in a fresh compute pool if ``broken`` is still the current one."""
+    global compute_executor
+    with _compute_executor_lock:
+        if compute_executor is not broken:
+            return
+        compute_executor = _new_compute_executor()
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_compute_executor() -> None:
+    """Shut down the current compute pool without waiting for running tasks."""
+    compute_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit_compute(func: Callable[..., Any], /, *args: Any) -> Future:
+    """
+    Submit work to the compute pool, replacing the pool if it is broken.
+
+    A pool found broken at submission is replaced and the work resubmitted,
+    since nothing has run yet. A pool that breaks while the work runs is
+    replaced once the future fails, and the failure is left to the caller.
+    """
+    executor = compute_executor
+    try:
+        future = executor.submit(func, *args)
+    except BrokenProcessPool:
+        _replace_compute_executor(executor)
+        executor = compute_executor
+        future = executor.submit(func, *args)
+
+    def _check_pool(done: Future) -> None:
+        if not done.cancelled() and isinstance(done.exception(), BrokenProcessPool):
+            _replace_compute_executor(executor)
+
+    future.add_done_callback(_check_pool)
+    return future
+
+
+async def _run_in_process(func: Callable[..., Any], /, **kwargs: Any) -> Any:
+    """
+    Run a CPU-bound function in the compute pool and await its result.
+
+    Arguments and the return value are pickled across the process
+    boundary, so pass arrays rather than objects holding open datasets.
+    Raises a 503 if a worker process crashed while running the task; the
+    pool has been replaced by then, so the client can retry.
+    """
+    future = _submit_compute(partial(func, **kwargs))
+    try:
+        return await asyncio.wrap_future(future)
+    except BrokenProcessPool as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Compute worker crashed; please retry the request",
+        ) from e
+
+
+class _FastJSONRequest(Request):
+    """Request whose JSON body is parsed by pydantic-core's Rust parser."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            try:
+                self._json = pydantic_core.from_json(await self.body())
+            except ValueError:
+                # Let json.loads raise the JSONDecodeError FastAPI reports as 422
+                return await super().json()
+        return self._json
+
+
+class _FastJSONRoute(APIRoute):
+    """
+    Route that decodes JSON request bodies with pydantic-core.
+
+    FastAPI parses bodies with json.loads before validating them; for
+    large GeoJSON payloads the Rust parser is about a third faster.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(_FastJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
+
+# Conditional GET header for endpoints serving constant reference data
+IfNoneMatch = Annotated[str | None, Header()]
+
+
+def _static_json(content: Any) -> tuple[bytes, str]:
+    """
+    Serialize constant response content once, at import.
+
+    Returns:
+        Tuple of (JSON body, quoted ETag derived from the body)
+    """
+    body = pydantic_core.to_json(content)
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _static_response(static: tuple[bytes, str], if_none_match: str | None) -> Response:
+    """
+    Serve a body from _static_json, or 304 if the client already has it.
+    """
+    body, etag = static
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={STATIC_MAX_AGE}"}
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+class _DownloadResponse(FileResponse):
+    """FileResponse that streams large files in DOWNLOAD_CHUNK_SIZE reads."""
+
+    chunk_size = DOWNLOAD_CHUNK_SIZE
+
+
+def _download_response(
+    path: Path, media_type: str, filename: str, not_found: str
+) -> FileResponse:
+    """
+    Build a download response for a file in the output directory.
+
+    The stat result is handed to the response so Starlette does not stat
+    the file a second time before sending it.
+
+    Raises:
+        HTTPException: 404 with ``not_found`` as detail if the file is missing.
+    """
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=not_found)
+
+    return _DownloadResponse(
+        path=path,
+        media_type=media_type,
+        filename=filename,
+        stat_result=stat_result,
+    )
+
+
+def _validate_dem_id(dem_id: str) -> None:
+    """Reject DEM IDs that are not UUIDs before touching the filesystem."""
+    try:
+        uuid.UUID(dem_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid DEM ID")
+
+
+def _dem_path(dem_id: str) -> Path:
+    """Return the GeoTIFF path for a validated DEM ID."""
+    _validate_dem_id(dem_id)
+    return Path(f"{_OUTPUT_PREFIX}{dem_id}_dem.tif")
+
+
+async def _save_upload(file: UploadFile, dest: Path) -> None:
+    """Stream an uploaded file to disk in fixed-size chunks."""
+    async with aiofiles.open(dest, "wb", buffering=UPLOAD_CHUNK_SIZE) as fh:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await fh.write(chunk)
+
+
+async def _spool_upload(file: UploadFile) -> tempfile.SpooledTemporaryFile:
+    """
+    Copy an uploaded file into a spooled temporary file.
+
+    Uploads up to UPLOAD_SPOOL_SIZE stay in memory; the returned file is
+    rewound and removed automatically once closed.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        spooled.write(chunk)
+    spooled.seek(0)
+    return spooled
+
+
+@lru_cache(maxsize=DEM_CACHE_SIZE)
+def _load_dem_cached(path_str: str, mtime_ns: int, size: int) -> DEMResult:
+    """
+    Load a DEM, memoized on path and file signature.
+
+    The first load decodes the GeoTIFF and writes a .npy sidecar; later
+    loads (after eviction, a restart, or in another server worker)
+    memory-map the sidecar instead of decoding again.
+    """
+    path = Path(path_str)
+    sidecar = path.with_suffix(".npy")
+    if _is_fresh(sidecar.with_suffix(".json"), path):
+        dem = load_dem_from_npy(sidecar)
+    else:
+        dem = load_dem_from_geotiff(path)
+        save_dem_as_npy(dem, sidecar)
+    # Cached arrays are shared between requests; guard against mutation
+    dem.data.setflags(write=False)
+    return dem
+
+
+def _load_dem(path: Path) -> DEMResult:
+    """
+    Load a DEM through the in-process LRU cache.
+
+    The cache key includes mtime and size, so a rewritten file is
+    picked up on the next request.
+    """
+    return _load_dem_cached(*_dem_signature(path))
+
+
+def _load_dem_window(path: Path, bbox: tuple[float, float, float, float]) -> DEMResult:
+    """
+    Read only the part of a DEM covering bbox.
+
+    Windows vary per request, so they bypass the LRU cache; a bbox that
+    misses the raster falls back to the cached full DEM.
+    """
+    try:
+        return load_dem_from_geotiff(path, bbox)
+    except ValueError:
+        return _load_dem(path)
+
+
+def _dem_signature(path: Path) -> tuple[str, int, int]:
+    """Return the (path, mtime_ns, size) cache key for a DEM file."""
+    st = path.stat()
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=DERIVED_CACHE_SIZE)
+def _slope_cached(
+    path_str: str, mtime_ns: int, size: int, unit: SlopeUnit
+) -> SlopeResult:
+    """Calculate slope for a DEM, memoized on DEM signature and unit."""
+    slope = calculate_slope(_load_dem_cached(path_str, mtime_ns, size), unit)
+    slope.data.setflags(write=False)
+    return slope
+
+
+@lru_cache(maxsize=DERIVED_CACHE_SIZE)
+def _aspect_cached(path_str: str, mtime_ns: int, size: int) -> AspectResult:
+    """Calculate aspect for a DEM, memoized on DEM signature."""
+    aspect = calculate_aspect(_load_dem_cached(path_str, mtime_ns, size))
+    aspect.data.setflags(write=False)
+    return aspect
+
+
+def _slope_for(path: Path, unit: SlopeUnit) -> SlopeResult:
+    """Get the (cached) slope raster for a DEM file."""
+    return _slope_cached(*_dem_signature(path), unit)
+
+
+def _slope_window(
+    path: Path, bbox: tuple[float, float, float, float]
+) -> tuple[np.ndarray, tuple[float, float, float, float], float]:
+    """
+    Get the cached slope (degrees) of a DEM cropped to bbox.
+
+    Slicing the full-DEM slope keeps cells on the window edge identical to
+    the other endpoints; a bbox that misses the raster gets the whole slope.
+
+    Returns:
+        Tuple of (slope data, window bounds, resolution)
+    """
+    slope = _slope_for(path, SlopeUnit.DEGREES)
+    rows, cols = slope.data.shape
+    full = Window(0, 0, cols, rows)
+    try:
+        window = bbox_window(bbox, slope.transform, full)
+    except ValueError:
+        window = full
+    return (
+        slope.data[window.toslices()],
+        window_bounds(window, slope.transform),
+        abs(slope.transform.a),
+    )
+
+
+def _aspect_for(path: Path) -> AspectResult:
+    """Get the (cached) aspect raster for a DEM file."""
+    return _aspect_cached(*_dem_signature(path))
+
+
+def _is_fresh(artifact: Path, source: Path) -> bool:
+    """Check whether a derived file exists and is newer than its source."""
+    return (
+        artifact.exists() and artifact.stat().st_mtime_ns >= source.stat().st_mtime_ns
+    )
+
+
+def _clear_dem_caches() -> None:
+    """Drop all cached DEMs and derived rasters."""
+    _load_dem_cached.cache_clear()
+    _slope_cached.cache_clear()
+    _aspect_cached.cache_clear()
+
+
+def _encode_tile(path: Path, z: int, x: int, y: int) -> bytes:
+    """Read one DEM tile and encode it as a standalone GeoTIFF."""
+    tile = read_dem_tile(path, z, x, y)
+    with MemoryFile() as memfile:
+        with memfile.open(
+            driver="GTiff",
+            dtype="float32",
+            width=tile.width,
+            height=tile.height,
+            count=1,
+            crs=tile.crs,
+            transform=tile.transform,
+            nodata=tile.nodata_value,
+            compress="deflate",
+        ) as dst:
+            dst.write(tile.data.astype("float32"), 1)
+        return memfile.read()
+
+
+def _render_slope(slope: SlopeResult, path: Path) -> None:
+    """Render a slope PNG while holding the pyplot lock."""
+    with _PLOT_LOCK:
+        generate_slope_visualization(slope, path)
+
+
+def _render_aspect(aspect: AspectResult, path: Path) -> None:
+    """Render an aspect PNG while holding the pyplot lock."""
+    with _PLOT_LOCK:
+        generate_aspect_visualization(aspect, path)
+
+
+def _build_dem(
+    source_path: Path,
+    config: DEMConfig | None,
+    output_path: Path,
+    create_cog: bool,
+) -> DEMResult:
+    """
+    Build a DEM from an uploaded source file and write it to disk.
+
+    Args:
+        source_path: Uploaded DXF or GeoTIFF file
+        config: DEM generation config (DXF sources only)
+        output_path: Destination GeoTIFF path
+        create_cog: Whether to write a Cloud Optimized GeoTIFF
+
+    Returns:
+        The generated DEMResult
+    """
+    if config is not None:
+        # Parse DXF and generate DEM
+        contour_set = parse_dxf(source_path)
+        dem_result = generate_dem_from_contours(contour_set, config)
+    else:
+        # Load existing GeoTIFF
+        dem_result = load_dem_from_geotiff(source_path)
+
+    save_dem_as_geotiff(dem_result, output_path, create_cog=create_cog)
+    return dem_result
+
+
+def _run_dem_task(
+    source_path: Path,
+    config: DEMConfig | None,
+    output_path: Path,
+    create_cog: bool,
+) -> dict:
+    """
+    Generate a DEM inside a worker process.
+
+    Only the summary statistics are sent back to the API process; the
+    raster itself is read from ``output_path`` when needed.
+    """
+    try:
+        dem_result = _build_dem(source_path, config, output_path, create_cog)
+    except Exception:
+        # Clean up partial output on error
+        output_path.unlink(missing_ok=True)
+        raise
+    finally:
+        # Clean up input file
+        source_path.unlink(missing_ok=True)
+
+    return {
+        **dem_result.get_statistics(),
+        "width": dem_result.width,
+        "height": dem_result.height,
+        "bounds": dem_result.bounds,
+    }
+
+
 @dem_router.post("/dxf/info", response_model=DXFInfoResponse)
 async def get_dxf_file_info(
     file: Annotated[UploadFile, File(description="DXF contour file")],
@@ -132,20 +650,14 @@ async def get_dxf_file_info(
 
     Returns basic metadata including layers, entity counts, and version.
     """
-    if not file.filename or not file.filename.lower().endswith(".dxf"):
+    if not file.filename or not file.filename.lower().endswith(DXF_EXTENSIONS):
         raise HTTPException(status_code=400, detail="File must be a DXF file")
 
-    # Save uploaded file temporarily
-    temp_path = UPLOAD_DIR / f"{uuid.uuid4()}.dxf"
-    try:
-        content = await file.read()
-        temp_path.write_bytes(content)
+    with await _spool_upload(file) as spooled:
+        info = await to_thread.run_sync(get_dxf_info, spooled)
 
-        info = get_dxf_info(temp_path)
-        return DXFInfoResponse(**info)
-    finally:
-        if temp_path.exists():
-            temp_path.unlink()
+    info["filepath"] = file.filename
+    return DXFInfoResponse(**info)
 
 
 @dem_router.post("/dxf/parse", response_model=ContourSetResponse)
@@ -160,20 +672,15 @@ async def parse_dxf_contours(
 
     Extracts elevation data from contour lines and returns metadata.
     """
-    if not file.filename or not file.filename.lower().endswith(".dxf"):
+    if not file.filename or not file.filename.lower().endswith(DXF_EXTENSIONS):
         raise HTTPException(status_code=400, detail="File must be a DXF file")
 
-    # Save uploaded file temporarily
-    temp_path = UPLOAD_DIR / f"{uuid.uuid4()}.dxf"
+    spooled = await _spool_upload(file)
     try:
-        content = await file.read()
-        temp_path.write_bytes(content)
-
         layer_filter = layers.split(",") if layers else None
-        contour_set = parse_dxf(temp_path, layer_filter=layer_filter)
-
-        # Get unique layers
-        unique_layers = list(set(c.layer for c in contour_set.contours))
+        contour_set = await to_thread.run_sync(
+            lambda: parse_dxf(spooled, layer_filter=layer_filter)
+        )
 
         return ContourSetResponse(
             contour_count=len(contour_set.contours),
@@ -181,18 +688,79 @@ async def parse_dxf_contours(
             max_elevation=contour_set.max_elevation,
             contour_interval=contour_set.contour_interval,
             bounds=contour_set.bounds,
-            layers=unique_layers,
+            layers=contour_set.layers,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to parse DXF: {str(e)}")
     finally:
-        if temp_path.exists():
-            temp_path.unlink()
+        spooled.close()
+
+
+def _stream_contours(
+    contours: Iterator[ContourLine], spooled: tempfile.SpooledTemporaryFile
+) -> Iterator[bytes]:
+    """
+    Encode contours as a JSON document one contour at a time.
+
+    Starlette drives sync iterators from its thread pool, so parsing the
+    remaining entities stays off the event loop.
+    """
+    try:
+        yield b'{"contours":['
+        for i, contour in enumerate(contours):
+            if i:
+                yield b","
+            yield json.dumps(contour.to_dict(), separators=(",", ":")).encode()
+        yield b"]}"
+    finally:
+        spooled.close()
+
+
+@dem_router.post("/dxf/parse/stream")
+async def parse_dxf_contours_stream(
+    file: Annotated[UploadFile, File(description="DXF contour file")],
+    layers: Annotated[
+        str | None, Form(description="Comma-separated layer names to include")
+    ] = None,
+) -> StreamingResponse:
+    """
+    Parse a DXF file and stream its contour lines as they are extracted.
+
+    Returns a JSON document of the form {"contours": [...]}, where each
+    contour carries its elevation, layer and coordinates. Errors loading
+    the file are reported before the response starts.
+    """
+    if not file.filename or not file.filename.lower().endswith(DXF_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="File must be a DXF file")
 
+    spooled = await _spool_upload(file)
+    layer_filter = layers.split(",") if layers else None
+    contours = iter_dxf_contours(spooled, layer_filter=layer_filter)
+    try:
+        # Pull the first contour eagerly so load errors become HTTP errors
+        first = await to_thread.run_sync(next, contours, None)
+    except ValueError as e:
+        spooled.close()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        spooled.close()
+        raise HTTPException(status_code=500, detail=f"Failed to parse DXF: {str(e)}")
+
+    if first is None:
+        spooled.close()
+        raise HTTPException(
+            status_code=400, detail="No contours with elevation data found in DXF file"
+        )
+
+    return StreamingResponse(
+        _stream_contours(itertools.chain((first,), contours), spooled),
+        media_type="application/json",
+    )
 
-@dem_router.post("/dem/generate", response_model=DEMGenerationResponse)
+
+@dem_router.post("/dem/generate", response_model=DEMTaskResponse, status_code=202)
 async def generate_dem(
     file: Annotated[UploadFile, File(description="DXF contour file or GeoTIFF DEM")],
     resolution: Annotated[float, Form(description="Output resolution")] = 1.0,
@@ -205,20 +773,20 @@ async def generate_dem(
     create_cog: Annotated[
         bool, Form(description="Create Cloud Optimized GeoTIFF")
     ] = True,
-) -> DEMGenerationResponse:
+) -> DEMTaskResponse:
     """
     Generate a DEM from a DXF contour file.
 
     Parses the DXF file, extracts contours, and generates a DEM using
     TIN interpolation. The result is saved as a Cloud Optimized GeoTIFF.
+
+    Generation runs in a worker process; poll ``/dem/tasks/{task_id}``
+    for the result. The task ID is also the DEM ID.
     """
     filename = file.filename or "upload"
+    lower_name = filename.lower()
 
-    if not (
-        filename.lower().endswith(".dxf")
-        or filename.lower().endswith(".tif")
-        or filename.lower().endswith(".tiff")
-    ):
+    if not lower_name.endswith(DEM_SOURCE_EXTENSIONS):
         raise HTTPException(
             status_code=400, detail="File must be a DXF or GeoTIFF file"
         )
@@ -226,62 +794,83 @@ async def generate_dem(
     # Generate unique ID for this DEM
     dem_id = str(uuid.uuid4())
     temp_path = UPLOAD_DIR / f"{dem_id}{Path(filename).suffix}"
-    output_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    output_path = _dem_path(dem_id)
+
+    config = None
+    if lower_name.endswith(DXF_EXTENSIONS):
+        config = DEMConfig(
+            resolution=resolution,
+            crs=crs,
+            interpolation_method=(
+                interpolation if interpolation in ["linear", "nearest"] else "linear"
+            ),
+            sample_interval=sample_interval,
+            buffer=buffer,
+        )
 
     try:
-        # Save uploaded file
-        content = await file.read()
-        temp_path.write_bytes(content)
-
-        if filename.lower().endswith(".dxf"):
-            # Parse DXF and generate DEM
-            contour_set = parse_dxf(temp_path)
-
-            config = DEMConfig(
-                resolution=resolution,
-                crs=crs,
-                interpolation_method=(
-                    interpolation
-                    if interpolation in ["linear", "nearest"]
-                    else "linear"
-                ),
-                sample_interval=sample_interval,
-                buffer=buffer,
-            )
+        # Save uploaded file; the worker removes it once the task has run
+        await _save_upload(file, temp_path)
+        future = _submit_compute(
+            _run_dem_task, temp_path, config, output_path, create_cog
+        )
+    except BaseException:
+        # Clean up a partial upload, including an aborted request
+        temp_path.unlink(missing_ok=True)
+        raise
 
-            dem_result = generate_dem_from_contours(contour_set, config)
-        else:
-            # Load existing GeoTIFF
-            dem_result = load_dem_from_geotiff(temp_path)
+    # A crashed worker never reaches its own cleanup
+    future.add_done_callback(lambda _: temp_path.unlink(missing_ok=True))
+    _register_dem_task(dem_id, future)
 
-        # Save as GeoTIFF
-        save_dem_as_geotiff(dem_result, output_path, create_cog=create_cog)
+    return DEMTaskResponse(task_id=dem_id, status="pending")
 
-        stats = dem_result.get_statistics()
 
-        return DEMGenerationResponse(
+@dem_router.get("/dem/tasks/{task_id}", response_model=DEMTaskResponse)
+async def get_dem_task(task_id: str) -> DEMTaskResponse:
+    """
+    Get the status of a DEM generation task.
+
+    Returns the generation result once the task is done. Failed tasks
+    report ``error_kind`` "input" for files that could not be turned into
+    a DEM (a 400 on the synchronous path) and "server" for anything else,
+    including a crashed worker process.
+
+    Tasks are tracked in the memory of the API process that accepted the
+    upload and are forgotten DEM_TASK_TTL seconds after they finish. When
+    the API runs with several uvicorn workers, a poll routed to another
+    worker returns 404; a finished DEM remains available from
+    ``/dem/{dem_id}`` either way.
+    """
+    future = DEM_TASKS.get(task_id)
+    if future is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    if not future.done():
+        status = "running" if future.running() else "pending"
+        return DEMTaskResponse(task_id=task_id, status=status)
+
+    error = future.exception()
+    if error is not None:
+        return DEMTaskResponse(
+            task_id=task_id,
+            status="error",
+            error=f"DEM generation failed: {str(error)}",
+            error_kind="input" if isinstance(error, ValueError) else "server",
+        )
+
+    stats = future.result()
+    return DEMTaskResponse(
+        task_id=task_id,
+        status="done",
+        result=DEMGenerationResponse(
             success=True,
-            dem_id=dem_id,
-            filepath=str(output_path),
-            stats=DEMStatsResponse(
-                **stats,
-                width=dem_result.width,
-                height=dem_result.height,
-                bounds=dem_result.bounds,
-            ),
+            dem_id=task_id,
+            filepath=str(_dem_path(task_id)),
+            stats=DEMStatsResponse(**stats),
             message=f"DEM generated successfully with {stats['valid_pixels']} valid pixels",
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        # Clean up output file on error
-        if output_path.exists():
-            output_path.unlink()
-        raise HTTPException(status_code=500, detail=f"DEM generation failed: {str(e)}")
-    finally:
-        # Clean up input file
-        if temp_path.exists():
-            temp_path.unlink()
+        ),
+    )
 
 
 @dem_router.get("/dem/{dem_id}")
@@ -289,18 +878,38 @@ async def get_dem(dem_id: str) -> FileResponse:
     """
     Download a generated DEM file.
 
-    Returns the GeoTIFF file for the specified DEM ID.
+    Returns the GeoTIFF file for the specified DEM ID. DEMs are written as
+    Cloud Optimized GeoTIFFs and this endpoint honours HTTP Range
+    requests, so COG-aware clients can point at this URL and fetch only
+    the tiles and overviews they need.
+    """
+    return _download_response(
+        _dem_path(dem_id),
+        media_type="image/tiff",
+        filename=f"{dem_id}_dem.tif",
+        not_found="DEM not found",
+    )
+
+
+@dem_router.get("/dem/{dem_id}/tile/{z}/{x}/{y}")
+async def get_dem_tile(dem_id: str, z: int, x: int, y: int) -> Response:
+    """
+    Get a single 512px tile of a DEM as a GeoTIFF.
+
+    Zoom 0 is the coarsest overview; the highest zoom is full resolution.
+    Only the requested tile is read from the COG.
     """
-    output_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    output_path = _dem_path(dem_id)
 
     if not output_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
-    return FileResponse(
-        path=output_path,
-        media_type="image/tiff",
-        filename=f"{dem_id}_dem.tif",
-    )
+    try:
+        content = await to_thread.run_sync(_encode_tile, output_path, z, x, y)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return Response(content=content, media_type="image/tiff")
 
 
 @dem_router.get("/dem/{dem_id}/stats", response_model=DEMStatsResponse)
@@ -310,12 +919,17 @@ async def get_dem_stats(dem_id: str) -> DEMStatsResponse:
 
     Returns elevation statistics and metadata.
     """
-    output_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    output_path = _dem_path(dem_id)
 
     if not output_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
-    dem_result = load_dem_from_geotiff(output_path)
+    stats = await to_thread.run_sync(read_dem_statistics, output_path)
+    if stats is not None:
+        return DEMStatsResponse(**stats)
+
+    # Files written before statistics tags existed need a full read
+    dem_result = await to_thread.run_sync(_load_dem, output_path)
     stats = dem_result.get_statistics()
 
     return DEMStatsResponse(
@@ -326,6 +940,20 @@ async def get_dem_stats(dem_id: str) -> DEMStatsResponse:
     )
 
 
+async def _query_elevations(
+    path: Path, queries: list[ElevationQueryRequest]
+) -> list[ElevationQueryResponse]:
+    """Sample a DEM at each query point off the event loop."""
+    elevations = await to_thread.run_sync(
+        sample_dem_elevations, path, [(q.x, q.y) for q in queries]
+    )
+
+    return [
+        ElevationQueryResponse(x=q.x, y=q.y, elevation=elevation, unit="meters")
+        for q, elevation in zip(queries, elevations)
+    ]
+
+
 @dem_router.post("/dem/{dem_id}/elevation", response_model=ElevationQueryResponse)
 async def query_elevation(
     dem_id: str, query: ElevationQueryRequest
@@ -335,20 +963,32 @@ async def query_elevation(
 
     Returns the elevation value at the given X, Y coordinate.
     """
-    output_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    output_path = _dem_path(dem_id)
 
     if not output_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
-    dem_result = load_dem_from_geotiff(output_path)
-    elevation = dem_result.get_elevation_at(query.x, query.y)
+    return (await _query_elevations(output_path, [query]))[0]
 
-    return ElevationQueryResponse(
-        x=query.x,
-        y=query.y,
-        elevation=elevation,
-        unit="meters",
-    )
+
+@dem_router.post(
+    "/dem/{dem_id}/elevations", response_model=list[ElevationQueryResponse]
+)
+async def query_elevations(
+    dem_id: str, batch: ElevationBatchRequest
+) -> list[ElevationQueryResponse]:
+    """
+    Query elevations at many coordinates in one request.
+
+    Returns one result per point, in request order. The DEM is opened
+    once per batch rather than once per point.
+    """
+    output_path = _dem_path(dem_id)
+
+    if not output_path.exists():
+        raise HTTPException(status_code=404, detail="DEM not found")
+
+    return await _query_elevations(output_path, batch.points)
 
 
 @dem_router.delete("/dem/{dem_id}")
@@ -356,14 +996,21 @@ async def delete_dem(dem_id: str) -> dict:
     """
     Delete a generated DEM file.
 
-    Removes the DEM file from storage.
+    Removes the DEM file from storage, along with its sidecars and the
+    slope, aspect and visualization files derived from it.
     """
-    output_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    output_path = _dem_path(dem_id)
 
     if not output_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     output_path.unlink()
+    # Sidecars and derived rasters all share the "<dem_id>_" prefix
+    for derived_path in OUTPUT_DIR.glob(f"{dem_id}_*"):
+        derived_path.unlink(missing_ok=True)
+    DEM_TASKS.pop(dem_id, None)
+    _DEM_TASK_FINISHED.pop(dem_id, None)
+    _clear_dem_caches()
 
     return {"success": True, "message": f"DEM {dem_id} deleted"}
 
@@ -376,6 +1023,8 @@ async def delete_dem(dem_id: str) -> dict:
 class SlopeResponse(BaseModel):
     """Response model for slope analysis."""
 
+    model_config = ConfigDict(frozen=True)
+
     slope_id: str
     min_slope: float
     max_slope: float
@@ -387,6 +1036,8 @@ class SlopeResponse(BaseModel):
 class AspectResponse(BaseModel):
     """Response model for aspect analysis."""
 
+    model_config = ConfigDict(frozen=True)
+
     aspect_id: str
     distribution: dict[str, float]
     dominant_direction: str
@@ -396,6 +1047,8 @@ class AspectResponse(BaseModel):
 class SlopeClassDistribution(BaseModel):
     """Slope class distribution."""
 
+    model_config = ConfigDict(frozen=True)
+
     class_name: str
     percentage: float
     buildable: bool
@@ -404,6 +1057,8 @@ class SlopeClassDistribution(BaseModel):
 class ClassifiedSlopeResponse(BaseModel):
     """Response model for classified slope."""
 
+    model_config = ConfigDict(frozen=True)
+
     slope_id: str
     buildable_percent: float
     class_distribution: list[SlopeClassDistribution]
@@ -413,6 +1068,8 @@ class ClassifiedSlopeResponse(BaseModel):
 class TerrainMetricsResponse(BaseModel):
     """Response model for terrain metrics."""
 
+    model_config = ConfigDict(frozen=True)
+
     min_elevation: float
     max_elevation: float
     mean_elevation: float
@@ -431,6 +1088,8 @@ class TerrainMetricsResponse(BaseModel):
 class SteepAreasResponse(BaseModel):
     """Response model for steep areas identification."""
 
+    model_config = ConfigDict(frozen=True)
+
     threshold: float
     steep_pixel_count: int
     steep_area_percent: float
@@ -451,27 +1110,25 @@ async def analyze_slope(
 
     Returns slope statistics and saves slope raster.
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
 
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        # Load DEM
-        dem = load_dem_from_geotiff(dem_path)
-
         # Calculate slope
         slope_unit = (
             SlopeUnit(unit)
             if unit in ["degrees", "percent", "ratio"]
             else SlopeUnit.DEGREES
         )
-        slope = calculate_slope(dem, slope_unit)
+        slope = await to_thread.run_sync(_slope_for, dem_path, slope_unit)
 
-        # Save slope raster
-        slope_id = f"{dem_id}_slope"
+        # Save slope raster (once per DEM revision)
+        slope_id = f"{dem_id}_slope_{slope_unit.value}"
         slope_path = OUTPUT_DIR / f"{slope_id}.tif"
-        save_slope_as_geotiff(slope, slope_path)
+        if not _is_fresh(slope_path, dem_path):
+            await to_thread.run_sync(save_slope_as_geotiff, slope, slope_path)
 
         return SlopeResponse(
             slope_id=slope_id,
@@ -492,31 +1149,24 @@ async def analyze_aspect(dem_id: str) -> AspectResponse:
 
     Returns aspect distribution and saves aspect raster.
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
 
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        dem = load_dem_from_geotiff(dem_path)
-        aspect = calculate_aspect(dem)
+        aspect = await to_thread.run_sync(_aspect_for, dem_path)
 
-        # Save aspect raster
+        # Save aspect raster (once per DEM revision)
         aspect_id = f"{dem_id}_aspect"
         aspect_path = OUTPUT_DIR / f"{aspect_id}.tif"
-        save_aspect_as_geotiff(aspect, aspect_path)
-
-        # Find dominant direction (excluding Flat)
-        dominant = max(
-            [(k, v) for k, v in aspect.distribution.items() if k != "Flat"],
-            key=lambda x: x[1],
-            default=("N", 0),
-        )
+        if not _is_fresh(aspect_path, dem_path):
+            await to_thread.run_sync(save_aspect_as_geotiff, aspect, aspect_path)
 
         return AspectResponse(
             aspect_id=aspect_id,
             distribution=aspect.distribution,
-            dominant_direction=dominant[0],
+            dominant_direction=aspect.dominant_direction,
             filepath=str(aspect_path),
         )
     except Exception as e:
@@ -538,16 +1188,13 @@ async def classify_dem_slope(
     Default thresholds: 0-3% (Flat), 3-5% (Gentle), 5-10% (Moderate),
     10-15% (Steep), >15% (Very Steep).
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
 
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        from ..terrain import SlopeClassBreakpoint
-
-        dem = load_dem_from_geotiff(dem_path)
-        slope = calculate_slope(dem, SlopeUnit.DEGREES)
+        slope = await to_thread.run_sync(_slope_for, dem_path, SlopeUnit.DEGREES)
 
         # Create custom classes from thresholds
         classes = [
@@ -583,12 +1230,12 @@ async def classify_dem_slope(
             ),
         ]
 
-        classified = classify_slope(slope, classes)
+        classified = await to_thread.run_sync(classify_slope, slope, classes)
 
         # Save visualization
         slope_id = f"{dem_id}_slope_classified"
         viz_path = OUTPUT_DIR / f"{slope_id}.png"
-        generate_slope_visualization(classified, viz_path)
+        await to_thread.run_sync(_render_slope, classified, viz_path)
 
         # Build distribution list
         distribution = [
@@ -619,14 +1266,18 @@ async def get_terrain_metrics(dem_id: str) -> TerrainMetricsResponse:
 
     Returns elevation, slope, aspect, and buildability statistics.
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
 
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        dem = load_dem_from_geotiff(dem_path)
-        metrics = calculate_terrain_metrics(dem)
+        dem = await to_thread.run_sync(_load_dem, dem_path)
+        slope = await to_thread.run_sync(_slope_for, dem_path, SlopeUnit.DEGREES)
+        aspect = await to_thread.run_sync(_aspect_for, dem_path)
+        metrics = await to_thread.run_sync(
+            calculate_terrain_metrics, dem, None, slope, aspect
+        )
 
         return TerrainMetricsResponse(
             min_elevation=metrics.min_elevation,
@@ -661,18 +1312,17 @@ async def identify_dem_steep_areas(
         dem_id: DEM identifier
         threshold: Slope threshold in degrees (default 15)
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
 
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        dem = load_dem_from_geotiff(dem_path)
-        slope = calculate_slope(dem, SlopeUnit.DEGREES)
+        slope = await to_thread.run_sync(_slope_for, dem_path, SlopeUnit.DEGREES)
 
-        steep_mask = identify_steep_areas(slope, threshold)
-        steep_count = int(steep_mask.sum())
-        total_valid = int((slope.data != slope.nodata_value).sum())
+        steep_count, total_valid = await to_thread.run_sync(
+            count_steep_pixels, slope, threshold
+        )
 
         return SteepAreasResponse(
             threshold=threshold,
@@ -698,22 +1348,22 @@ async def get_slope_visualization(
 
     Returns a PNG image of the slope analysis.
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
 
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        dem = load_dem_from_geotiff(dem_path)
         slope_unit = (
             SlopeUnit(unit)
             if unit in ["degrees", "percent", "ratio"]
             else SlopeUnit.DEGREES
         )
-        slope = calculate_slope(dem, slope_unit)
 
-        viz_path = OUTPUT_DIR / f"{dem_id}_slope_viz.png"
-        generate_slope_visualization(slope, viz_path)
+        viz_path = OUTPUT_DIR / f"{dem_id}_slope_{slope_unit.value}_viz.png"
+        if not _is_fresh(viz_path, dem_path):
+            slope = await to_thread.run_sync(_slope_for, dem_path, slope_unit)
+            await to_thread.run_sync(_render_slope, slope, viz_path)
 
         return FileResponse(
             path=viz_path,
@@ -731,17 +1381,16 @@ async def get_aspect_visualization(dem_id: str) -> FileResponse:
 
     Returns a PNG image of the aspect analysis.
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
 
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        dem = load_dem_from_geotiff(dem_path)
-        aspect = calculate_aspect(dem)
-
         viz_path = OUTPUT_DIR / f"{dem_id}_aspect_viz.png"
-        generate_aspect_visualization(aspect, viz_path)
+        if not _is_fresh(viz_path, dem_path):
+            aspect = await to_thread.run_sync(_aspect_for, dem_path)
+            await to_thread.run_sync(_render_aspect, aspect, viz_path)
 
         return FileResponse(
             path=viz_path,
@@ -848,42 +1497,79 @@ class AssetTypeInfo(BaseModel):
 
 
 # Optimization router
-optimization_router = APIRouter()
+optimization_router = APIRouter(route_class=_FastJSONRoute)
 
 
-@optimization_router.get("/asset-types", response_model=list[AssetTypeInfo])
-async def get_asset_types() -> list[AssetTypeInfo]:
+def _solution_response(sol: dict) -> LayoutSolutionResponse:
     """
-    Get available asset types for optimization.
+    Wrap an optimizer solution dict in response models.
 
-    Returns list of asset types with their default configurations.
+    Validated construction runs in pydantic-core and measured faster per
+    asset than the pure-Python model_construct.
     """
-    asset_types = []
-    for asset_type, definition in DEFAULT_ASSET_DEFINITIONS.items():
-        asset_types.append(
-            AssetTypeInfo(
-                type=asset_type.value,
-                name=definition.name,
-                dimensions={
-                    "width": definition.dimensions.width,
-                    "length": definition.dimensions.length,
-                    "height": definition.dimensions.height,
-                },
-                default_quantity=definition.quantity,
-                priority=definition.priority,
+    return LayoutSolutionResponse(
+        solution_id=sol["solution_id"],
+        placed_assets=[
+            PlacedAssetResponse(
+                asset_id=a["asset_id"],
+                asset_type=a["asset_type"],
+                name=a["name"],
+                position=a["position"],
+                rotation=a["rotation"],
+                dimensions=a["dimensions"],
+                footprint=a["footprint"],
             )
-        )
-    return asset_types
+            for a in sol["placed_assets"]
+        ],
+        fitness_score=sol["fitness_score"],
+        objective_scores=sol["objective_scores"],
+        constraint_violations=sol["constraint_violations"],
+        is_valid=sol["is_valid"],
+        generation=sol["generation"],
+        computation_time_ms=sol["computation_time_ms"],
+        statistics=sol["statistics"],
+    )
 
 
-@optimization_router.get("/objectives")
-async def get_optimization_objectives() -> list[dict]:
+def _optimization_response(result: dict) -> OptimizationResponse:
     """
-    Get available optimization objectives.
+    Build the optimization response from the optimizer's result dict.
 
-    Returns list of objective types with descriptions.
+    Runs in a worker thread: with hundreds of assets per solution the
+    conversion is pure-Python work that would otherwise stall the event
+    loop.
     """
-    return [
+    return OptimizationResponse(
+        best_solution=_solution_response(result["best_solution"]),
+        alternative_solutions=[
+            _solution_response(s) for s in result["alternative_solutions"]
+        ],
+        convergence_history=result["convergence_history"],
+        total_generations=result["total_generations"],
+        total_time_ms=result["total_time_ms"],
+        config=result["config"],
+    )
+
+
+_ASSET_TYPES = _static_json(
+    [
+        AssetTypeInfo(
+            type=asset_type.value,
+            name=definition.name,
+            dimensions={
+                "width": definition.dimensions.width,
+                "length": definition.dimensions.length,
+                "height": definition.dimensions.height,
+            },
+            default_quantity=definition.quantity,
+            priority=definition.priority,
+        )
+        for asset_type, definition in DEFAULT_ASSET_DEFINITIONS.items()
+    ]
+)
+
+_OPTIMIZATION_OBJECTIVES = _static_json(
+    [
         {
             "value": OptimizationObjective.MIN_EARTHWORK.value,
             "label": "Minimize Earthwork",
@@ -910,6 +1596,27 @@ async def get_optimization_objectives() -> list[dict]:
             "description": "Minimize access road length",
         },
     ]
+)
+
+
+@optimization_router.get("/asset-types", response_model=list[AssetTypeInfo])
+async def get_asset_types(if_none_match: IfNoneMatch = None) -> Response:
+    """
+    Get available asset types for optimization.
+
+    Returns list of asset types with their default configurations.
+    """
+    return _static_response(_ASSET_TYPES, if_none_match)
+
+
+@optimization_router.get("/objectives")
+async def get_optimization_objectives(if_none_match: IfNoneMatch = None) -> Response:
+    """
+    Get available optimization objectives.
+
+    Returns list of objective types with descriptions.
+    """
+    return _static_response(_OPTIMIZATION_OBJECTIVES, if_none_match)
 
 
 @optimization_router.post("/optimize", response_model=OptimizationResponse)
@@ -921,15 +1628,14 @@ async def run_optimization(request: OptimizationRequest) -> OptimizationResponse
     that satisfy constraints and optimize the specified objective.
     """
 
+    dem_path = _dem_path(request.dem_id) if request.dem_id else None
+
     try:
         # Load slope data if DEM ID provided
         slope_data = None
-        if request.dem_id:
-            dem_path = OUTPUT_DIR / f"{request.dem_id}_dem.tif"
-            if dem_path.exists():
-                dem = load_dem_from_geotiff(dem_path)
-                slope = calculate_slope(dem, SlopeUnit.DEGREES)
-                slope_data = slope.data
+        if dem_path is not None and dem_path.exists():
+            slope = await to_thread.run_sync(_slope_for, dem_path, SlopeUnit.DEGREES)
+            slope_data = slope.data
 
         # Convert assets to place
         assets_to_place = None
@@ -948,7 +1654,8 @@ async def run_optimization(request: OptimizationRequest) -> OptimizationResponse
         }
 
         # Run optimization
-        result = optimize_layout(
+        result = await _run_in_process(
+            optimize_layout,
             site_boundary=request.site_boundary,
             exclusion_zones=request.exclusion_zones,
             assets_to_place=assets_to_place,
@@ -956,42 +1663,10 @@ async def run_optimization(request: OptimizationRequest) -> OptimizationResponse
             config=config,
         )
 
-        # Convert to response model
-        def convert_solution(sol: dict) -> LayoutSolutionResponse:
-            return LayoutSolutionResponse(
-                solution_id=sol["solution_id"],
-                placed_assets=[
-                    PlacedAssetResponse(
-                        asset_id=a["asset_id"],
-                        asset_type=a["asset_type"],
-                        name=a["name"],
-                        position=a["position"],
-                        rotation=a["rotation"],
-                        dimensions=a["dimensions"],
-                        footprint=a["footprint"],
-                    )
-                    for a in sol["placed_assets"]
-                ],
-                fitness_score=sol["fitness_score"],
-                objective_scores=sol["objective_scores"],
-                constraint_violations=sol["constraint_violations"],
-                is_valid=sol["is_valid"],
-                generation=sol["generation"],
-                computation_time_ms=sol["computation_time_ms"],
-                statistics=sol["statistics"],
-            )
-
-        return OptimizationResponse(
-            best_solution=convert_solution(result["best_solution"]),
-            alternative_solutions=[
-                convert_solution(s) for s in result["alternative_solutions"]
-            ],
-            convergence_history=result["convergence_history"],
-            total_generations=result["total_generations"],
-            total_time_ms=result["total_time_ms"],
-            config=result["config"],
-        )
+        return await to_thread.run_sync(_optimization_response, result)
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1004,6 +1679,7 @@ async def run_optimization(request: OptimizationRequest) -> OptimizationResponse
 
 from ..roads import (
     generate_road_network,
+    haversine_distances,
 )
 
 
@@ -1084,7 +1760,7 @@ class RoadNetworkResponse(BaseModel):
 
 
 # Roads router
-roads_router = APIRouter()
+roads_router = APIRouter(route_class=_FastJSONRoute)
 
 
 @roads_router.post("/generate", response_model=RoadNetworkResponse)
@@ -1097,30 +1773,26 @@ async def generate_roads(request: RoadNetworkRequest) -> RoadNetworkResponse:
     exclusion zones.
     """
 
+    dem_path = _dem_path(request.dem_id) if request.dem_id else None
+
     try:
         # Load slope data if DEM ID provided
         slope_data = None
         slope_bounds = None
         slope_resolution = request.grid_resolution
 
-        if request.dem_id:
-            dem_path = OUTPUT_DIR / f"{request.dem_id}_dem.tif"
-            if dem_path.exists():
-                dem = load_dem_from_geotiff(dem_path)
-                slope = calculate_slope(dem, SlopeUnit.DEGREES)
-                slope_data = slope.data
-                slope_bounds = dem.bounds
-                slope_resolution = dem.resolution
+        if dem_path is not None and dem_path.exists():
+            # Routing only needs terrain under the site, not the whole DEM
+            site_bbox = shape(request.site_boundary).bounds
+            slope_data, slope_bounds, slope_resolution = await to_thread.run_sync(
+                _slope_window, dem_path, site_bbox
+            )
 
         # Convert destinations to tuples
-        destinations = [
-            (d.x, d.y) for d in sorted(request.destinations, key=lambda x: x.priority)
-        ]
+        ordered = sorted(request.destinations, key=attrgetter("priority"))
+        destinations = [(d.x, d.y) for d in ordered]
         destination_names = [
-            d.name or f"Destination {i+1}"
-            for i, d in enumerate(
-                sorted(request.destinations, key=lambda x: x.priority)
-            )
+            d.name or f"Destination {i+1}" for i, d in enumerate(ordered)
         ]
 
         # Build config
@@ -1132,7 +1804,8 @@ async def generate_roads(request: RoadNetworkRequest) -> RoadNetworkResponse:
         }
 
         # Generate road network
-        result = generate_road_network(
+        result = await _run_in_process(
+            generate_road_network,
             boundary=request.site_boundary,
             entry_point=(
                 request.entry_point.get("x", 0),
@@ -1189,6 +1862,8 @@ async def generate_roads(request: RoadNetworkRequest) -> RoadNetworkResponse:
             statistics=result.get("statistics", {}),
         )
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1209,52 +1884,39 @@ async def validate_road_gradient(
     Takes a list of path points and checks if the gradient
     between consecutive points exceeds the maximum allowed.
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
 
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        dem = load_dem_from_geotiff(dem_path)
-
-        violations = []
-        max_found_gradient = 0.0
-
-        for i in range(len(path_points) - 1):
-            p1 = path_points[i]
-            p2 = path_points[i + 1]
-
-            # Get elevations
-            elev1 = dem.get_elevation_at(p1["x"], p1["y"])
-            elev2 = dem.get_elevation_at(p2["x"], p2["y"])
+        dem = await to_thread.run_sync(_load_dem, dem_path)
 
-            if elev1 is None or elev2 is None:
-                continue
+        xs = np.array([p["x"] for p in path_points], dtype=np.float64)
+        ys = np.array([p["y"] for p in path_points], dtype=np.float64)
+        elevations = dem.get_elevations_at(xs, ys)
 
-            # Calculate distance (approximate, in meters)
-            import math
+        # Great-circle length of each segment in meters (x/y are lon/lat)
+        distance = haversine_distances(xs, ys)
 
-            dx = (p2["x"] - p1["x"]) * 111000  # degrees to meters approx
-            dy = (p2["y"] - p1["y"]) * 111000
-            distance = math.sqrt(dx * dx + dy * dy)
+        # Skip segments with an unknown elevation or no length
+        rise = np.abs(np.diff(elevations))
+        measurable = ~np.isnan(rise) & (distance >= 0.001)
 
-            if distance < 0.001:
-                continue
+        gradients = np.zeros_like(distance)
+        gradients[measurable] = rise[measurable] / distance[measurable] * 100
+        max_found_gradient = float(gradients.max(initial=0.0))
 
-            # Calculate gradient percentage
-            gradient = abs(elev2 - elev1) / distance * 100
-            max_found_gradient = max(max_found_gradient, gradient)
-
-            if gradient > max_gradient:
-                violations.append(
-                    {
-                        "segment_index": i,
-                        "start": p1,
-                        "end": p2,
-                        "gradient": gradient,
-                        "exceeds_by": gradient - max_gradient,
-                    }
-                )
+        violations = [
+            {
+                "segment_index": int(i),
+                "start": path_points[i],
+                "end": path_points[i + 1],
+                "gradient": float(gradients[i]),
+                "exceeds_by": float(gradients[i]) - max_gradient,
+            }
+            for i in np.flatnonzero(measurable & (gradients > max_gradient))
+        ]
 
         return {
             "is_valid": len(violations) == 0,
@@ -1269,14 +1931,8 @@ async def validate_road_gradient(
         )
 
 
-@roads_router.get("/config/defaults")
-async def get_road_config_defaults() -> dict:
-    """
-    Get default road configuration values.
-
-    Returns recommended defaults for road network generation.
-    """
-    return {
+_ROAD_CONFIG_DEFAULTS = _static_json(
+    {
         "road_width": {
             "default": 6.0,
             "min": 3.0,
@@ -1320,6 +1976,17 @@ async def get_road_config_defaults() -> dict:
             "description": "Weight for distance in cost calculation",
         },
     }
+)
+
+
+@roads_router.get("/config/defaults")
+async def get_road_config_defaults(if_none_match: IfNoneMatch = None) -> Response:
+    """
+    Get default road configuration values.
+
+    Returns recommended defaults for road network generation.
+    """
+    return _static_response(_ROAD_CONFIG_DEFAULTS, if_none_match)
 
 
 # ============================================================================
@@ -1335,6 +2002,7 @@ from ..earthwork import (
     RoadDesign,
     SoilProperties,
     SoilType,
+    VolumeCalculator,
     calculate_earthwork,
 )
 
@@ -1459,7 +2127,34 @@ class EarthworkSummaryResponse(BaseModel):
 
 
 # Earthwork router
-earthwork_router = APIRouter()
+earthwork_router = APIRouter(route_class=_FastJSONRoute)
+
+
+def _earthwork_bbox(
+    pads: list[PadDesign], roads: list[RoadDesign]
+) -> tuple[float, float, float, float] | None:
+    """
+    Return the area covered by pad footprints and road corridors.
+
+    Pads are bounded by the circle through their corners plus the grading
+    buffer, so rotation does not matter. Returns None with no elements.
+    """
+    xs: list[float] = []
+    ys: list[float] = []
+    for pad in pads:
+        radius = math.hypot(*pad.dimensions) / 2 + pad.buffer_distance
+        x, y = pad.position
+        xs += (x - radius, x + radius)
+        ys += (y - radius, y + radius)
+    for road in roads:
+        half_width = road.width / 2 + road.shoulder_width
+        for x, y in (road.start_point, road.end_point):
+            xs += (x - half_width, x + half_width)
+            ys += (y - half_width, y + half_width)
+
+    if not xs:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
 
 
 @earthwork_router.post("/calculate", response_model=EarthworkSummaryResponse)
@@ -1473,13 +2168,11 @@ async def calculate_earthwork_volumes(
     and cost estimates.
     """
     # Load DEM data
-    dem_path = OUTPUT_DIR / f"{request.dem_id}_dem.tif"
+    dem_path = _dem_path(request.dem_id)
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        dem = load_dem_from_geotiff(dem_path)
-
         # Convert pad designs
         pads = [
             PadDesign(
@@ -1537,8 +2230,17 @@ async def calculate_earthwork_volumes(
         else:
             cost_factors = DEFAULT_COST_FACTORS
 
+        # Only the DEM pixels under the pads and roads are read and shipped
+        # to the worker
+        bbox = _earthwork_bbox(pads, roads)
+        if bbox is None:
+            dem = await to_thread.run_sync(_load_dem, dem_path)
+        else:
+            dem = await to_thread.run_sync(_load_dem_window, dem_path, bbox)
+
         # Calculate earthwork
-        result = calculate_earthwork(
+        result = await _run_in_process(
+            calculate_earthwork,
             project_id=request.project_id,
             dem_data=dem.data,
             dem_bounds=dem.bounds,
@@ -1552,6 +2254,8 @@ async def calculate_earthwork_volumes(
 
         return EarthworkSummaryResponse(**result.to_dict())
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1571,14 +2275,29 @@ async def calculate_single_pad_volume(
 
     Useful for quick estimates during interactive placement.
     """
-    dem_path = OUTPUT_DIR / f"{dem_id}_dem.tif"
+    dem_path = _dem_path(dem_id)
     if not dem_path.exists():
         raise HTTPException(status_code=404, detail="DEM not found")
 
     try:
-        from ..earthwork import VolumeCalculator
+        pad_design = PadDesign(
+            asset_id=pad.asset_id,
+            asset_type=pad.asset_type,
+            position=(pad.position_x, pad.position_y),
+            dimensions=(pad.width, pad.length),
+            rotation=pad.rotation,
+            target_elevation=pad.target_elevation,
+            grading_method=(
+                GradingMethod(pad.grading_method)
+                if pad.grading_method
+                else GradingMethod.LEVEL
+            ),
+            buffer_distance=pad.buffer_distance,
+        )
 
-        dem = load_dem_from_geotiff(dem_path)
+        dem = await to_thread.run_sync(
+            _load_dem_window, dem_path, _earthwork_bbox([pad_design], [])
+        )
 
         # Build soil properties
         if soil_properties:
@@ -1600,21 +2319,6 @@ async def calculate_single_pad_volume(
             nodata_value=dem.nodata_value if dem.nodata_value else -9999.0,
         )
 
-        pad_design = PadDesign(
-            asset_id=pad.asset_id,
-            asset_type=pad.asset_type,
-            position=(pad.position_x, pad.position_y),
-            dimensions=(pad.width, pad.length),
-            rotation=pad.rotation,
-            target_elevation=pad.target_elevation,
-            grading_method=(
-                GradingMethod(pad.grading_method)
-                if pad.grading_method
-                else GradingMethod.LEVEL
-            ),
-            buffer_distance=pad.buffer_distance,
-        )
-
         result = calculator.calculate_pad_volume(pad_design)
         return result.to_dict()
 
@@ -1622,10 +2326,8 @@ async def calculate_single_pad_volume(
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
 
-@earthwork_router.get("/soil-types")
-async def get_soil_types() -> list[dict]:
-    """Get available soil types with default properties."""
-    return [
+_SOIL_TYPES = _static_json(
+    [
         {
             "value": st.value,
             "label": st.value.replace("_", " ").title(),
@@ -1638,12 +2340,17 @@ async def get_soil_types() -> list[dict]:
         }
         for st in SoilType
     ]
+)
 
 
-@earthwork_router.get("/cost-defaults")
-async def get_cost_defaults() -> dict:
-    """Get default cost factors."""
-    return {
+@earthwork_router.get("/soil-types")
+async def get_soil_types(if_none_match: IfNoneMatch = None) -> Response:
+    """Get available soil types with default properties."""
+    return _static_response(_SOIL_TYPES, if_none_match)
+
+
+_COST_DEFAULTS = _static_json(
+    {
         "cut_cost_per_m3": {
             "default": DEFAULT_COST_FACTORS.cut_cost_per_m3,
             "unit": "$/m³",
@@ -1675,6 +2382,13 @@ async def get_cost_defaults() -> dict:
             "description": "Cost multiplier for rock excavation",
         },
     }
+)
+
+
+@earthwork_router.get("/cost-defaults")
+async def get_cost_defaults(if_none_match: IfNoneMatch = None) -> Response:
+    """Get default cost factors."""
+    return _static_response(_COST_DEFAULTS, if_none_match)
 
 
 # ============================================================================
@@ -1816,151 +2530,192 @@ class ReportResultResponse(BaseModel):
     error: str | None = None
 
 
-# Reports router
-reports_router = APIRouter()
-
+def _report_key(request: ReportRequest) -> str:
+    """
+    Content hash identifying a report request.
 
-@reports_router.post("/generate", response_model=ReportResultResponse)
-async def generate_pdf_report(request: ReportRequest) -> ReportResultResponse:
+    The current date is part of the key because it is printed in the
+    report, so cached PDFs are not served past the day they describe.
     """
-    Generate a PDF report for the site layout.
+    payload = f"{date.today().isoformat()}:{request.model_dump_json()}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
 
-    Returns report metadata. Use /download endpoint to get the PDF file.
+
+def _report_paths(key: str) -> tuple[Path, Path]:
+    """Return the PDF and metadata sidecar paths for a cached report."""
+    pdf_path = OUTPUT_DIR / f"report_{key}.pdf"
+    return pdf_path, pdf_path.with_suffix(".json")
+
+
+def _cached_report(key: str) -> ReportResultResponse | None:
     """
+    Look up a previously generated report.
 
+    A hit refreshes the sidecar mtime so the cache is pruned in LRU order.
+    """
+    pdf_path, meta_path = _report_paths(key)
     try:
-        # Build report config
-        config = ReportConfig(
-            page_size=request.config.page_size if request.config else "letter",
-            include_toc=request.config.include_toc if request.config else True,
-            company_name=(
-                request.config.company_name if request.config else "Site Layouts"
-            ),
-        )
+        meta = json.loads(meta_path.read_bytes())
+        file_size = pdf_path.stat().st_size
+        meta_path.touch()
+    except (FileNotFoundError, ValueError):
+        return None
+
+    return ReportResultResponse(
+        success=True,
+        filename=pdf_path.name,
+        file_size=file_size,
+        page_count=meta["page_count"],
+        generation_time_ms=0.0,
+    )
+
 
-        if request.config and request.config.sections:
-            config.sections = [ReportSection(s) for s in request.config.sections]
-
-        # Build project info
-        project = ProjectInfo(
-            project_id=request.project.project_id,
-            project_name=request.project.project_name,
-            client_name=request.project.client_name,
-            location=request.project.location,
-            total_area_m2=request.project.total_area_m2,
-            prepared_by=request.project.prepared_by,
-            revision=request.project.revision,
+def _prune_report_cache() -> None:
+    """Remove the least recently used reports beyond REPORT_CACHE_SIZE."""
+    entries = []
+    for meta_path in OUTPUT_DIR.glob("report_*.json"):
+        try:
+            entries.append((meta_path.stat().st_mtime_ns, meta_path))
+        except FileNotFoundError:
+            continue
+    entries.sort(reverse=True)
+    for _, meta_path in entries[REPORT_CACHE_SIZE:]:
+        # Drop the sidecar first so a half-evicted entry is never a hit
+        meta_path.unlink(missing_ok=True)
+        meta_path.with_suffix(".pdf").unlink(missing_ok=True)
+
+
+async def _index_report(key: str, page_count: int) -> None:
+    """
+    Record a rendered report in the cache, then prune it.
+
+    The sidecar is written only after the PDF is in place: its presence
+    marks a complete entry.
+    """
+    meta_path = _report_paths(key)[1]
+    async with aiofiles.open(meta_path, "w") as fh:
+        await fh.write(json.dumps({"page_count": page_count}))
+    await to_thread.run_sync(_prune_report_cache)
+
+
+# Request rows are copied into report dataclasses in bulk; RoadInfoRequest
+# mirrors RoadInfo field for field, so its values are read in field order.
+_road_info_values = attrgetter(*(f.name for f in fields(RoadInfo)))
+_asset_dimensions = attrgetter("width", "length", "height")
+_asset_position = attrgetter("position_x", "position_y")
+
+
+def _build_report_data(request: ReportRequest) -> ReportData:
+    """Convert a validated report request into generator input."""
+    # Build report config
+    config = ReportConfig(
+        page_size=request.config.page_size if request.config else "letter",
+        include_toc=request.config.include_toc if request.config else True,
+        company_name=(
+            request.config.company_name if request.config else "Site Layouts"
+        ),
+    )
+
+    if request.config and request.config.sections:
+        config.sections = [ReportSection(s) for s in request.config.sections]
+
+    # Project, terrain, earthwork and cost requests mirror their report
+    # dataclasses field for field, so they are unpacked directly
+    project = ProjectInfo(**request.project.model_dump())
+
+    terrain = None
+    if request.terrain:
+        terrain = TerrainSummary(**request.terrain.model_dump())
+
+    # Build assets list
+    assets = [
+        AssetInfo(
+            asset_id=a.asset_id,
+            asset_type=a.asset_type,
+            name=a.name,
+            dimensions=_asset_dimensions(a),
+            area_m2=a.area_m2,
+            position=_asset_position(a),
+            rotation=a.rotation,
+            cut_volume=a.cut_volume,
+            fill_volume=a.fill_volume,
+            net_earthwork=a.net_earthwork,
+            is_valid=a.is_valid,
         )
+        for a in request.assets
+    ]
 
-        # Build terrain summary
-        terrain = None
-        if request.terrain:
-            terrain = TerrainSummary(
-                min_elevation=request.terrain.min_elevation,
-                max_elevation=request.terrain.max_elevation,
-                mean_elevation=request.terrain.mean_elevation,
-                elevation_range=request.terrain.elevation_range,
-                min_slope=request.terrain.min_slope,
-                max_slope=request.terrain.max_slope,
-                mean_slope=request.terrain.mean_slope,
-                dominant_aspect=request.terrain.dominant_aspect,
-                buildable_area_percent=request.terrain.buildable_area_percent,
-                slope_class_distribution=request.terrain.slope_class_distribution,
-            )
+    # Build roads list
+    roads = [RoadInfo(*_road_info_values(r)) for r in request.roads]
+
+    earthwork = None
+    if request.earthwork:
+        earthwork = ReportEarthworkSummary(**request.earthwork.model_dump())
+
+    costs = None
+    if request.costs:
+        costs = CostBreakdown(**request.costs.model_dump())
+        costs.calculate_totals()
+
+    return ReportData(
+        project=project,
+        config=config,
+        terrain=terrain,
+        assets=assets,
+        roads=roads,
+        earthwork=earthwork,
+        costs=costs,
+    )
 
-        # Build assets list
-        assets = [
-            AssetInfo(
-                asset_id=a.asset_id,
-                asset_type=a.asset_type,
-                name=a.name,
-                dimensions=(a.width, a.length, a.height),
-                area_m2=a.area_m2,
-                position=(a.position_x, a.position_y),
-                rotation=a.rotation,
-                cut_volume=a.cut_volume,
-                fill_volume=a.fill_volume,
-                net_earthwork=a.net_earthwork,
-                is_valid=a.is_valid,
-            )
-            for a in request.assets
-        ]
 
-        # Build roads list
-        roads = [
-            RoadInfo(
-                segment_id=r.segment_id,
-                length_m=r.length_m,
-                width_m=r.width_m,
-                start_elevation=r.start_elevation,
-                end_elevation=r.end_elevation,
-                gradient_percent=r.gradient_percent,
-                cut_volume=r.cut_volume,
-                fill_volume=r.fill_volume,
-            )
-            for r in request.roads
-        ]
+# Reports router
+reports_router = APIRouter(route_class=_FastJSONRoute)
 
-        # Build earthwork summary
-        earthwork = None
-        if request.earthwork:
-            earthwork = ReportEarthworkSummary(
-                total_cut_volume=request.earthwork.total_cut_volume,
-                total_fill_volume=request.earthwork.total_fill_volume,
-                net_volume=request.earthwork.net_volume,
-                adjusted_cut=request.earthwork.adjusted_cut,
-                adjusted_fill=request.earthwork.adjusted_fill,
-                import_required=request.earthwork.import_required,
-                export_required=request.earthwork.export_required,
-                balance_on_site=request.earthwork.balance_on_site,
-                shrink_factor=request.earthwork.shrink_factor,
-                swell_factor=request.earthwork.swell_factor,
-            )
 
-        # Build cost breakdown
-        costs = None
-        if request.costs:
-            costs = CostBreakdown(
-                cut_cost=request.costs.cut_cost,
-                fill_cost=request.costs.fill_cost,
-                haul_cost=request.costs.haul_cost,
-                import_cost=request.costs.import_cost,
-                export_cost=request.costs.export_cost,
-                total_earthwork_cost=request.costs.total_earthwork_cost,
-                road_cost=request.costs.road_cost,
-                contingency_percent=request.costs.contingency_percent,
-            )
-            costs.calculate_totals()
+@reports_router.post("/generate", response_model=ReportResultResponse)
+async def generate_pdf_report(
+    request: ReportRequest, background_tasks: BackgroundTasks
+) -> ReportResultResponse:
+    """
+    Generate a PDF report for the site layout.
 
-        # Create report data
-        report_data = ReportData(
-            project=project,
-            config=config,
-            terrain=terrain,
-            assets=assets,
-            roads=roads,
-            earthwork=earthwork,
-            costs=costs,
-        )
+    Returns report metadata. Use /download endpoint to get the PDF file.
+    Reports are cached by request content, so repeating a request returns
+    the existing PDF without regenerating it.
+    """
+    # Hashing and copying large asset lists is kept off the event loop
+    key = await to_thread.run_sync(_report_key, request)
+    cached = await to_thread.run_sync(_cached_report, key)
+    if cached is not None:
+        return cached
+
+    try:
+        report_data = await to_thread.run_sync(_build_report_data, request)
 
-        # Generate report
-        result = generate_report(report_data)
+        # Render off the event loop; ReportLab layout is CPU-bound. The
+        # worker writes the PDF straight to its download path.
+        pdf_path = _report_paths(key)[0]
+        result = await _run_in_process(
+            generate_report, data=report_data, output_path=pdf_path
+        )
 
-        # Store PDF temporarily for download
-        if result.success and result.pdf_data:
-            # Save to output directory
-            output_path = OUTPUT_DIR / result.filename
-            output_path.write_bytes(result.pdf_data)
+        # Index the report for reuse once the response is on its way
+        filename = result.filename
+        if result.success:
+            filename = pdf_path.name
+            background_tasks.add_task(_index_report, key, result.page_count)
 
         return ReportResultResponse(
             success=result.success,
-            filename=result.filename,
+            filename=filename,
             file_size=result.file_size,
             page_count=result.page_count,
             generation_time_ms=result.generation_time_ms,
             error=result.error,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Report generation failed: {str(e)}"
@@ -1970,24 +2725,16 @@ async def generate_pdf_report(request: ReportRequest) -> ReportResultResponse:
 @reports_router.get("/download/{filename}")
 async def download_report(filename: str):
     """Download a generated PDF report."""
-    from fastapi.responses import FileResponse
-
-    file_path = OUTPUT_DIR / filename
-
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Report not found")
-
-    return FileResponse(
-        path=file_path,
+    return _download_response(
+        OUTPUT_DIR / filename,
         media_type="application/pdf",
         filename=filename,
+        not_found="Report not found",
     )
 
 
-@reports_router.get("/sections")
-async def get_available_sections() -> list[dict]:
-    """Get available report sections."""
-    return [
+_REPORT_SECTIONS = _static_json(
+    [
         {"value": "cover", "label": "Cover Page", "default": True},
         {"value": "executive_summary", "label": "Executive Summary", "default": True},
         {"value": "site_overview", "label": "Site Overview", "default": True},
@@ -1999,6 +2746,13 @@ async def get_available_sections() -> list[dict]:
         {"value": "road_network", "label": "Road Network", "default": False},
         {"value": "appendix", "label": "Appendix", "default": False},
     ]
+)
+
+
+@reports_router.get("/sections")
+async def get_available_sections(if_none_match: IfNoneMatch = None) -> Response:
+    """Get available report sections."""
+    return _static_response(_REPORT_SECTIONS, if_none_match)
 
 
 # ============================================================================
@@ -2006,10 +2760,13 @@ async def get_available_sections() -> list[dict]:
 # ============================================================================
 
 from ..carbon import (
+    DEFAULT_EQUIPMENT_PROFILES,
+    ENERGY_SOURCE_BY_VALUE,
+    EPA_FACTORS,
+    GRID_FACTORS,
     CarbonCalculator,
     EarthworkCarbonInput,
     EnergySource,
-    EPAEmissionFactors,
     EquipmentType,
     HaulingParameters,
     ProjectEnergyProfile,
@@ -2105,8 +2862,12 @@ class CarbonResultResponse(BaseModel):
     equivalents: dict
 
 
+# Enum lookup by value; unknown values fall back instead of raising
+_EQUIPMENT_TYPE_BY_VALUE = {e.value: e for e in EquipmentType}
+
+
 # Carbon router
-carbon_router = APIRouter()
+carbon_router = APIRouter(route_class=_FastJSONRoute)
 
 
 @carbon_router.post("/calculate", response_model=CarbonResultResponse)
@@ -2132,11 +2893,9 @@ async def calculate_carbon_footprint(
         # Convert equipment to dict
         equipment_days = {}
         for eq in request.equipment:
-            try:
-                eq_type = EquipmentType(eq.equipment_type)
+            eq_type = _EQUIPMENT_TYPE_BY_VALUE.get(eq.equipment_type)
+            if eq_type is not None:  # Skip invalid equipment types
                 equipment_days[eq_type] = eq.operating_days
-            except ValueError:
-                pass  # Skip invalid equipment types
 
         # Build hauling parameters
         hauling = None
@@ -2169,11 +2928,9 @@ async def calculate_carbon_footprint(
         # Build energy profile
         energy_profile = None
         if request.energy_profile and request.energy_profile.capacity_mw > 0:
-            energy_source = EnergySource.SOLAR
-            try:
-                energy_source = EnergySource(request.energy_profile.energy_source)
-            except ValueError:
-                pass
+            energy_source = ENERGY_SOURCE_BY_VALUE.get(
+                request.energy_profile.energy_source, EnergySource.SOLAR
+            )
 
             energy_profile = ProjectEnergyProfile(
                 capacity_mw=request.energy_profile.capacity_mw,
@@ -2183,11 +2940,9 @@ async def calculate_carbon_footprint(
             )
 
         # Get grid baseline
-        grid_baseline = EnergySource.US_AVERAGE_GRID
-        try:
-            grid_baseline = EnergySource(request.grid_baseline)
-        except ValueError:
-            pass
+        grid_baseline = ENERGY_SOURCE_BY_VALUE.get(
+            request.grid_baseline, EnergySource.US_AVERAGE_GRID
+        )
 
         # Calculate
         result = calculator.calculate_full_analysis(
@@ -2206,6 +2961,27 @@ async def calculate_carbon_footprint(
         )
 
 
+@lru_cache(maxsize=QUICK_ESTIMATE_CACHE_SIZE)
+def _quick_estimate_json(
+    project_id: str,
+    cut_volume_m3: float,
+    fill_volume_m3: float,
+    haul_distance_km: float,
+    road_length_m: float,
+    capacity_mw: float,
+) -> bytes:
+    """Serialized quick estimate, memoized so scenario sweeps reuse results."""
+    result = calculate_project_carbon(
+        project_id=project_id,
+        cut_volume_m3=cut_volume_m3,
+        fill_volume_m3=fill_volume_m3,
+        haul_distance_km=haul_distance_km,
+        road_length_m=road_length_m,
+        capacity_mw=capacity_mw,
+    )
+    return pydantic_core.to_json(result.to_dict())
+
+
 @carbon_router.post("/quick-estimate")
 async def quick_carbon_estimate(
     project_id: str,
@@ -2214,7 +2990,7 @@ async def quick_carbon_estimate(
     haul_distance_km: float = 10.0,
     road_length_m: float = 0.0,
     capacity_mw: float = 0.0,
-) -> dict:
+) -> Response:
     """
     Quick carbon estimate with minimal inputs.
 
@@ -2222,27 +2998,22 @@ async def quick_carbon_estimate(
     optional energy generation capacity.
     """
     try:
-        result = calculate_project_carbon(
-            project_id=project_id,
-            cut_volume_m3=cut_volume_m3,
-            fill_volume_m3=fill_volume_m3,
-            haul_distance_km=haul_distance_km,
-            road_length_m=road_length_m,
-            capacity_mw=capacity_mw,
+        body = _quick_estimate_json(
+            project_id,
+            cut_volume_m3,
+            fill_volume_m3,
+            haul_distance_km,
+            road_length_m,
+            capacity_mw,
         )
-        return result.to_dict()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
+    return Response(content=body, media_type="application/json")
 
 
-@carbon_router.get("/emission-factors")
-async def get_emission_factors() -> dict:
-    """
-    Get EPA emission factors used in calculations.
-
-    Returns emission factors for fuels, materials, and electricity.
-    """
-    factors = EPAEmissionFactors()
+def _emission_factors_content() -> dict:
+    """Build the /emission-factors payload from the EPA defaults."""
+    factors = EPA_FACTORS
     return {
         "fuels": {
             "diesel": {
@@ -2303,66 +3074,79 @@ async def get_emission_factors() -> dict:
     }
 
 
+_EMISSION_FACTORS = _static_json(_emission_factors_content())
+
+
+# Descriptions for energy sources listed by /grid-factors
+_SOURCE_DESCRIPTIONS = {
+    EnergySource.SOLAR: "Photovoltaic solar generation",
+    EnergySource.WIND: "Wind turbine generation",
+    EnergySource.NATURAL_GAS_GRID: "Natural gas combined cycle",
+    EnergySource.COAL: "Coal-fired power plant",
+    EnergySource.NUCLEAR: "Nuclear power plant",
+    EnergySource.HYDRO: "Hydroelectric generation",
+    EnergySource.US_AVERAGE_GRID: "US average grid mix (2023)",
+}
+
+
+_EQUIPMENT_PROFILES = _static_json(
+    [
+        {
+            "equipment_type": eq_type.value,
+            "name": eq_type.value.replace("_", " ").title(),
+            "fuel_type": profile.fuel_type.value,
+            "fuel_consumption_per_hour": profile.fuel_consumption_per_hour,
+            "operating_hours_per_day": profile.operating_hours_per_day,
+            "utilization_factor": profile.utilization_factor,
+            "daily_fuel_gallons": profile.daily_fuel_consumption(),
+        }
+        for eq_type, profile in DEFAULT_EQUIPMENT_PROFILES.items()
+    ]
+)
+
+_GRID_FACTORS = _static_json(
+    [
+        {
+            "source": source.value,
+            "name": source.value.replace("_", " ").title(),
+            "kg_co2_per_mwh": factor,
+            "description": _SOURCE_DESCRIPTIONS.get(source, ""),
+        }
+        for source, factor in GRID_FACTORS.source_factors.items()
+    ]
+)
+
+
+@carbon_router.get("/emission-factors")
+async def get_emission_factors(if_none_match: IfNoneMatch = None) -> Response:
+    """
+    Get EPA emission factors used in calculations.
+
+    Returns emission factors for fuels, materials, and electricity.
+    """
+    return _static_response(_EMISSION_FACTORS, if_none_match)
+
+
 @carbon_router.get("/equipment-profiles")
-async def get_equipment_profiles() -> list[dict]:
+async def get_equipment_profiles(if_none_match: IfNoneMatch = None) -> Response:
     """
     Get default equipment emission profiles.
 
     Returns fuel consumption rates and emission profiles for
     standard construction equipment.
     """
-    from ..carbon import DEFAULT_EQUIPMENT_PROFILES
-
-    profiles = []
-    for eq_type, profile in DEFAULT_EQUIPMENT_PROFILES.items():
-        profiles.append(
-            {
-                "equipment_type": eq_type.value,
-                "name": eq_type.value.replace("_", " ").title(),
-                "fuel_type": profile.fuel_type.value,
-                "fuel_consumption_per_hour": profile.fuel_consumption_per_hour,
-                "operating_hours_per_day": profile.operating_hours_per_day,
-                "utilization_factor": profile.utilization_factor,
-                "daily_fuel_gallons": profile.daily_fuel_consumption(),
-            }
-        )
-    return profiles
+    return _static_response(_EQUIPMENT_PROFILES, if_none_match)
 
 
 @carbon_router.get("/grid-factors")
-async def get_grid_emission_factors() -> list[dict]:
+async def get_grid_emission_factors(if_none_match: IfNoneMatch = None) -> Response:
     """
     Get grid emission factors for different energy sources.
 
     Returns kg CO2 per MWh for various energy sources,
     used for calculating carbon offset from clean energy.
     """
-    from ..carbon import GridEmissionFactors
-
-    factors = GridEmissionFactors()
-    return [
-        {
-            "source": source.value,
-            "name": source.value.replace("_", " ").title(),
-            "kg_co2_per_mwh": factor,
-            "description": _get_source_description(source),
-        }
-        for source, factor in factors.source_factors.items()
-    ]
-
-
-def _get_source_description(source: EnergySource) -> str:
-    """Get description for energy source."""
-    descriptions = {
-        EnergySource.SOLAR: "Photovoltaic solar generation",
-        EnergySource.WIND: "Wind turbine generation",
-        EnergySource.NATURAL_GAS_GRID: "Natural gas combined cycle",
-        EnergySource.COAL: "Coal-fired power plant",
-        EnergySource.NUCLEAR: "Nuclear power plant",
-        EnergySource.HYDRO: "Hydroelectric generation",
-        EnergySource.US_AVERAGE_GRID: "US average grid mix (2023)",
-    }
-    return descriptions.get(source, "")
+    return _static_response(_GRID_FACTORS, if_none_match)
 
 
 # ============================================================================
@@ -2399,8 +3183,45 @@ class HabitatAnalysisResponse(BaseModel):
     data_quality: dict
 
 
+class HabitatBatchItemResponse(BaseModel):
+    """Result of one site in a batch analysis; ``error`` is set if it failed."""
+
+    site_id: str
+    result: HabitatAnalysisResponse | None = None
+    error: str | None = None
+
+
+class HabitatBatchRequest(BaseModel):
+    """Request model for analysing many sites in one call."""
+
+    sites: list[HabitatAnalysisRequest] = Field(
+        min_length=1,
+        max_length=HABITAT_BATCH_LIMIT,
+        description="Sites to analyse, e.g. a development portfolio",
+    )
+
+
 # Habitat router
-habitat_router = APIRouter()
+habitat_router = APIRouter(route_class=_FastJSONRoute)
+
+
+async def _analyze_habitat_site(
+    request: HabitatAnalysisRequest,
+) -> HabitatAnalysisResponse:
+    result = await analyze_habitat(
+        site_id=request.site_id,
+        boundary_geojson=request.boundary,
+        latitude=request.latitude,
+        longitude=request.longitude,
+    )
+    return HabitatAnalysisResponse(**result.to_dict())
+
+
+def _analyze_habitat_site_sync(
+    request: HabitatAnalysisRequest,
+) -> HabitatAnalysisResponse:
+    """Analyse one site on a private event loop, for use in a worker thread."""
+    return asyncio.run(_analyze_habitat_site(request))
 
 
 @habitat_router.post("/analyze", response_model=HabitatAnalysisResponse)
@@ -2419,15 +3240,7 @@ async def analyze_site_habitat(
     and an overall habitat impact score.
     """
     try:
-        result = await analyze_habitat(
-            site_id=request.site_id,
-            boundary_geojson=request.boundary,
-            latitude=request.latitude,
-            longitude=request.longitude,
-        )
-
-        result_dict = result.to_dict()
-        return HabitatAnalysisResponse(**result_dict)
+        return await _analyze_habitat_site(request)
 
     except Exception as e:
         raise HTTPException(
@@ -2435,10 +3248,49 @@ async def analyze_site_habitat(
         )
 
 
-@habitat_router.get("/species-status")
-async def get_species_status_types() -> list[dict]:
-    """Get available species status types."""
-    return [
+@habitat_router.post("/analyze/batch", response_model=list[HabitatBatchItemResponse])
+async def analyze_site_habitat_batch(
+    batch: HabitatBatchRequest,
+    max_concurrency: Annotated[
+        int, Query(ge=1, le=HABITAT_BATCH_CONCURRENCY)
+    ] = HABITAT_BATCH_CONCURRENCY,
+) -> list[HabitatBatchItemResponse]:
+    """
+    Analyze habitat for many sites in one request.
+
+    Returns one item per site, in request order. Sites are analysed in
+    worker threads, at most ``max_concurrency`` at a time, so a large
+    portfolio neither blocks other requests nor floods the upstream
+    USFWS/NWI services. A site that fails reports its error in its own
+    item instead of failing the batch.
+    """
+    limiter = CapacityLimiter(max_concurrency)
+    results = await asyncio.gather(
+        *(
+            to_thread.run_sync(_analyze_habitat_site_sync, site, limiter=limiter)
+            for site in batch.sites
+        ),
+        return_exceptions=True,
+    )
+
+    items = []
+    for site, result in zip(batch.sites, results):
+        if isinstance(result, HabitatAnalysisResponse):
+            items.append(HabitatBatchItemResponse(site_id=site.site_id, result=result))
+        elif isinstance(result, Exception):
+            items.append(
+                HabitatBatchItemResponse(
+                    site_id=site.site_id,
+                    error=f"Habitat analysis failed: {str(result)}",
+                )
+            )
+        else:
+            raise result
+    return items
+
+
+_SPECIES_STATUS_TYPES = _static_json(
+    [
         {
             "value": "endangered",
             "label": "Endangered",
@@ -2465,12 +3317,17 @@ async def get_species_status_types() -> list[dict]:
             "description": "Proposed for threatened listing",
         },
     ]
+)
 
 
-@habitat_router.get("/wetland-types")
-async def get_wetland_types() -> list[dict]:
-    """Get wetland classification types (Cowardin system)."""
-    return [
+@habitat_router.get("/species-status")
+async def get_species_status_types(if_none_match: IfNoneMatch = None) -> Response:
+    """Get available species status types."""
+    return _static_response(_SPECIES_STATUS_TYPES, if_none_match)
+
+
+_WETLAND_TYPES = _static_json(
+    [
         {
             "code": "PEM",
             "label": "Freshwater Emergent Wetland",
@@ -2500,12 +3357,17 @@ async def get_wetland_types() -> list[dict]:
         },
         {"code": "M", "label": "Marine", "description": "Ocean and nearshore areas"},
     ]
+)
 
 
-@habitat_router.get("/permits")
-async def get_permit_types() -> list[dict]:
-    """Get environmental permit types and typical timelines."""
-    return [
+@habitat_router.get("/wetland-types")
+async def get_wetland_types(if_none_match: IfNoneMatch = None) -> Response:
+    """Get wetland classification types (Cowardin system)."""
+    return _static_response(_WETLAND_TYPES, if_none_match)
+
+
+_PERMIT_TYPES = _static_json(
+    [
         {
             "type": "section_7",
             "name": "ESA Section 7 Consultation",
@@ -2551,12 +3413,17 @@ async def get_permit_types() -> list[dict]:
             "triggers": ["Bird nesting habitat", "Construction timing"],
         },
     ]
+)
 
 
-@habitat_router.get("/buffer-standards")
-async def get_buffer_standards() -> dict:
-    """Get standard buffer distances for sensitive habitats."""
-    return {
+@habitat_router.get("/permits")
+async def get_permit_types(if_none_match: IfNoneMatch = None) -> Response:
+    """Get environmental permit types and typical timelines."""
+    return _static_response(_PERMIT_TYPES, if_none_match)
+
+
+_BUFFER_STANDARDS = _static_json(
+    {
         "buffers": {
             "critical_habitat": {
                 "distance_m": BUFFER_DISTANCES["critical_habitat"],
@@ -2595,12 +3462,17 @@ async def get_buffer_standards() -> dict:
             {"level": "none", "description": "No significant habitat concerns"},
         ],
     }
+)
 
 
-@habitat_router.get("/sensitivity-scores")
-async def get_sensitivity_score_interpretation() -> dict:
-    """Get interpretation guide for habitat impact scores."""
-    return {
+@habitat_router.get("/buffer-standards")
+async def get_buffer_standards(if_none_match: IfNoneMatch = None) -> Response:
+    """Get standard buffer distances for sensitive habitats."""
+    return _static_response(_BUFFER_STANDARDS, if_none_match)
+
+
+_SENSITIVITY_SCORES = _static_json(
+    {
         "score_ranges": [
             {
                 "range": "90-100",
@@ -2645,3 +3517,12 @@ async def get_sensitivity_score_interpretation() -> dict:
             "buffer_zone_impact": 0.15,
         },
     }
+)
+
+
+@habitat_router.get("/sensitivity-scores")
+async def get_sensitivity_score_interpretation(
+    if_none_match: IfNoneMatch = None,
+) -> Response:
+    """Get interpretation guide for habitat impact scores."""
+    return _static_response(_SENSITIVITY_SCORES, if_none_match)
@@ -9,7 +9,11 @@ from .calculator import (
     calculate_project_carbon,
 )
 from .models import (
+    DEFAULT_DAILY_FUEL_GAL,
     DEFAULT_EQUIPMENT_PROFILES,
+    ENERGY_SOURCE_BY_VALUE,
+    EPA_FACTORS,
+    GRID_FACTORS,
     CarbonBreakdown,
     CarbonCalculationResult,
     CarbonOffsetResult,
@@ -31,15 +35,19 @@ __all__ = [
     "EquipmentType",
     "FuelType",
     "EnergySource",
+    "ENERGY_SOURCE_BY_VALUE",
     # Data classes
     "EPAEmissionFactors",
+    "EPA_FACTORS",
     "EquipmentEmissionProfile",
     "DEFAULT_EQUIPMENT_PROFILES",
+    "DEFAULT_DAILY_FUEL_GAL",
     "HaulingParameters",
     "EarthworkCarbonInput",
     "RoadConstructionInput",
     "ProjectEnergyProfile",
     "GridEmissionFactors",
+    "GRID_FACTORS",
     # Results
     "CarbonBreakdown",
     "CarbonOffsetResult",
@@ -4,8 +4,16 @@ Carbon Calculator
 Construction carbon footprint and lifetime impact calculations.
 """
 
+from functools import lru_cache
+
+import numpy as np
+
 from .models import (
+    DEFAULT_DAILY_FUEL_GAL,
     DEFAULT_EQUIPMENT_PROFILES,
+    ENERGY_SOURCE_BY_VALUE,
+    EPA_FACTORS,
+    GRID_FACTORS,
     CarbonBreakdown,
     CarbonCalculationResult,
     CarbonOffsetResult,
@@ -22,6 +30,34 @@ from .models import (
     RoadConstructionInput,
 )
 
+_GALLONS_PER_LITER = 1 / 3.785  # 1 gallon = 3.785 liters
+
+
+@lru_cache(maxsize=16)
+def _factor_tables(
+    ef: EPAEmissionFactors,
+) -> tuple[dict[FuelType, float], dict[EquipmentType, float]]:
+    """
+    Lookup tables derived from a set of EPA emission factors.
+
+    Returns:
+        Tuple of (kg CO2 per unit of fuel by fuel type,
+        kg CO2 per operating day for each default equipment profile)
+    """
+    fuel_factors = {
+        FuelType.DIESEL: ef.diesel_kg_per_gallon,
+        FuelType.GASOLINE: ef.gasoline_kg_per_gallon,
+        FuelType.BIODIESEL_B20: ef.biodiesel_b20_kg_per_gallon,
+        FuelType.NATURAL_GAS: ef.natural_gas_kg_per_therm,
+        FuelType.ELECTRIC: 0.0,  # No direct emissions
+    }
+    equipment_per_day = {
+        equipment_type: DEFAULT_DAILY_FUEL_GAL[equipment_type]
+        * fuel_factors.get(profile.fuel_type, ef.diesel_kg_per_gallon)
+        for equipment_type, profile in DEFAULT_EQUIPMENT_PROFILES.items()
+    }
+    return fuel_factors, equipment_per_day
+
 
 class CarbonCalculator:
     """
@@ -37,13 +73,23 @@ class CarbonCalculator:
     - Clean energy generation over project lifetime
     """
 
+    # Reciprocals of productivity estimates (m3 per day) for day estimates
+    _EXCAVATOR_DAYS_PER_M3 = 1 / 800  # 800 m3/day
+    _BULLDOZER_DAYS_PER_M3 = 1 / 600  # 600 m3/day
+    _LOADER_DAYS_PER_M3 = 1 / (500 * 2)  # 500 m3/day, half the total volume
+    _COMPACTOR_DAYS_PER_M3 = 1 / 1000  # 1000 m3/day (for fill)
+
     def __init__(
         self,
         emission_factors: EPAEmissionFactors | None = None,
         grid_factors: GridEmissionFactors | None = None,
     ):
-        self.emission_factors = emission_factors or EPAEmissionFactors()
-        self.grid_factors = grid_factors or GridEmissionFactors()
+        self.emission_factors = emission_factors or EPA_FACTORS
+        self.grid_factors = grid_factors or GRID_FACTORS
+        # Shared between calculators using the same factors; treat as read-only
+        self._fuel_factors, self._equipment_per_day = _factor_tables(
+            self.emission_factors
+        )
 
     def calculate_equipment_emissions(
         self,
@@ -63,15 +109,11 @@ class CarbonCalculator:
         total_emissions = 0.0
 
         # Calculate from standard equipment
+        equipment_per_day = self._equipment_per_day
         for equipment_type, days in equipment_days.items():
-            profile = DEFAULT_EQUIPMENT_PROFILES.get(equipment_type)
-            if profile:
-                daily_fuel = profile.daily_fuel_consumption()
-                total_fuel = daily_fuel * days
-
-                # Get emission factor based on fuel type
-                emission_factor = self._get_fuel_emission_factor(profile.fuel_type)
-                total_emissions += total_fuel * emission_factor
+            daily_emissions = equipment_per_day.get(equipment_type)
+            if daily_emissions is not None:
+                total_emissions += daily_emissions * days
 
         # Calculate from custom equipment
         if custom_equipment:
@@ -83,6 +125,28 @@ class CarbonCalculator:
 
         return total_emissions
 
+    def calculate_equipment_emissions_batch(
+        self,
+        scenarios: list[dict[EquipmentType, int]],
+    ) -> np.ndarray:
+        """
+        Calculate equipment emissions for many scenarios at once.
+
+        Args:
+            scenarios: One equipment-days mapping per scenario, as accepted by
+                calculate_equipment_emissions
+
+        Returns:
+            Array of shape (N,) with emissions in kg CO2
+        """
+        types = list(self._equipment_per_day)
+        per_day = np.fromiter(self._equipment_per_day.values(), dtype=np.float64)
+        days = np.array(
+            [[equipment_days.get(t, 0) for t in types] for equipment_days in scenarios],
+            dtype=np.float64,
+        ).reshape(len(scenarios), len(types))
+        return days @ per_day
+
     def calculate_hauling_emissions(
         self,
         volume_m3: float,
@@ -101,17 +165,14 @@ class CarbonCalculator:
         if volume_m3 <= 0 or hauling.haul_distance_km <= 0:
             return 0.0
 
-        total_distance = hauling.total_distance_km(volume_m3)
-
-        # Convert km to liters of fuel
-        liters_per_km = 1 / hauling.fuel_efficiency_km_per_liter
-        total_liters = total_distance * liters_per_km
-
-        # Convert liters to gallons (1 gallon = 3.785 liters)
-        total_gallons = total_liters / 3.785
-
-        # Calculate emissions (assume diesel trucks)
-        return total_gallons * self.emission_factors.diesel_mobile_kg_per_gallon
+        # km -> liters -> gallons -> kg CO2 folded into one factor
+        # (assume diesel trucks)
+        kg_per_km = (
+            self.emission_factors.diesel_mobile_kg_per_gallon
+            * _GALLONS_PER_LITER
+            / hauling.fuel_efficiency_km_per_liter
+        )
+        return hauling.total_distance_km(volume_m3) * kg_per_km
 
     def calculate_material_emissions(
         self,
@@ -139,6 +200,27 @@ class CarbonCalculator:
             + gravel_tons * self.emission_factors.gravel_kg_per_ton
         )
 
+    def calculate_material_emissions_batch(self, tons: np.ndarray) -> np.ndarray:
+        """
+        Calculate CO2 emissions from material production for many scenarios.
+
+        Args:
+            tons: Array of shape (N, 4) with metric tons of concrete, steel,
+                asphalt and gravel per scenario
+
+        Returns:
+            Array of shape (N,) with emissions in kg CO2
+        """
+        factors = np.array(
+            [
+                self.emission_factors.concrete_kg_per_ton,
+                self.emission_factors.steel_kg_per_ton,
+                self.emission_factors.asphalt_kg_per_ton,
+                self.emission_factors.gravel_kg_per_ton,
+            ]
+        )
+        return np.asarray(tons, dtype=np.float64) @ factors
+
     def calculate_road_construction_emissions(
         self,
         road_input: RoadConstructionInput,
@@ -187,33 +269,73 @@ class CarbonCalculator:
         Returns:
             Carbon breakdown with detailed emissions
         """
-        breakdown = CarbonBreakdown()
+        equipment_kg, hauling_kg = self._earthwork_emissions(earthwork)
+        return CarbonBreakdown(
+            equipment_emissions_kg=equipment_kg,
+            hauling_emissions_kg=hauling_kg,
+        )
 
-        # Equipment emissions
-        if earthwork.equipment_days:
-            breakdown.equipment_emissions_kg = self.calculate_equipment_emissions(
-                earthwork.equipment_days,
-                earthwork.custom_equipment,
-            )
-        else:
-            # Estimate equipment days based on volume
-            estimated_days = self._estimate_equipment_days(
-                earthwork.cut_volume_m3,
-                earthwork.fill_volume_m3,
-            )
-            breakdown.equipment_emissions_kg = self.calculate_equipment_emissions(
-                estimated_days,
-            )
+    def calculate_earthwork_emissions_batch(
+        self,
+        scenarios: list[EarthworkCarbonInput],
+    ) -> np.ndarray:
+        """
+        Calculate earthwork emissions for many scenarios at once.
 
-        # Hauling emissions
-        if earthwork.hauling:
-            haul_volume = earthwork.import_volume_m3 + earthwork.export_volume_m3
-            breakdown.hauling_emissions_kg = self.calculate_hauling_emissions(
-                haul_volume,
-                earthwork.hauling,
-            )
+        Equipment entries from every scenario are flattened into parallel
+        arrays and reduced per scenario in a single pass.
+
+        Args:
+            scenarios: Earthwork inputs, one per design variant
 
-        return breakdown
+        Returns:
+            Array of shape (N,) with equipment plus hauling emissions in kg CO2
+        """
+        rates = self._equipment_per_day
+        scenario_ids: list[int] = []
+        days: list[float] = []
+        daily_emissions: list[float] = []
+        hauling = np.zeros(len(scenarios))
+
+        for i, earthwork in enumerate(scenarios):
+            if earthwork.equipment_days:
+                equipment_days = earthwork.equipment_days
+                custom_equipment = earthwork.custom_equipment
+            else:
+                equipment_days = self._estimate_equipment_days(
+                    earthwork.cut_volume_m3,
+                    earthwork.fill_volume_m3,
+                )
+                custom_equipment = []
+
+            for equipment_type, operating_days in equipment_days.items():
+                rate = rates.get(equipment_type)
+                if rate is not None:
+                    scenario_ids.append(i)
+                    days.append(operating_days)
+                    daily_emissions.append(rate)
+
+            # Custom equipment is counted as one day of operation
+            for profile in custom_equipment:
+                scenario_ids.append(i)
+                days.append(1.0)
+                daily_emissions.append(
+                    profile.daily_fuel_consumption()
+                    * self._get_fuel_emission_factor(profile.fuel_type)
+                )
+
+            if earthwork.hauling:
+                hauling[i] = self.calculate_hauling_emissions(
+                    earthwork.import_volume_m3 + earthwork.export_volume_m3,
+                    earthwork.hauling,
+                )
+
+        equipment = np.bincount(
+            np.array(scenario_ids, dtype=np.intp),
+            weights=np.multiply(days, daily_emissions),
+            minlength=len(scenarios),
+        )
+        return equipment + hauling
 
     def calculate_operational_offset(
         self,
@@ -247,6 +369,30 @@ class CarbonCalculator:
             grid_factor_kg_per_mwh=grid_factor,
         )
 
+    def calculate_lifetime_curve(
+        self,
+        energy_profile: ProjectEnergyProfile,
+        construction_emissions_kg: float,
+        grid_baseline: EnergySource = EnergySource.US_AVERAGE_GRID,
+        years: int | None = None,
+    ) -> np.ndarray:
+        """
+        Calculate cumulative net carbon impact at the end of each year.
+
+        Args:
+            energy_profile: Project energy generation profile
+            construction_emissions_kg: Total construction emissions
+            grid_baseline: Grid source being displaced
+            years: Years to cover, defaults to the project lifetime
+
+        Returns:
+            Array of net impact in kg CO2 per year; the first year at or
+            below zero is the year construction emissions are paid back
+        """
+        grid_factor = self.grid_factors.get_factor(grid_baseline)
+        annual_offset = energy_profile.annual_generation_curve_mwh(years) * grid_factor
+        return construction_emissions_kg - np.cumsum(annual_offset)
+
     def calculate_lifetime_impact(
         self,
         construction_emissions_kg: float,
@@ -310,37 +456,39 @@ class CarbonCalculator:
         Returns:
             Complete carbon calculation result
         """
-        breakdown = CarbonBreakdown()
+        equipment_kg = hauling_kg = road_kg = material_kg = 0.0
 
         # Calculate earthwork emissions
         if earthwork:
-            earthwork_breakdown = self.calculate_earthwork_emissions(earthwork)
-            breakdown.equipment_emissions_kg = (
-                earthwork_breakdown.equipment_emissions_kg
-            )
-            breakdown.hauling_emissions_kg = earthwork_breakdown.hauling_emissions_kg
+            equipment_kg, hauling_kg = self._earthwork_emissions(earthwork)
 
         # Calculate road construction emissions
         if road_input:
-            breakdown.road_construction_kg = self.calculate_road_construction_emissions(
-                road_input
-            )
+            road_kg = self.calculate_road_construction_emissions(road_input)
 
         # Calculate additional material emissions
         if additional_materials:
-            breakdown.material_emissions_kg = self.calculate_material_emissions(
+            material_kg = self.calculate_material_emissions(
                 concrete_tons=additional_materials.get("concrete", 0),
                 steel_tons=additional_materials.get("steel", 0),
                 asphalt_tons=additional_materials.get("asphalt", 0),
                 gravel_tons=additional_materials.get("gravel", 0),
             )
 
+        breakdown = CarbonBreakdown(
+            equipment_emissions_kg=equipment_kg,
+            hauling_emissions_kg=hauling_kg,
+            material_emissions_kg=material_kg,
+            road_construction_kg=road_kg,
+        )
+
         # Create result
         result = CarbonCalculationResult(
             project_id=project_id,
             construction=breakdown,
         )
-        result.total_construction_metric_tons = breakdown.total_construction_metric_tons
+        total_construction_kg = breakdown.total_construction_kg
+        result.total_construction_metric_tons = total_construction_kg / 1000.0
 
         # Calculate offset if energy profile provided
         if energy_profile:
@@ -352,7 +500,7 @@ class CarbonCalculator:
 
             # Calculate lifetime impact
             result.lifetime = self.calculate_lifetime_impact(
-                breakdown.total_construction_kg,
+                total_construction_kg,
                 result.offset,
                 energy_profile.project_lifetime_years,
             )
@@ -364,16 +512,41 @@ class CarbonCalculator:
 
         return result
 
+    def _earthwork_emissions(
+        self,
+        earthwork: EarthworkCarbonInput,
+    ) -> tuple[float, float]:
+        """Equipment and hauling emissions in kg CO2 for earthwork."""
+        # Equipment emissions
+        if earthwork.equipment_days:
+            equipment_kg = self.calculate_equipment_emissions(
+                earthwork.equipment_days,
+                earthwork.custom_equipment,
+            )
+        else:
+            # Estimate equipment days based on volume
+            estimated_days = self._estimate_equipment_days(
+                earthwork.cut_volume_m3,
+                earthwork.fill_volume_m3,
+            )
+            equipment_kg = self.calculate_equipment_emissions(estimated_days)
+
+        # Hauling emissions
+        hauling_kg = 0.0
+        if earthwork.hauling:
+            haul_volume = earthwork.import_volume_m3 + earthwork.export_volume_m3
+            hauling_kg = self.calculate_hauling_emissions(
+                haul_volume,
+                earthwork.hauling,
+            )
+
+        return equipment_kg, hauling_kg
+
     def _get_fuel_emission_factor(self, fuel_type: FuelType) -> float:
         """Get emission factor for fuel type in kg CO2 per gallon."""
-        factors = {
-            FuelType.DIESEL: self.emission_factors.diesel_kg_per_gallon,
-            FuelType.GASOLINE: self.emission_factors.gasoline_kg_per_gallon,
-            FuelType.BIODIESEL_B20: self.emission_factors.biodiesel_b20_kg_per_gallon,
-            FuelType.NATURAL_GAS: self.emission_factors.natural_gas_kg_per_therm,
-            FuelType.ELECTRIC: 0.0,  # No direct emissions
-        }
-        return factors.get(fuel_type, self.emission_factors.diesel_kg_per_gallon)
+        return self._fuel_factors.get(
+            fuel_type, self.emission_factors.diesel_kg_per_gallon
+        )
 
     def _estimate_equipment_days(
         self,
@@ -387,17 +560,11 @@ class CarbonCalculator:
         """
         total_volume = cut_volume_m3 + fill_volume_m3
 
-        # Productivity estimates (m3 per day)
-        excavator_productivity = 800  # m3/day
-        bulldozer_productivity = 600  # m3/day
-        loader_productivity = 500  # m3/day
-        compactor_productivity = 1000  # m3/day (for fill)
-
         # Calculate days
-        excavator_days = max(1, int(cut_volume_m3 / excavator_productivity))
-        bulldozer_days = max(1, int(total_volume / bulldozer_productivity))
-        loader_days = max(1, int(total_volume / loader_productivity / 2))
-        compactor_days = max(1, int(fill_volume_m3 / compactor_productivity))
+        excavator_days = max(1, int(cut_volume_m3 * self._EXCAVATOR_DAYS_PER_M3))
+        bulldozer_days = max(1, int(total_volume * self._BULLDOZER_DAYS_PER_M3))
+        loader_days = max(1, int(total_volume * self._LOADER_DAYS_PER_M3))
+        compactor_days = max(1, int(fill_volume_m3 * self._COMPACTOR_DAYS_PER_M3))
 
         return {
             EquipmentType.EXCAVATOR: excavator_days,
@@ -474,11 +641,9 @@ def calculate_project_carbon(
         )
 
     # Map grid baseline string to enum
-    grid_source = EnergySource.US_AVERAGE_GRID
-    try:
-        grid_source = EnergySource(grid_baseline)
-    except ValueError:
-        pass
+    grid_source = ENERGY_SOURCE_BY_VALUE.get(
+        grid_baseline, EnergySource.US_AVERAGE_GRID
+    )
 
     return calculator.calculate_full_analysis(
         project_id=project_id,
@@ -5,12 +5,27 @@ Data models for construction carbon footprint and lifetime impact calculations.
 Based on EPA emission factors and industry standards.
 """
 
+import math
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+import numpy as np
 
-class EquipmentType(Enum):
+
+class _IdentityHashEnum(Enum):
+    """
+    Enum hashed by identity.
+
+    Members are singletons compared by identity, but Enum.__hash__ hashes
+    the member name in Python on every dict lookup. The carbon tables are
+    keyed by these enums, so use the C-level identity hash instead.
+    """
+
+    __hash__ = object.__hash__
+
+
+class EquipmentType(_IdentityHashEnum):
     """Construction equipment types for emission calculations."""
 
     EXCAVATOR = "excavator"
@@ -25,7 +40,7 @@ class EquipmentType(Enum):
     PILE_DRIVER = "pile_driver"
 
 
-class FuelType(Enum):
+class FuelType(_IdentityHashEnum):
     """Fuel types for emission calculations."""
 
     DIESEL = "diesel"
@@ -35,7 +50,7 @@ class FuelType(Enum):
     ELECTRIC = "electric"
 
 
-class EnergySource(Enum):
+class EnergySource(_IdentityHashEnum):
     """Energy sources for grid comparison."""
 
     SOLAR = "solar"
@@ -47,7 +62,11 @@ class EnergySource(Enum):
     US_AVERAGE_GRID = "us_average_grid"
 
 
-@dataclass
+# Lookup by value; unknown grid baselines fall back instead of raising
+ENERGY_SOURCE_BY_VALUE: dict[str, EnergySource] = {e.value: e for e in EnergySource}
+
+
+@dataclass(frozen=True, slots=True)
 class EPAEmissionFactors:
     """
     EPA emission factors for various fuels (kg CO2 per unit).
@@ -77,7 +96,7 @@ class EPAEmissionFactors:
     gravel_kg_per_ton: float = 5.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentEmissionProfile:
     """Emission profile for construction equipment."""
 
@@ -121,8 +140,14 @@ DEFAULT_EQUIPMENT_PROFILES: dict[EquipmentType, EquipmentEmissionProfile] = {
     ),
 }
 
+# Daily fuel consumption (gallons) of the default profiles, folded at import
+DEFAULT_DAILY_FUEL_GAL: dict[EquipmentType, float] = {
+    equipment_type: profile.daily_fuel_consumption()
+    for equipment_type, profile in DEFAULT_EQUIPMENT_PROFILES.items()
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class HaulingParameters:
     """Parameters for material hauling emissions."""
 
@@ -133,7 +158,9 @@ class HaulingParameters:
 
     def trips_required(self, volume_m3: float) -> int:
         """Calculate number of round trips needed."""
-        return max(1, int(volume_m3 / self.truck_capacity_m3) + 1)
+        if volume_m3 <= 0:
+            return 0
+        return math.ceil(volume_m3 / self.truck_capacity_m3)
 
     def total_distance_km(self, volume_m3: float) -> float:
         """Calculate total haul distance for given volume."""
@@ -141,7 +168,7 @@ class HaulingParameters:
         return trips * self.haul_distance_km * 2  # round trip
 
 
-@dataclass
+@dataclass(slots=True)
 class EarthworkCarbonInput:
     """Input data for earthwork carbon calculations."""
 
@@ -154,7 +181,7 @@ class EarthworkCarbonInput:
     custom_equipment: list[EquipmentEmissionProfile] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RoadConstructionInput:
     """Input data for road construction carbon calculations."""
 
@@ -175,7 +202,7 @@ class RoadConstructionInput:
         return self.total_length_m * self.width_m * self.base_depth_m
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectEnergyProfile:
     """Energy generation profile for solar/wind projects."""
 
@@ -190,15 +217,27 @@ class ProjectEnergyProfile:
         degradation = (1 - self.annual_degradation_percent / 100) ** (year - 1)
         return self.capacity_mw * 8760 * self.capacity_factor * degradation
 
+    def annual_generation_curve_mwh(self, years: int | None = None) -> np.ndarray:
+        """Calculate energy generation for each year, starting at year 1."""
+        if years is None:
+            years = self.project_lifetime_years
+        retention = 1 - self.annual_degradation_percent / 100
+        return (
+            self.capacity_mw * 8760 * self.capacity_factor
+        ) * retention ** np.arange(years)
+
     def lifetime_generation_mwh(self) -> float:
         """Calculate total lifetime energy generation."""
-        return sum(
-            self.annual_generation_mwh(year)
-            for year in range(1, self.project_lifetime_years + 1)
-        )
+        # Geometric series of annual output degrading by a constant ratio
+        first_year = self.capacity_mw * 8760 * self.capacity_factor
+        years = max(self.project_lifetime_years, 0)
+        retention = 1 - self.annual_degradation_percent / 100
+        if retention == 1:
+            return first_year * years
+        return first_year * (1 - retention**years) / (1 - retention)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GridEmissionFactors:
     """Grid emission factors for carbon offset calculations."""
 
@@ -220,7 +259,12 @@ class GridEmissionFactors:
         return self.source_factors.get(source, 386.0)
 
 
-@dataclass
+# Shared read-only defaults; pass custom instances to CarbonCalculator instead
+EPA_FACTORS = EPAEmissionFactors()
+GRID_FACTORS = GridEmissionFactors()
+
+
+@dataclass(slots=True)
 class CarbonBreakdown:
     """Detailed carbon emissions breakdown."""
 
@@ -245,7 +289,7 @@ class CarbonBreakdown:
         return self.total_construction_kg / 1000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CarbonOffsetResult:
     """Carbon offset from clean energy generation."""
 
@@ -263,7 +307,7 @@ class CarbonOffsetResult:
         return self.lifetime_offset_kg / 1000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LifetimeImpactResult:
     """Net carbon impact over project lifetime."""
 
@@ -284,7 +328,7 @@ class LifetimeImpactResult:
         return self.net_impact_kg < 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CarbonCalculationResult:
     """Complete carbon calculation result."""
 
@@ -321,15 +365,17 @@ class CarbonCalculationResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API response."""
+        construction = self.construction
+        total_kg = construction.total_construction_kg
         result = {
             "project_id": self.project_id,
             "construction": {
-                "equipment_emissions_kg": self.construction.equipment_emissions_kg,
-                "hauling_emissions_kg": self.construction.hauling_emissions_kg,
-                "material_emissions_kg": self.construction.material_emissions_kg,
-                "road_construction_kg": self.construction.road_construction_kg,
-                "total_kg": self.construction.total_construction_kg,
-                "total_metric_tons": self.construction.total_construction_metric_tons,
+                "equipment_emissions_kg": construction.equipment_emissions_kg,
+                "hauling_emissions_kg": construction.hauling_emissions_kg,
+                "material_emissions_kg": construction.material_emissions_kg,
+                "road_construction_kg": construction.road_construction_kg,
+                "total_kg": total_kg,
+                "total_metric_tons": total_kg / 1000.0,
             },
             "total_construction_metric_tons": self.total_construction_metric_tons,
             "equivalents": {
@@ -339,25 +385,26 @@ class CarbonCalculationResult:
             },
         }
 
-        if self.offset:
+        offset = self.offset
+        if offset:
             result["offset"] = {
-                "annual_offset_kg": self.offset.annual_offset_kg,
-                "annual_offset_metric_tons": self.offset.annual_offset_metric_tons,
-                "lifetime_offset_kg": self.offset.lifetime_offset_kg,
-                "lifetime_offset_metric_tons": self.offset.lifetime_offset_metric_tons,
-                "grid_baseline": self.offset.grid_baseline.value,
+                "annual_offset_kg": offset.annual_offset_kg,
+                "annual_offset_metric_tons": offset.annual_offset_kg / 1000.0,
+                "lifetime_offset_kg": offset.lifetime_offset_kg,
+                "lifetime_offset_metric_tons": offset.lifetime_offset_kg / 1000.0,
+                "grid_baseline": offset.grid_baseline.value,
             }
 
-        if self.lifetime:
+        lifetime = self.lifetime
+        if lifetime:
             result["lifetime"] = {
-                "construction_emissions_metric_tons": self.lifetime.construction_emissions_kg
-                / 1000,
-                "operational_offset_metric_tons": self.lifetime.operational_offset_kg
+                "construction_emissions_metric_tons": lifetime.construction_emissions_kg
                 / 1000,
-                "net_impact_metric_tons": self.lifetime.net_impact_metric_tons,
-                "payback_years": self.lifetime.payback_years,
-                "project_lifetime_years": self.lifetime.project_lifetime_years,
-                "is_carbon_negative": self.lifetime.is_carbon_negative,
+                "operational_offset_metric_tons": lifetime.operational_offset_kg / 1000,
+                "net_impact_metric_tons": lifetime.net_impact_kg / 1000.0,
+                "payback_years": lifetime.payback_years,
+                "project_lifetime_years": lifetime.project_lifetime_years,
+                "is_carbon_negative": lifetime.is_carbon_negative,
             }
             result["net_lifetime_metric_tons"] = self.net_lifetime_metric_tons
             result["carbon_payback_years"] = self.carbon_payback_years
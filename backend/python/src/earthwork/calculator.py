@@ -4,7 +4,11 @@ Earthwork Volume Calculator
 Calculates cut/fill volumes for asset pads and road alignments.
 """
 
+from typing import Any
+
 import numpy as np
+import shapely
+from numpy.typing import NDArray
 from shapely.affinity import rotate, translate
 from shapely.geometry import LineString, Polygon, box
 
@@ -75,11 +79,48 @@ class VolumeCalculator:
         """Get elevation at world coordinates."""
         row, col = self._world_to_pixel(x, y)
         if 0 <= row < self.height and 0 <= col < self.width:
-            elev = self.dem_data[row, col]
+            elev = self.dem_data.item(row, col)
             if elev != self.nodata_value:
                 return float(elev)
         return None
 
+    def _polygon_cells(
+        self, polygon: Polygon
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Get the DEM cells whose centers lie inside a polygon.
+
+        Args:
+            polygon: Area to sample
+
+        Returns:
+            Tuple of (x, y, elevation) arrays for the valid cells
+        """
+        minx, miny, maxx, maxy = polygon.bounds
+        row_start, col_start = self._world_to_pixel(minx, maxy)
+        row_end, col_end = self._world_to_pixel(maxx, miny)
+        row_start, col_start = max(0, row_start), max(0, col_start)
+        row_end, col_end = min(self.height, row_end + 1), min(self.width, col_end + 1)
+        # A polygon above or left of the raster gives negative ends; keep the
+        # window empty instead of letting a negative slice wrap around
+        row_end, col_end = max(row_start, row_end), max(col_start, col_end)
+
+        # Cell centers, as in _pixel_to_world
+        xs = self.min_x + (np.arange(col_start, col_end) + 0.5) * self.dem_resolution
+        ys = self.max_y - (np.arange(row_start, row_end) + 0.5) * self.dem_resolution
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        elevations = self.dem_data[row_start:row_end, col_start:col_end]
+
+        shapely.prepare(polygon)
+        inside = shapely.contains_xy(polygon, grid_x, grid_y)
+        inside &= elevations != self.nodata_value
+
+        return (
+            grid_x[inside],
+            grid_y[inside],
+            elevations[inside].astype(np.float64),
+        )
+
     def _create_pad_polygon(self, pad: PadDesign) -> Polygon:
         """Create a polygon for the pad footprint."""
         width, length = pad.dimensions
@@ -109,29 +150,55 @@ class VolumeCalculator:
         For LEVEL grading, finds the elevation that minimizes total cut/fill.
         """
         # Get all elevation samples within the polygon
-        minx, miny, maxx, maxy = polygon.bounds
-        elevations = []
+        elevations = self._polygon_cells(polygon)[2]
 
-        row_start, col_start = self._world_to_pixel(minx, maxy)
-        row_end, col_end = self._world_to_pixel(maxx, miny)
-
-        for row in range(max(0, row_start), min(self.height, row_end + 1)):
-            for col in range(max(0, col_start), min(self.width, col_end + 1)):
-                x, y = self._pixel_to_world(row, col)
-                from shapely.geometry import Point
-
-                if polygon.contains(Point(x, y)):
-                    elev = self.dem_data[row, col]
-                    if elev != self.nodata_value:
-                        elevations.append(elev)
-
-        if not elevations:
+        if elevations.size == 0:
             return 0.0
 
         # For balanced cut/fill, use mean elevation
         # This minimizes total earthwork volume
         return float(np.mean(elevations))
 
+    @staticmethod
+    def _grid_volumes(
+        existing: NDArray[np.float64],
+        design: float | NDArray[np.float64],
+        cell_area: float,
+    ) -> dict[str, Any]:
+        """
+        Sum cut and fill over sampled cells.
+
+        Args:
+            existing: Existing ground elevation per cell
+            design: Design elevation, per cell or for all cells
+            cell_area: Area of one DEM cell
+
+        Returns:
+            Unadjusted volume and depth fields of VolumeResult
+        """
+        diff = existing - design
+        # Cut where existing ground is above design, fill where below
+        cut_depths = diff[diff > 0]
+        fill_depths = -diff[diff < 0]
+
+        if existing.size == 0:
+            elev_range = (0.0, 0.0)
+        else:
+            elev_range = (float(existing.min()), float(existing.max()))
+
+        return {
+            "cut_volume": float(cut_depths.sum()) * cell_area,
+            "fill_volume": float(fill_depths.sum()) * cell_area,
+            "area": existing.size * cell_area,
+            "average_cut_depth": float(cut_depths.mean()) if cut_depths.size else 0.0,
+            "average_fill_depth": (
+                float(fill_depths.mean()) if fill_depths.size else 0.0
+            ),
+            "max_cut_depth": float(cut_depths.max()) if cut_depths.size else 0.0,
+            "max_fill_depth": float(fill_depths.max()) if fill_depths.size else 0.0,
+            "existing_elevation_range": elev_range,
+        }
+
     def calculate_pad_volume(self, pad: PadDesign) -> VolumeResult:
         """
         Calculate cut/fill volumes for a single pad.
@@ -155,80 +222,25 @@ class VolumeCalculator:
             )
 
         # Calculate volumes using grid method
-        minx, miny, maxx, maxy = buffered_polygon.bounds
-
-        cut_volume = 0.0
-        fill_volume = 0.0
-        cut_depths = []
-        fill_depths = []
-        existing_elevations = []
-        cell_area = self.dem_resolution**2
-        cell_count = 0
-
-        row_start, col_start = self._world_to_pixel(minx, maxy)
-        row_end, col_end = self._world_to_pixel(maxx, miny)
-
-        from shapely.geometry import Point
-
-        for row in range(max(0, row_start), min(self.height, row_end + 1)):
-            for col in range(max(0, col_start), min(self.width, col_end + 1)):
-                x, y = self._pixel_to_world(row, col)
-                point = Point(x, y)
-
-                if not buffered_polygon.contains(point):
-                    continue
-
-                existing_elev = self.dem_data[row, col]
-                if existing_elev == self.nodata_value:
-                    continue
-
-                cell_count += 1
-                existing_elevations.append(existing_elev)
-
-                # Calculate difference
-                diff = existing_elev - design_elevation
-
-                if diff > 0:
-                    # Cut required (existing ground higher than design)
-                    cut_volume += diff * cell_area
-                    cut_depths.append(diff)
-                elif diff < 0:
-                    # Fill required (existing ground lower than design)
-                    fill_volume += abs(diff) * cell_area
-                    fill_depths.append(abs(diff))
+        volumes = self._grid_volumes(
+            self._polygon_cells(buffered_polygon)[2],
+            design_elevation,
+            self.dem_resolution**2,
+        )
 
         # Calculate adjusted volumes with shrink/swell factors
-        adjusted_cut = cut_volume * self.soil_properties.shrink_factor
-        adjusted_fill = fill_volume * self.soil_properties.swell_factor
-
-        # Calculate statistics
-        area = cell_count * cell_area
-        avg_cut = np.mean(cut_depths) if cut_depths else 0.0
-        avg_fill = np.mean(fill_depths) if fill_depths else 0.0
-        max_cut = max(cut_depths) if cut_depths else 0.0
-        max_fill = max(fill_depths) if fill_depths else 0.0
-
-        elev_range = (
-            min(existing_elevations) if existing_elevations else 0.0,
-            max(existing_elevations) if existing_elevations else 0.0,
-        )
+        adjusted_cut = volumes["cut_volume"] * self.soil_properties.shrink_factor
+        adjusted_fill = volumes["fill_volume"] * self.soil_properties.swell_factor
 
         return VolumeResult(
             element_id=pad.asset_id,
             element_type="pad",
-            cut_volume=cut_volume,
-            fill_volume=fill_volume,
-            net_volume=cut_volume - fill_volume,
+            net_volume=volumes["cut_volume"] - volumes["fill_volume"],
             adjusted_cut=adjusted_cut,
             adjusted_fill=adjusted_fill,
             adjusted_net=adjusted_cut - adjusted_fill,
-            area=area,
-            average_cut_depth=float(avg_cut),
-            average_fill_depth=float(avg_fill),
-            max_cut_depth=float(max_cut),
-            max_fill_depth=float(max_fill),
-            existing_elevation_range=elev_range,
             design_elevation=design_elevation,
+            **volumes,
         )
 
     def calculate_road_volume(self, road: RoadDesign) -> VolumeResult:
@@ -301,84 +313,31 @@ class VolumeCalculator:
             grade = (road.max_grade / 100) * (1 if end_elev > start_elev else -1)
 
         # Calculate volumes using grid method
-        minx, miny, maxx, maxy = road_polygon.bounds
-
-        cut_volume = 0.0
-        fill_volume = 0.0
-        cut_depths = []
-        fill_depths = []
-        existing_elevations = []
-        cell_area = self.dem_resolution**2
-        cell_count = 0
-
-        row_start, col_start = self._world_to_pixel(minx, maxy)
-        row_end, col_end = self._world_to_pixel(maxx, miny)
-
-        from shapely.geometry import Point
-
-        for row in range(max(0, row_start), min(self.height, row_end + 1)):
-            for col in range(max(0, col_start), min(self.width, col_end + 1)):
-                x, y = self._pixel_to_world(row, col)
-                point = Point(x, y)
-
-                if not road_polygon.contains(point):
-                    continue
-
-                existing_elev = self.dem_data[row, col]
-                if existing_elev == self.nodata_value:
-                    continue
-
-                cell_count += 1
-                existing_elevations.append(existing_elev)
-
-                # Calculate distance along road for design elevation
-                distance_along = line.project(point)
-                design_elev = start_elev + grade * distance_along
-
-                # Calculate difference
-                diff = existing_elev - design_elev
-
-                if diff > 0:
-                    cut_volume += diff * cell_area
-                    cut_depths.append(diff)
-                elif diff < 0:
-                    fill_volume += abs(diff) * cell_area
-                    fill_depths.append(abs(diff))
+        xs, ys, existing_elevations = self._polygon_cells(road_polygon)
+
+        # Design elevation from distance along the road centerline
+        distance_along = shapely.line_locate_point(line, shapely.points(xs, ys))
+        volumes = self._grid_volumes(
+            existing_elevations,
+            start_elev + grade * distance_along,
+            self.dem_resolution**2,
+        )
 
         # Calculate adjusted volumes
-        adjusted_cut = cut_volume * self.soil_properties.shrink_factor
-        adjusted_fill = fill_volume * self.soil_properties.swell_factor
-
-        # Calculate statistics
-        area = cell_count * cell_area
-        avg_cut = np.mean(cut_depths) if cut_depths else 0.0
-        avg_fill = np.mean(fill_depths) if fill_depths else 0.0
-        max_cut = max(cut_depths) if cut_depths else 0.0
-        max_fill = max(fill_depths) if fill_depths else 0.0
-
-        elev_range = (
-            min(existing_elevations) if existing_elevations else 0.0,
-            max(existing_elevations) if existing_elevations else 0.0,
-        )
+        adjusted_cut = volumes["cut_volume"] * self.soil_properties.shrink_factor
+        adjusted_fill = volumes["fill_volume"] * self.soil_properties.swell_factor
 
         avg_design_elev = (start_elev + end_elev) / 2
 
         return VolumeResult(
             element_id=road.segment_id,
             element_type="road",
-            cut_volume=cut_volume,
-            fill_volume=fill_volume,
-            net_volume=cut_volume - fill_volume,
+            net_volume=volumes["cut_volume"] - volumes["fill_volume"],
             adjusted_cut=adjusted_cut,
             adjusted_fill=adjusted_fill,
             adjusted_net=adjusted_cut - adjusted_fill,
-            area=area,
-            average_cut_depth=float(avg_cut),
-            average_fill_depth=float(avg_fill),
-            max_cut_depth=float(max_cut),
-            max_fill_depth=float(max_fill),
-            existing_elevation_range=elev_range,
             design_elevation=avg_design_elev,
+            **volumes,
         )
 
 
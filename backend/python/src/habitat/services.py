@@ -4,6 +4,7 @@ Habitat Data Services
 Services for USFWS and NWI data integration.
 """
 
+import random
 from datetime import datetime
 from typing import Any
 
@@ -246,28 +247,27 @@ class NWIService:
         if coords and len(coords[0]) > 2:
             # Estimate if area might have wetlands (random simulation)
             # Real implementation would use actual NWI data
-            import random
+            # Private generator: concurrent analyses must not share the stream
+            rng = random.Random(hash(str(coords[0][0])) % 1000)
 
-            random.seed(hash(str(coords[0][0])) % 1000)
-
-            if random.random() > 0.4:  # 60% chance of wetlands
+            if rng.random() > 0.4:  # 60% chance of wetlands
                 wetlands.append(
                     Wetland(
-                        wetland_id=f"NWI-{random.randint(10000, 99999)}",
+                        wetland_id=f"NWI-{rng.randint(10000, 99999)}",
                         wetland_type=WetlandType.PALUSTRINE_EMERGENT,
                         classification_code="PEM1C",
-                        area_m2=random.randint(500, 5000),
+                        area_m2=rng.randint(500, 5000),
                         water_regime="C",
                     )
                 )
 
-            if random.random() > 0.7:  # 30% chance of second wetland
+            if rng.random() > 0.7:  # 30% chance of second wetland
                 wetlands.append(
                     Wetland(
-                        wetland_id=f"NWI-{random.randint(10000, 99999)}",
+                        wetland_id=f"NWI-{rng.randint(10000, 99999)}",
                         wetland_type=WetlandType.RIVERINE,
                         classification_code="R4SBC",
-                        area_m2=random.randint(200, 2000),
+                        area_m2=rng.randint(200, 2000),
                         water_regime="C",
                     )
                 )
@@ -538,6 +538,11 @@ class HabitatImpactCalculator:
         return permits
 
 
+# Shared across requests so upstream service clients live for the process,
+# not one analysis
+_calculator = HabitatImpactCalculator()
+
+
 async def analyze_habitat(
     site_id: str,
     boundary_geojson: dict[str, Any],
@@ -556,8 +561,7 @@ async def analyze_habitat(
     Returns:
         HabitatOverlayResult with complete analysis
     """
-    calculator = HabitatImpactCalculator()
-    return await calculator.analyze_site(
+    return await _calculator.analyze_site(
         site_id=site_id,
         boundary_geojson=boundary_geojson,
         centroid=(latitude, longitude),
@@ -2,6 +2,9 @@
 Main Entry Point
 
 Runs the FastAPI geospatial processing service.
+
+uvicorn[standard] provides uvloop and httptools, which uvicorn selects
+automatically. Per-request access logging is off unless ACCESS_LOG=true.
 """
 
 import os
@@ -14,12 +17,14 @@ def main() -> None:
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
     reload = os.getenv("RELOAD", "false").lower() == "true"
+    access_log = os.getenv("ACCESS_LOG", "false").lower() == "true"
 
     uvicorn.run(
         "src.api.app:app",
         host=host,
         port=port,
         reload=reload,
+        access_log=access_log,
     )
 
 
@@ -5,13 +5,16 @@ Implements a genetic algorithm to optimize asset placement on solar sites,
 considering terrain, exclusion zones, and various constraints.
 """
 
+import logging
+import math
 import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
-from shapely.geometry import Point
+from shapely.geometry import Point, shape
 from shapely.ops import unary_union
 from shapely.prepared import prep
 
@@ -27,6 +30,8 @@ from .models import (
     SiteContext,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class Individual:
@@ -83,6 +88,16 @@ class GeneticOptimizer:
             for i in range(asset.quantity):
                 self.expanded_assets.append((i, asset))
 
+        # Fitness memo keyed on raw gene bytes. Unmutated offspring and
+        # survivors repeat often near convergence, so LRU-bound it to a few
+        # generations' worth of individuals.
+        self._fitness_cache: OrderedDict[
+            bytes, tuple[float, dict[str, float], list[str], bool]
+        ] = OrderedDict()
+        self._fitness_cache_size = 4 * self.config.population_size
+        self.evaluations = 0
+        self.cache_hits = 0
+
     def _prepare_site_data(self):
         """Precompute site-related data for optimization."""
         # Get bounding box
@@ -123,10 +138,11 @@ class GeneticOptimizer:
         # Evaluate initial population
         self._evaluate_population(population)
 
-        # Track convergence
-        convergence_history = []
-        best_fitness = max(ind.fitness for ind in population)
-        convergence_history.append(best_fitness)
+        # Track convergence: best fitness of the initial population and of
+        # each generation, preallocated for the full run
+        convergence_history = np.empty(self.config.generations + 1)
+        convergence_history[0] = max(ind.fitness for ind in population)
+        recorded = 1
 
         stagnation_count = 0
         best_ever = None
@@ -149,7 +165,8 @@ class GeneticOptimizer:
 
             # Track best
             current_best = max(population, key=lambda i: i.fitness)
-            convergence_history.append(current_best.fitness)
+            convergence_history[recorded] = current_best.fitness
+            recorded += 1
 
             if best_ever is None or current_best.fitness > best_ever.fitness:
                 best_ever = Individual(
@@ -167,9 +184,9 @@ class GeneticOptimizer:
             if stagnation_count >= self.config.max_stagnation:
                 break
 
-            if len(convergence_history) > 10:
-                recent = convergence_history[-10:]
-                if max(recent) - min(recent) < self.config.convergence_threshold:
+            if recorded > 10:
+                recent = convergence_history[recorded - 10 : recorded]
+                if np.ptp(recent) < self.config.convergence_threshold:
                     break
 
         # Get best solution
@@ -181,11 +198,17 @@ class GeneticOptimizer:
         alternatives = self._generate_alternatives(population, generation)
 
         total_time = (time.time() - start_time) * 1000
+        logger.debug(
+            "Fitness memo served %d of %d evaluations (%.1f%%)",
+            self.cache_hits,
+            self.evaluations,
+            100 * self.cache_hit_rate,
+        )
 
         return OptimizationResult(
             best_solution=best_solution,
             alternative_solutions=alternatives,
-            convergence_history=convergence_history,
+            convergence_history=convergence_history[:recorded].tolist(),
             total_generations=generation + 1,
             total_time_ms=total_time,
             config=self.config,
@@ -237,8 +260,26 @@ class GeneticOptimizer:
         for individual in population:
             self._evaluate_individual(individual)
 
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of fitness evaluations served from the memo."""
+        return self.cache_hits / self.evaluations if self.evaluations else 0.0
+
     def _evaluate_individual(self, individual: Individual):
         """Calculate fitness for a single individual."""
+        self.evaluations += 1
+        cache_key = individual.genes.tobytes()
+        cached = self._fitness_cache.get(cache_key)
+        if cached is not None:
+            self._fitness_cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            fitness, scores, violations, is_valid = cached
+            individual.fitness = fitness
+            individual.objective_scores = scores.copy()
+            individual.constraint_violations = violations.copy()
+            individual.is_valid = is_valid
+            return
+
         # Decode genes to asset placements
         placements = self._decode_genes(individual.genes)
 
@@ -278,8 +319,19 @@ class GeneticOptimizer:
 
         individual.fitness = fitness
 
+        self._fitness_cache[cache_key] = (
+            fitness,
+            scores.copy(),
+            violations.copy(),
+            individual.is_valid,
+        )
+        if len(self._fitness_cache) > self._fitness_cache_size:
+            self._fitness_cache.popitem(last=False)
+
     def _decode_genes(self, genes: np.ndarray) -> list[PlacedAsset]:
         """Decode genes into asset placements."""
+        # Plain floats keep numpy scalars out of positions and the JSON output
+        genes = genes.tolist()
         placements = []
 
         for i, (instance_num, asset_def) in enumerate(self.expanded_assets):
@@ -452,7 +504,7 @@ class GeneticOptimizer:
         )
 
         # Normalize by site diagonal
-        max_distance = np.sqrt(self.width**2 + self.height**2) * len(placements)
+        max_distance = math.sqrt(self.width**2 + self.height**2) * len(placements)
         return min(1.0, total_distance / max_distance) if max_distance > 0 else 0.5
 
     def _calculate_road_length_score(self, placements: list[PlacedAsset]) -> float:
@@ -472,7 +524,7 @@ class GeneticOptimizer:
             if p.definition.constraints.requires_road_access
         )
 
-        max_distance = np.sqrt(self.width**2 + self.height**2) * len(placements)
+        max_distance = math.sqrt(self.width**2 + self.height**2) * len(placements)
         return min(1.0, total_distance / max_distance) if max_distance > 0 else 0.5
 
     def _calculate_compactness_score(self, placements: list[PlacedAsset]) -> float:
@@ -484,9 +536,9 @@ class GeneticOptimizer:
         centroid = np.mean(positions, axis=0)
 
         distances = [np.linalg.norm(np.array(p) - centroid) for p in positions]
-        avg_distance = np.mean(distances)
+        avg_distance = float(np.mean(distances))
 
-        max_distance = np.sqrt(self.width**2 + self.height**2) / 2
+        max_distance = math.sqrt(self.width**2 + self.height**2) / 2
         return 1.0 - min(1.0, avg_distance / max_distance) if max_distance > 0 else 0.5
 
     def _calculate_capacity_score(self, placements: list[PlacedAsset]) -> float:
@@ -655,8 +707,6 @@ def optimize_layout(
     Returns:
         Optimization result as dictionary
     """
-    from shapely.geometry import shape
-
     # Convert boundary
     boundary = shape(site_boundary)
 
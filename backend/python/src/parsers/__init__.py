@@ -8,12 +8,14 @@ from .dxf_parser import (
     ContourLine,
     ContourSet,
     get_dxf_info,
+    iter_dxf_contours,
     parse_dxf,
     parse_dxf_with_layers,
 )
 
 __all__ = [
     "parse_dxf",
+    "iter_dxf_contours",
     "parse_dxf_with_layers",
     "get_dxf_info",
     "ContourLine",
@@ -5,16 +5,28 @@ Parses DXF files containing contour lines and extracts elevation data
 for DEM generation.
 """
 
-from collections.abc import Sequence
+import io
+import re
+from collections import Counter
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, BinaryIO
 
 import ezdxf
 import numpy as np
+from ezdxf.document import Drawing
 from ezdxf.entities import Line, LWPolyline, Polyline, Spline
+from ezdxf.filemanagement import dxf_stream_info
+from ezdxf.lldxf.tagger import binary_tags_loader
 from numpy.typing import NDArray
 from shapely.geometry import LineString
 
+# A DXF source is a filesystem path or a seekable binary file-like object
+DXFSource = str | Path | BinaryIO
+
+_BINARY_DXF_SENTINEL = b"AutoCAD Binary DXF\r\n\x1a\x00"
+
 
 @dataclass
 class ContourLine:
@@ -34,6 +46,14 @@ class ContourLine:
         """Get length of contour line in coordinate units."""
         return self.geometry.length
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "elevation": self.elevation,
+            "layer": self.layer,
+            "coordinates": list(self.geometry.coords),
+        }
+
     def sample_points(self, interval: float) -> list[tuple[float, float, float]]:
         """
         Sample points along the contour at regular intervals.
@@ -72,6 +92,11 @@ class ContourSet:
         """Get the elevation range."""
         return self.max_elevation - self.min_elevation
 
+    @property
+    def layers(self) -> list[str]:
+        """Get the distinct contour layers in first-seen order."""
+        return list(dict.fromkeys(c.layer for c in self.contours))
+
     def get_all_points(self, sample_interval: float = 10.0) -> NDArray[np.float64]:
         """
         Get all elevation points from contours.
@@ -135,8 +160,6 @@ def _extract_elevation_from_entity(entity: ezdxf.entities.DXFEntity) -> float |
 
 def _extract_elevation_from_layer(layer_name: str) -> float | None:
     """Try to extract elevation from layer name."""
-    import re
-
     # Common patterns: "CONTOUR_100", "ELEV-100", "100m", "C100"
     patterns = [
         r"[-_](\d+(?:\.\d+)?)\s*$",  # suffix number
@@ -191,37 +214,72 @@ def _entity_to_linestring(entity: ezdxf.entities.DXFEntity) -> LineString | None
     return LineString(coords)
 
 
-def parse_dxf(
-    filepath: str | Path,
+def _read_document(source: DXFSource) -> Drawing:
+    """
+    Read a DXF document from a path or a binary stream.
+
+    Streams are decoded the same way ``ezdxf.readfile`` decodes files:
+    binary DXF is detected by its sentinel, ASCII DXF encoding is taken
+    from the header.
+
+    Args:
+        source: Path to the DXF file or a seekable binary stream
+
+    Returns:
+        Loaded ezdxf document
+    """
+    if isinstance(source, (str, Path)):
+        return ezdxf.readfile(str(source))
+
+    source.seek(0)
+    if source.read(len(_BINARY_DXF_SENTINEL)) == _BINARY_DXF_SENTINEL:
+        source.seek(0)
+        return Drawing.load(binary_tags_loader(source.read()))
+
+    # Detach the wrappers so they don't close the caller's stream
+    source.seek(0)
+    probe = io.TextIOWrapper(source, encoding="utf-8", errors="ignore")
+    try:
+        info = dxf_stream_info(probe)
+    finally:
+        probe.detach()
+
+    source.seek(0)
+    text = io.TextIOWrapper(source, encoding=info.encoding, errors="surrogateescape")
+    try:
+        return ezdxf.read(text)
+    finally:
+        text.detach()
+
+
+def iter_dxf_contours(
+    filepath: DXFSource,
     layer_filter: Sequence[str] | None = None,
     elevation_attribute: str | None = None,
-) -> ContourSet:
+) -> Iterator[ContourLine]:
     """
-    Parse a DXF file and extract contour lines.
+    Yield contour lines from a DXF file as they are extracted.
+
+    The document is loaded on the first ``next()``, so read errors
+    surface there rather than when the generator is created.
 
     Args:
-        filepath: Path to the DXF file
+        filepath: Path to the DXF file or a binary file-like object
         layer_filter: Optional list of layer names to include
         elevation_attribute: Optional attribute name for elevation data
 
-    Returns:
-        ContourSet containing all extracted contours
+    Yields:
+        Contour lines that carry an elevation, in entity type order
 
     Raises:
-        ValueError: If no contours could be extracted
         FileNotFoundError: If the file doesn't exist
     """
-    filepath = Path(filepath)
-
-    if not filepath.exists():
+    if isinstance(filepath, (str, Path)) and not Path(filepath).exists():
         raise FileNotFoundError(f"DXF file not found: {filepath}")
 
-    doc = ezdxf.readfile(str(filepath))
+    doc = _read_document(filepath)
     msp = doc.modelspace()
 
-    contours: list[ContourLine] = []
-    elevations: set[float] = set()
-
     # Collect all line-type entities
     entity_types = ["LWPOLYLINE", "POLYLINE", "LINE", "SPLINE"]
 
@@ -255,14 +313,41 @@ def parse_dxf(
             if geometry is None:
                 continue
 
-            contour = ContourLine(
+            yield ContourLine(
                 elevation=elevation,
                 geometry=geometry,
                 layer=entity.dxf.layer,
             )
 
-            contours.append(contour)
-            elevations.add(elevation)
+
+def parse_dxf(
+    filepath: DXFSource,
+    layer_filter: Sequence[str] | None = None,
+    elevation_attribute: str | None = None,
+) -> ContourSet:
+    """
+    Parse a DXF file and extract contour lines.
+
+    Args:
+        filepath: Path to the DXF file or a binary file-like object
+        layer_filter: Optional list of layer names to include
+        elevation_attribute: Optional attribute name for elevation data
+
+    Returns:
+        ContourSet containing all extracted contours
+
+    Raises:
+        ValueError: If no contours could be extracted
+        FileNotFoundError: If the file doesn't exist
+    """
+    contours = list(
+        iter_dxf_contours(
+            filepath,
+            layer_filter=layer_filter,
+            elevation_attribute=elevation_attribute,
+        )
+    )
+    elevations = {c.elevation for c in contours}
 
     if not contours:
         raise ValueError("No contours with elevation data found in DXF file")
@@ -281,8 +366,6 @@ def parse_dxf(
             sorted_elevs[i + 1] - sorted_elevs[i] for i in range(len(sorted_elevs) - 1)
         ]
         # Most common interval
-        from collections import Counter
-
         rounded_intervals = [round(i, 1) for i in intervals]
         interval_counts = Counter(rounded_intervals)
         contour_interval = interval_counts.most_common(1)[0][0]
@@ -329,18 +412,17 @@ def parse_dxf_with_layers(filepath: str | Path) -> dict[str, ContourSet]:
     return result
 
 
-def get_dxf_info(filepath: str | Path) -> dict:
+def get_dxf_info(filepath: DXFSource) -> dict:
     """
     Get basic information about a DXF file without full parsing.
 
     Args:
-        filepath: Path to the DXF file
+        filepath: Path to the DXF file or a binary file-like object
 
     Returns:
         Dictionary with file information
     """
-    filepath = Path(filepath)
-    doc = ezdxf.readfile(str(filepath))
+    doc = _read_document(filepath)
     msp = doc.modelspace()
 
     # Count entities by type
@@ -358,7 +440,11 @@ def get_dxf_info(filepath: str | Path) -> dict:
         units = doc.header.get("$INSUNITS", None)
 
     return {
-        "filepath": str(filepath),
+        "filepath": (
+            str(filepath)
+            if isinstance(filepath, (str, Path))
+            else str(getattr(filepath, "name", None) or "")
+        ),
         "version": doc.dxfversion,
         "layers": layers,
         "entity_counts": entity_counts,
@@ -5,12 +5,20 @@ Generates professional PDF reports using ReportLab.
 """
 
 import io
+import os
+import tempfile
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import BinaryIO
 
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     Image,
@@ -29,101 +37,134 @@ from .models import (
 )
 
 
-class PDFReportGenerator:
+@contextmanager
+def _binary_streams() -> Iterator[None]:
     """
-    PDF report generator using ReportLab.
+    Write Flate streams as raw binary rather than ASCII85-armoured text.
+
+    The armour adds a quarter to every compressed page stream and image.
+    ReportLab only offers this as a process-wide setting, so it is
+    switched off for the duration of one build and then restored.
     """
+    previous = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = previous
 
-    def __init__(self, data: ReportData):
-        self.data = data
-        self.config = data.config
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-        self.story = []
-        self.page_count = 0
 
-    def _setup_custom_styles(self):
-        """Set up custom paragraph styles."""
-        # Title style
-        self.styles.add(
-            ParagraphStyle(
-                name="ReportTitle",
-                parent=self.styles["Heading1"],
-                fontSize=24,
-                spaceAfter=30,
-                textColor=colors.HexColor("#1e3a5f"),
-                alignment=1,  # Center
-            )
-        )
+@lru_cache(maxsize=1)
+def _report_styles() -> StyleSheet1:
+    """
+    Build the report paragraph styles.
 
-        # Subtitle style
-        self.styles.add(
-            ParagraphStyle(
-                name="ReportSubtitle",
-                parent=self.styles["Normal"],
-                fontSize=14,
-                spaceAfter=12,
-                textColor=colors.HexColor("#666666"),
-                alignment=1,
-            )
+    Styles are only read during layout, so one stylesheet is built per
+    process and shared by every report rendered in it.
+    """
+    styles = getSampleStyleSheet()
+
+    # Title style
+    styles.add(
+        ParagraphStyle(
+            name="ReportTitle",
+            parent=styles["Heading1"],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=colors.HexColor("#1e3a5f"),
+            alignment=1,  # Center
         )
-
-        # Section header
-        self.styles.add(
-            ParagraphStyle(
-                name="SectionHeader",
-                parent=self.styles["Heading2"],
-                fontSize=16,
-                spaceBefore=20,
-                spaceAfter=12,
-                textColor=colors.HexColor("#1e3a5f"),
-                borderPadding=(0, 0, 5, 0),
-            )
+    )
+
+    # Subtitle style
+    styles.add(
+        ParagraphStyle(
+            name="ReportSubtitle",
+            parent=styles["Normal"],
+            fontSize=14,
+            spaceAfter=12,
+            textColor=colors.HexColor("#666666"),
+            alignment=1,
         )
-
-        # Subsection header
-        self.styles.add(
-            ParagraphStyle(
-                name="SubsectionHeader",
-                parent=self.styles["Heading3"],
-                fontSize=12,
-                spaceBefore=12,
-                spaceAfter=8,
-                textColor=colors.HexColor("#333333"),
-            )
+    )
+
+    # Section header
+    styles.add(
+        ParagraphStyle(
+            name="SectionHeader",
+            parent=styles["Heading2"],
+            fontSize=16,
+            spaceBefore=20,
+            spaceAfter=12,
+            textColor=colors.HexColor("#1e3a5f"),
+            borderPadding=(0, 0, 5, 0),
         )
-
-        # Body text
-        self.styles.add(
-            ParagraphStyle(
-                name="BodyText",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                spaceAfter=8,
-                leading=14,
-            )
+    )
+
+    # Subsection header
+    styles.add(
+        ParagraphStyle(
+            name="SubsectionHeader",
+            parent=styles["Heading3"],
+            fontSize=12,
+            spaceBefore=12,
+            spaceAfter=8,
+            textColor=colors.HexColor("#333333"),
         )
-
-        # Table header
-        self.styles.add(
-            ParagraphStyle(
-                name="TableHeader",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=colors.white,
-                alignment=1,
-            )
+    )
+
+    # Body text; the sample sheet already defines BodyText, so replace it
+    del styles.byName["BodyText"]
+    styles.add(
+        ParagraphStyle(
+            name="BodyText",
+            parent=styles["Normal"],
+            fontSize=10,
+            spaceAfter=8,
+            leading=14,
         )
-
-        # Table cell
-        self.styles.add(
-            ParagraphStyle(
-                name="TableCell",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                alignment=1,
-            )
+    )
+
+    # Table header
+    styles.add(
+        ParagraphStyle(
+            name="TableHeader",
+            parent=styles["Normal"],
+            fontSize=9,
+            textColor=colors.white,
+            alignment=1,
+        )
+    )
+
+    # Table cell
+    styles.add(
+        ParagraphStyle(
+            name="TableCell",
+            parent=styles["Normal"],
+            fontSize=9,
+            alignment=1,
         )
+    )
+
+    return styles
+
+
+class PDFReportGenerator:
+    """
+    PDF report generator using ReportLab.
+    """
+
+    def __init__(self, data: ReportData):
+        self.data = data
+        self.config = data.config
+        self.styles = _report_styles()
+        self.story = []
+        self.page_count = 0
+
+    @cached_property
+    def _total_footprint(self) -> float:
+        """Combined asset footprint in m², shared by summary and schedule."""
+        return sum(a.area_m2 for a in self.data.assets)
 
     def _get_page_size(self):
         """Get page size based on config."""
@@ -206,7 +247,7 @@ class PDFReportGenerator:
             summary_text += f"""
             <br/><br/>
             <b>Layout Summary:</b> The proposed layout includes {len(self.data.assets)} assets
-            with a total footprint of {sum(a.area_m2 for a in self.data.assets):,.0f} m².
+            with a total footprint of {self._total_footprint:,.0f} m².
             """
 
         if self.data.earthwork:
@@ -289,12 +330,11 @@ class PDFReportGenerator:
         self.story.append(Paragraph("Asset Schedule", self.styles["SectionHeader"]))
 
         # Summary
-        total_footprint = sum(a.area_m2 for a in self.data.assets)
-        valid_count = sum(1 for a in self.data.assets if a.is_valid)
+        valid_count = sum(a.is_valid for a in self.data.assets)
 
         summary = f"""
         Total assets: {len(self.data.assets)}<br/>
-        Total footprint: {total_footprint:,.0f} m²<br/>
+        Total footprint: {self._total_footprint:,.0f} m²<br/>
         Valid placements: {valid_count} ({100*valid_count/len(self.data.assets):.0f}%)
         """
         self.story.append(Paragraph(summary, self.styles["BodyText"]))
@@ -541,13 +581,22 @@ class PDFReportGenerator:
         )
         return table
 
-    def generate(self) -> ReportResult:
-        """Generate the PDF report."""
+    def generate(self, output: BinaryIO | None = None) -> ReportResult:
+        """
+        Generate the PDF report.
+
+        Args:
+            output: Optional binary file to write the PDF to. When given,
+                the result carries no pdf_data.
+
+        Returns:
+            ReportResult with PDF data (or file size) or error
+        """
         start_time = time.time()
 
         try:
             # Create PDF buffer
-            buffer = io.BytesIO()
+            buffer = output if output is not None else io.BytesIO()
 
             # Create document
             doc = SimpleDocTemplate(
@@ -581,11 +630,17 @@ class PDFReportGenerator:
                 self._add_maps()
 
             # Build PDF
-            doc.build(self.story)
+            with _binary_streams():
+                doc.build(self.story)
 
             # Get PDF data
-            pdf_data = buffer.getvalue()
-            buffer.close()
+            if output is None:
+                pdf_data = buffer.getvalue()
+                file_size = len(pdf_data)
+                buffer.close()
+            else:
+                pdf_data = None
+                file_size = output.tell()
 
             # Calculate generation time
             generation_time = (time.time() - start_time) * 1000
@@ -598,7 +653,7 @@ class PDFReportGenerator:
             return ReportResult(
                 success=True,
                 filename=filename,
-                file_size=len(pdf_data),
+                file_size=file_size,
                 page_count=len(self.story) // 10 + 1,  # Approximate
                 generation_time_ms=generation_time,
                 pdf_data=pdf_data,
@@ -615,15 +670,31 @@ class PDFReportGenerator:
             )
 
 
-def generate_report(data: ReportData) -> ReportResult:
+def generate_report(
+    data: ReportData, output_path: str | Path | None = None
+) -> ReportResult:
     """
     Generate a PDF report from the provided data.
 
     Args:
         data: Complete report data
+        output_path: Optional path to write the PDF to instead of returning
+            its bytes. The file is written to a temporary sibling and
+            renamed into place, so readers never see a partial report.
 
     Returns:
-        ReportResult with PDF data or error
+        ReportResult with PDF data (or file size, when written) or error
     """
     generator = PDFReportGenerator(data)
-    return generator.generate()
+    if output_path is None:
+        return generator.generate()
+
+    output_path = Path(output_path)
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as fh:
+        result = generator.generate(fh)
+    if result.success:
+        os.replace(tmp_name, output_path)
+    else:
+        os.unlink(tmp_name)
+    return result
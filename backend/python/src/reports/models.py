@@ -37,7 +37,7 @@ class MapType(Enum):
     ROAD_NETWORK = "road_network"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectInfo:
     """Project information for report header."""
 
@@ -70,7 +70,7 @@ class MapImage:
         return base64.b64encode(self.image_data).decode("utf-8")
 
 
-@dataclass
+@dataclass(slots=True)
 class TerrainSummary:
     """Terrain analysis summary."""
 
@@ -86,7 +86,7 @@ class TerrainSummary:
     slope_class_distribution: dict[str, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetInfo:
     """Asset information for schedule."""
 
@@ -104,7 +104,7 @@ class AssetInfo:
     violations: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RoadInfo:
     """Road segment information."""
 
@@ -118,7 +118,7 @@ class RoadInfo:
     fill_volume: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EarthworkSummary:
     """Earthwork summary for report."""
 
@@ -134,7 +134,7 @@ class EarthworkSummary:
     swell_factor: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CostBreakdown:
     """Cost estimate breakdown."""
 
@@ -191,7 +191,7 @@ class ReportConfig:
     footer_text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportData:
     """Complete data for report generation."""
 
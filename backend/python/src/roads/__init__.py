@@ -12,6 +12,7 @@ from .pathfinding import (
     RoadSegment,
     TerrainAwarePathfinder,
     generate_road_network,
+    haversine_distances,
 )
 
 __all__ = [
@@ -22,4 +23,5 @@ __all__ = [
     "RoadPath",
     "RoadNetwork",
     "generate_road_network",
+    "haversine_distances",
 ]
@@ -6,14 +6,19 @@ optimal road routes that respect slope constraints and avoid exclusion zones.
 """
 
 import heapq
+import uuid
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
 import numpy as np
-from shapely.geometry import LineString, Point, Polygon
+import shapely
+from shapely.geometry import LineString, Polygon, shape
 from shapely.ops import unary_union
 
+# Mean Earth radius used for great-circle distances
+EARTH_RADIUS_M = 6371000.0
+
 
 class CostFactorType(Enum):
     """Types of cost factors for pathfinding."""
@@ -195,25 +200,19 @@ class TerrainAwarePathfinder:
         if not self.exclusion_zones:
             return
 
-        exclusion_union = unary_union(self.exclusion_zones)
+        # World coordinates of every grid node, as in _grid_to_world
+        xs = self.min_x + np.arange(self.grid_cols) * self.config.grid_resolution
+        ys = self.max_y - np.arange(self.grid_rows) * self.config.grid_resolution
+        grid_x, grid_y = np.meshgrid(xs, ys)
 
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                x, y = self._grid_to_world(col, row)
-                # Check if point is in exclusion zone (with buffer for road width)
-                point = Point(x, y)
-                if (
-                    exclusion_union.contains(point)
-                    or exclusion_union.distance(point) < self.config.road_width / 2
-                ):
-                    self.exclusion_mask[row, col] = True
+        # Nodes in an exclusion zone or within half a road width of one
+        exclusion_union = unary_union(self.exclusion_zones)
+        distances = shapely.distance(exclusion_union, shapely.points(grid_x, grid_y))
+        self.exclusion_mask |= distances < self.config.road_width / 2
 
         # Also mask areas outside boundary
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                x, y = self._grid_to_world(col, row)
-                if not self.boundary.contains(Point(x, y)):
-                    self.exclusion_mask[row, col] = True
+        shapely.prepare(self.boundary)
+        self.exclusion_mask |= ~shapely.contains_xy(self.boundary, grid_x, grid_y)
 
     def _build_cost_grid(self):
         """Build cost grid based on slope data."""
@@ -544,9 +543,6 @@ def generate_road_network(
     Returns:
         Road network as dictionary
     """
-    import uuid
-
-    from shapely.geometry import shape
 
     # Convert boundary
     boundary_poly = shape(boundary)
@@ -621,3 +617,29 @@ def generate_road_network(
     )
 
     return network.to_dict()
+
+
+def haversine_distances(
+    lons: np.ndarray, lats: np.ndarray, radius: float = EARTH_RADIUS_M
+) -> np.ndarray:
+    """
+    Calculate great-circle distances between consecutive points.
+
+    Args:
+        lons: Longitudes in degrees
+        lats: Latitudes in degrees
+        radius: Sphere radius in meters
+
+    Returns:
+        Array of len(lons) - 1 segment lengths in meters
+    """
+    lon = np.radians(lons)
+    lat = np.radians(lats)
+    lat1, lat2 = lat[:-1], lat[1:]
+
+    a = np.sin(np.diff(lat) / 2) ** 2
+    a += np.cos(lat1) * np.cos(lat2) * np.sin(np.diff(lon) / 2) ** 2
+    # Rounding can push a just past 1 for antipodal points
+    np.clip(a, 0.0, 1.0, out=a)
+
+    return 2 * radius * np.arcsin(np.sqrt(a))
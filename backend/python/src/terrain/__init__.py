@@ -16,6 +16,7 @@ from .analysis import (
     calculate_slope,
     calculate_terrain_metrics,
     classify_slope,
+    count_steep_pixels,
     generate_aspect_visualization,
     generate_slope_visualization,
     identify_steep_areas,
@@ -25,22 +26,36 @@ from .analysis import (
 from .dem_generator import (
     DEMConfig,
     DEMResult,
+    bbox_window,
     generate_dem_from_contours,
     generate_dem_from_points,
     load_dem_from_geotiff,
+    load_dem_from_npy,
+    read_dem_statistics,
+    read_dem_tile,
     resample_dem,
+    sample_dem_elevation,
+    sample_dem_elevations,
     save_dem_as_geotiff,
+    save_dem_as_npy,
 )
 
 __all__ = [
     # DEM Generator
     "DEMConfig",
     "DEMResult",
+    "bbox_window",
     "generate_dem_from_contours",
     "generate_dem_from_points",
     "save_dem_as_geotiff",
     "load_dem_from_geotiff",
+    "save_dem_as_npy",
+    "load_dem_from_npy",
+    "read_dem_statistics",
+    "read_dem_tile",
     "resample_dem",
+    "sample_dem_elevation",
+    "sample_dem_elevations",
     # Terrain Analysis
     "SlopeUnit",
     "SlopeClassBreakpoint",
@@ -56,6 +71,7 @@ __all__ = [
     "generate_slope_visualization",
     "generate_aspect_visualization",
     "identify_steep_areas",
+    "count_steep_pixels",
     "save_slope_as_geotiff",
     "save_aspect_as_geotiff",
 ]
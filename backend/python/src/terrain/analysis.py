@@ -4,6 +4,7 @@ Terrain Analysis Module
 Calculates slope, aspect, elevation metrics, and buildability scores from DEM data.
 """
 
+import operator
 from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
@@ -84,7 +85,7 @@ class TerrainMetrics:
 class SlopeResult:
     """Result of slope calculation."""
 
-    data: NDArray[np.float64]
+    data: NDArray[np.floating]
     unit: SlopeUnit
     transform: Affine
     crs: CRS
@@ -119,6 +120,16 @@ class AspectResult:
     nodata_value: float
     distribution: dict[str, float]  # Percentage in each cardinal direction
 
+    @property
+    def dominant_direction(self) -> str:
+        """Get the most common direction, ignoring flat cells."""
+        dominant = max(
+            ((k, v) for k, v in self.distribution.items() if k != "Flat"),
+            key=operator.itemgetter(1),
+            default=("N", 0),
+        )
+        return dominant[0]
+
     def to_dem_result(self) -> DEMResult:
         """Convert to DEMResult for saving."""
         return DEMResult(
@@ -139,7 +150,7 @@ class AspectResult:
 class ClassifiedSlopeResult:
     """Result of slope classification."""
 
-    data: NDArray[np.int32]  # Class indices
+    data: NDArray[np.int8]  # Class indices
     classes: list[SlopeClassBreakpoint]
     transform: Affine
     crs: CRS
@@ -148,34 +159,24 @@ class ClassifiedSlopeResult:
     buildable_percent: float
 
 
-def calculate_slope(
+def _horn_gradients(
     dem: DEMResult,
-    unit: SlopeUnit = SlopeUnit.DEGREES,
-) -> SlopeResult:
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
     """
-    Calculate slope from a DEM.
+    Calculate dz/dx and dz/dy with Horn's 3x3 stencil.
 
-    Uses the Horn algorithm (3x3 neighborhood) for slope calculation.
+    The stencil is accumulated in place so only two output arrays and one
+    scratch array are allocated. Nodata cells become NaN.
 
     Args:
         dem: Input DEM
-        unit: Output unit (degrees, percent, or ratio)
 
     Returns:
-        SlopeResult containing the slope raster
+        Tuple of (dz_dx, dz_dy) arrays
     """
-    data = dem.data.copy()
-    nodata = dem.nodata_value
-
-    # Get cell size
-    cell_size_x = abs(dem.transform.a)
-    cell_size_y = abs(dem.transform.e)
-
-    # Replace nodata with NaN for calculations
-    data = np.where(data == nodata, np.nan, data)
-
-    # Pad array to handle edges
-    padded = np.pad(data, 1, mode="edge")
+    # Pad array to handle edges, then replace nodata with NaN in the copy
+    padded = np.pad(dem.data.astype(np.float64, copy=False), 1, mode="edge")
+    padded[padded == dem.nodata_value] = np.nan
 
     # Extract 3x3 neighborhood values using Horn's method
     # z1 z2 z3
@@ -190,36 +191,88 @@ def calculate_slope(
     z8 = padded[2:, 1:-1]
     z9 = padded[2:, 2:]
 
-    # Calculate dz/dx and dz/dy using Horn's method
-    dz_dx = ((z3 + 2 * z6 + z9) - (z1 + 2 * z4 + z7)) / (8 * cell_size_x)
-    dz_dy = ((z7 + 2 * z8 + z9) - (z1 + 2 * z2 + z3)) / (8 * cell_size_y)
+    scratch = np.empty(dem.data.shape, dtype=np.float64)
+
+    # dz/dx = ((z3 + 2*z6 + z9) - (z1 + 2*z4 + z7)) / (8 * cell_size_x)
+    dz_dx = np.add(z3, z9)
+    dz_dx -= z1
+    dz_dx -= z7
+    np.subtract(z6, z4, out=scratch)
+    scratch *= 2
+    dz_dx += scratch
+    dz_dx /= 8 * abs(dem.transform.a)
+
+    # dz/dy = ((z7 + 2*z8 + z9) - (z1 + 2*z2 + z3)) / (8 * cell_size_y)
+    dz_dy = np.add(z7, z9)
+    dz_dy -= z1
+    dz_dy -= z3
+    np.subtract(z8, z2, out=scratch)
+    scratch *= 2
+    dz_dy += scratch
+    dz_dy /= 8 * abs(dem.transform.e)
+
+    return dz_dx, dz_dy
+
+
+def calculate_slope(
+    dem: DEMResult,
+    unit: SlopeUnit = SlopeUnit.DEGREES,
+) -> SlopeResult:
+    """
+    Calculate slope from a DEM.
+
+    Uses the Horn algorithm (3x3 neighborhood) for slope calculation.
+
+    Args:
+        dem: Input DEM
+        unit: Output unit (degrees, percent, or ratio)
 
-    # Calculate slope
-    slope_radians = np.arctan(np.sqrt(dz_dx**2 + dz_dy**2))
+    Returns:
+        SlopeResult containing the slope raster
+    """
+    nodata = dem.nodata_value
+    dz_dx, dz_dy = _horn_gradients(dem)
+
+    # Gradient magnitude is the slope ratio (rise over run)
+    slope = np.multiply(dz_dx, dz_dx, out=dz_dx)
+    slope += np.multiply(dz_dy, dz_dy, out=dz_dy)
+    np.sqrt(slope, out=slope)
 
     # Convert to requested unit
     if unit == SlopeUnit.DEGREES:
-        slope = np.degrees(slope_radians)
+        np.arctan(slope, out=slope)
+        np.degrees(slope, out=slope)
     elif unit == SlopeUnit.PERCENT:
-        slope = np.tan(slope_radians) * 100
-    else:  # RATIO
-        slope = np.tan(slope_radians)
+        slope *= 100
+    # RATIO needs no conversion
 
-    # Replace NaN with nodata
-    slope = np.where(np.isnan(slope), nodata, slope)
+    # Slope inherits the DEM dtype
+    slope = slope.astype(dem.data.dtype, copy=False)
 
     # Calculate statistics
-    valid_slope = slope[slope != nodata]
+    invalid = np.isnan(slope)
+    valid_count = slope.size - int(np.count_nonzero(invalid))
+
+    if valid_count > 0:
+        min_slope = float(np.nanmin(slope))
+        max_slope = float(np.nanmax(slope))
+        slope[invalid] = 0.0
+        mean_slope = float(slope.sum(dtype=np.float64) / valid_count)
+    else:
+        min_slope = max_slope = mean_slope = 0
+
+    # Replace NaN with nodata
+    slope[invalid] = nodata
 
     return SlopeResult(
-        data=slope.astype(np.float64),
+        data=slope,
         unit=unit,
         transform=dem.transform,
         crs=dem.crs,
         nodata_value=nodata,
-        min_slope=float(np.nanmin(valid_slope)) if len(valid_slope) > 0 else 0,
-        max_slope=float(np.nanmax(valid_slope)) if len(valid_slope) > 0 else 0,
-        mean_slope=float(np.nanmean(valid_slope)) if len(valid_slope) > 0 else 0,
+        min_slope=min_slope,
+        max_slope=max_slope,
+        mean_slope=mean_slope,
     )
 
 
@@ -236,56 +289,34 @@ def calculate_aspect(dem: DEMResult) -> AspectResult:
     Returns:
         AspectResult containing the aspect raster
     """
-    data = dem.data.copy()
     nodata = dem.nodata_value
+    dz_dx, dz_dy = _horn_gradients(dem)
 
-    # Get cell size
-    cell_size_x = abs(dem.transform.a)
-    cell_size_y = abs(dem.transform.e)
-
-    # Replace nodata with NaN
-    data = np.where(data == nodata, np.nan, data)
-
-    # Pad array
-    padded = np.pad(data, 1, mode="edge")
-
-    # Extract neighborhood
-    z1 = padded[:-2, :-2]
-    z2 = padded[:-2, 1:-1]
-    z3 = padded[:-2, 2:]
-    z4 = padded[1:-1, :-2]
-    z6 = padded[1:-1, 2:]
-    z7 = padded[2:, :-2]
-    z8 = padded[2:, 1:-1]
-    z9 = padded[2:, 2:]
-
-    # Calculate gradients
-    dz_dx = ((z3 + 2 * z6 + z9) - (z1 + 2 * z4 + z7)) / (8 * cell_size_x)
-    dz_dy = ((z7 + 2 * z8 + z9) - (z1 + 2 * z2 + z3)) / (8 * cell_size_y)
+    # Mark flat areas (where slope is essentially 0)
+    flat = dz_dx * dz_dx + dz_dy * dz_dy < 0.0001**2
 
     # Calculate aspect (in radians, then convert to degrees)
     # atan2 returns -pi to pi, we need 0 to 360
-    aspect_rad = np.arctan2(dz_dy, -dz_dx)
-    aspect_deg = np.degrees(aspect_rad)
+    np.negative(dz_dx, out=dz_dx)
+    aspect_deg = np.arctan2(dz_dy, dz_dx, out=dz_dy)
+    np.degrees(aspect_deg, out=aspect_deg)
 
     # Convert to 0-360 (clockwise from north)
-    aspect_deg = 90.0 - aspect_deg
-    aspect_deg = np.where(aspect_deg < 0, aspect_deg + 360, aspect_deg)
-    aspect_deg = np.where(aspect_deg >= 360, aspect_deg - 360, aspect_deg)
+    np.subtract(90.0, aspect_deg, out=aspect_deg)
+    aspect_deg[aspect_deg < 0] += 360
+    aspect_deg[aspect_deg >= 360] -= 360
 
-    # Mark flat areas (where slope is essentially 0)
-    slope_magnitude = np.sqrt(dz_dx**2 + dz_dy**2)
-    aspect_deg = np.where(slope_magnitude < 0.0001, -1, aspect_deg)
+    aspect_deg[flat] = -1
 
     # Replace NaN with nodata
-    aspect_deg = np.where(np.isnan(aspect_deg), nodata, aspect_deg)
+    aspect_deg[np.isnan(aspect_deg)] = nodata
 
     # Calculate distribution
     valid_aspect = aspect_deg[(aspect_deg != nodata) & (aspect_deg >= 0)]
     distribution = _calculate_aspect_distribution(valid_aspect)
 
     return AspectResult(
-        data=aspect_deg.astype(np.float64),
+        data=aspect_deg,
         transform=dem.transform,
         crs=dem.crs,
         nodata_value=nodata,
@@ -349,11 +380,11 @@ def classify_slope(
         classes = DEFAULT_SLOPE_CLASSES
 
     classes = list(classes)
-    data = slope.data.copy()
+    data = slope.data
     nodata = slope.nodata_value
 
     # Initialize with nodata
-    classified = np.full(data.shape, -1, dtype=np.int32)
+    classified = np.full(data.shape, -1, dtype=np.int8)
 
     # Classify each pixel
     prev_max = 0.0
@@ -365,12 +396,13 @@ def classify_slope(
     # Calculate distribution
     valid_data = classified[classified >= 0]
     total = len(valid_data)
+    counts = np.bincount(valid_data, minlength=len(classes))
 
     distribution: dict[str, float] = {}
     buildable_count = 0
 
     for i, cls in enumerate(classes):
-        count = np.sum(valid_data == i)
+        count = int(counts[i])
         pct = float(count / total * 100) if total > 0 else 0.0
         distribution[cls.label] = pct
         if cls.buildable:
@@ -392,6 +424,8 @@ def classify_slope(
 def calculate_terrain_metrics(
     dem: DEMResult,
     slope_classes: Sequence[SlopeClassBreakpoint] | None = None,
+    slope: SlopeResult | None = None,
+    aspect: AspectResult | None = None,
 ) -> TerrainMetrics:
     """
     Calculate comprehensive terrain metrics for an area.
@@ -399,26 +433,22 @@ def calculate_terrain_metrics(
     Args:
         dem: Input DEM
         slope_classes: Optional custom slope classification
+        slope: Precomputed slope in degrees (calculated if None)
+        aspect: Precomputed aspect (calculated if None)
 
     Returns:
         TerrainMetrics with all calculated values
     """
     # Calculate slope and aspect
-    slope = calculate_slope(dem, SlopeUnit.DEGREES)
-    aspect = calculate_aspect(dem)
+    if slope is None:
+        slope = calculate_slope(dem, SlopeUnit.DEGREES)
+    if aspect is None:
+        aspect = calculate_aspect(dem)
     classified = classify_slope(slope, slope_classes)
 
     # Get valid elevation data
     valid_elev = dem.data[dem.data != dem.nodata_value]
 
-    # Determine dominant aspect
-    aspect_dist = aspect.distribution
-    dominant = max(
-        [(k, v) for k, v in aspect_dist.items() if k != "Flat"],
-        key=lambda x: x[1],
-        default=("N", 0),
-    )
-
     return TerrainMetrics(
         min_elevation=float(np.min(valid_elev)) if len(valid_elev) > 0 else 0,
         max_elevation=float(np.max(valid_elev)) if len(valid_elev) > 0 else 0,
@@ -429,8 +459,8 @@ def calculate_terrain_metrics(
         max_slope=slope.max_slope,
         mean_slope=slope.mean_slope,
         std_slope=float(np.std(slope.data[slope.data != slope.nodata_value])),
-        dominant_aspect=dominant[0],
-        aspect_distribution=aspect_dist,
+        dominant_aspect=aspect.dominant_direction,
+        aspect_distribution=aspect.distribution,
         buildable_area_percent=classified.buildable_percent,
         slope_class_distribution=classified.class_distribution,
     )
@@ -546,7 +576,7 @@ def identify_steep_areas(
     Returns:
         Boolean array where True indicates slope > threshold
     """
-    data = slope.data.copy()
+    data = slope.data
     nodata = slope.nodata_value
 
     # Create mask for steep areas
@@ -555,6 +585,40 @@ def identify_steep_areas(
     return steep_mask
 
 
+def count_steep_pixels(
+    slope: SlopeResult,
+    threshold: float = 15.0,
+    block_pixels: int = 1 << 18,
+) -> tuple[int, int]:
+    """
+    Count steep and valid pixels in a single pass over the slope raster.
+
+    Rows are processed in blocks of roughly ``block_pixels`` so the
+    boolean temporaries stay cache-sized instead of raster-sized.
+
+    Args:
+        slope: Slope result (should be in degrees)
+        threshold: Slope threshold in degrees
+        block_pixels: Approximate number of pixels per block
+
+    Returns:
+        Tuple of (steep pixel count, valid pixel count)
+    """
+    data = slope.data
+    nodata = slope.nodata_value
+    rows = max(1, block_pixels // max(1, data.shape[-1]))
+
+    steep_count = 0
+    valid_count = 0
+    for start in range(0, data.shape[0], rows):
+        block = data[start : start + rows]
+        valid = block != nodata
+        valid_count += int(np.count_nonzero(valid))
+        steep_count += int(np.count_nonzero(valid & (block > threshold)))
+
+    return steep_count, valid_count
+
+
 def save_slope_as_geotiff(
     slope: SlopeResult,
     filepath: str | Path,
@@ -5,6 +5,11 @@ Generates DEMs from contour data using TIN (Triangulated Irregular Network)
 interpolation and exports to Cloud Optimized GeoTIFF (COG) format.
 """
 
+import json
+import math
+import os
+import tempfile
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
@@ -14,11 +19,32 @@ import rasterio
 from numpy.typing import NDArray
 from rasterio.crs import CRS
 from rasterio.enums import Resampling
+from rasterio.errors import WindowError
 from rasterio.transform import from_bounds
+from rasterio.windows import Window
+from rasterio.windows import bounds as window_bounds
+from rasterio.windows import from_bounds as window_from_bounds
 from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator
 
 from ..parsers.dxf_parser import ContourSet
 
+# Internal tile size for Cloud Optimized GeoTIFFs
+COG_BLOCK_SIZE = 512
+
+# Sample type on disk and for loaded rasters; single precision is ample for
+# elevations and halves file size, read bandwidth and kernel memory traffic
+RASTER_DTYPE = "float32"
+
+# Band metadata keys for precomputed statistics; the STATISTICS_* names are
+# the ones GDAL itself reads and writes
+_STATS_TAGS = {
+    "valid_pixels": "VALID_PIXELS",
+    "min_elevation": "STATISTICS_MINIMUM",
+    "max_elevation": "STATISTICS_MAXIMUM",
+    "mean_elevation": "STATISTICS_MEAN",
+    "std_elevation": "STATISTICS_STDDEV",
+}
+
 
 @dataclass
 class DEMConfig:
@@ -36,7 +62,7 @@ class DEMConfig:
 class DEMResult:
     """Result of DEM generation."""
 
-    data: NDArray[np.float64]
+    data: NDArray[np.floating]
     transform: rasterio.Affine
     crs: CRS
     bounds: tuple[float, float, float, float]
@@ -69,6 +95,31 @@ class DEMResult:
 
         return None
 
+    def get_elevations_at(
+        self, xs: NDArray[np.float64], ys: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """
+        Get elevations at many coordinates at once.
+
+        Vectorized form of get_elevation_at, using the same pixel lookup.
+
+        Args:
+            xs: X coordinates (longitude or easting)
+            ys: Y coordinates (latitude or northing)
+
+        Returns:
+            Elevation per coordinate, NaN where outside bounds or nodata
+        """
+        cols, rows = ~self.transform * (xs, ys)
+        cols = np.trunc(cols).astype(np.int64)
+        rows = np.trunc(rows).astype(np.int64)
+        inside = (rows >= 0) & (rows < self.height) & (cols >= 0) & (cols < self.width)
+
+        elevations = np.full(len(xs), np.nan)
+        elevations[inside] = self.data[rows[inside], cols[inside]]
+        elevations[elevations == self.nodata_value] = np.nan
+        return elevations
+
     def get_statistics(self) -> dict:
         """Get DEM statistics."""
         valid_data = self.data[self.data != self.nodata_value]
@@ -81,8 +132,8 @@ class DEMResult:
             "total_pixels": int(self.data.size),
             "min_elevation": float(np.min(valid_data)),
             "max_elevation": float(np.max(valid_data)),
-            "mean_elevation": float(np.mean(valid_data)),
-            "std_elevation": float(np.std(valid_data)),
+            "mean_elevation": float(np.mean(valid_data, dtype=np.float64)),
+            "std_elevation": float(np.std(valid_data, dtype=np.float64)),
             "resolution": self.resolution,
         }
 
@@ -267,6 +318,8 @@ def save_dem_as_geotiff(
     """
     Save DEM as a GeoTIFF file.
 
+    Samples are stored as float32 (see RASTER_DTYPE).
+
     Args:
         dem: DEM result to save
         filepath: Output file path
@@ -282,7 +335,7 @@ def save_dem_as_geotiff(
     # Build profile
     profile = {
         "driver": "GTiff",
-        "dtype": "float64",
+        "dtype": RASTER_DTYPE,
         "width": dem.width,
         "height": dem.height,
         "count": 1,
@@ -291,69 +344,364 @@ def save_dem_as_geotiff(
         "nodata": dem.nodata_value,
     }
 
-    if compress:
+    if create_cog:
+        # The COG driver writes 512px tiles, overviews and IFDs up front so
+        # clients can fetch individual tiles with HTTP range requests
+        profile["driver"] = "COG"
+        profile["blocksize"] = COG_BLOCK_SIZE
+        profile["compress"] = "deflate" if compress else "none"
+        profile["predictor"] = "yes"  # floating point predictor for float data
+        profile["overviews"] = "auto"
+        profile["overview_resampling"] = "average"
+    elif compress:
         profile["compress"] = "deflate"
         profile["predictor"] = 2
 
-    if create_cog:
-        # COG-specific options
-        profile["tiled"] = True
-        profile["blockxsize"] = 512
-        profile["blockysize"] = 512
-        profile["interleave"] = "band"
+    data = dem.data.astype(RASTER_DTYPE, copy=False)
 
     # Write the file
     with rasterio.open(filepath, "w", **profile) as dst:
-        dst.write(dem.data, 1)
-
-        # Add overviews for COG
-        if create_cog:
-            factors = [2, 4, 8, 16]
-            dst.build_overviews(factors, Resampling.average)
-            dst.update_tags(ns="rio_overview", resampling="average")
+        dst.write(data, 1)
+        # Stored stats let read_dem_statistics skip reading the pixels
+        stats = _compute_statistics(data, dem.nodata_value)
+        if stats:
+            dst.update_tags(
+                1, **{tag: repr(stats[key]) for key, tag in _STATS_TAGS.items()}
+            )
 
     return filepath
 
 
-def load_dem_from_geotiff(filepath: str | Path) -> DEMResult:
+def _compute_statistics(data: NDArray, nodata: float) -> dict:
+    """Compute elevation statistics over valid pixels, or {} if none."""
+    valid_data = data[data != nodata]
+
+    if len(valid_data) == 0:
+        return {}
+
+    return {
+        "valid_pixels": int(len(valid_data)),
+        "min_elevation": float(np.min(valid_data)),
+        "max_elevation": float(np.max(valid_data)),
+        "mean_elevation": float(np.mean(valid_data, dtype=np.float64)),
+        "std_elevation": float(np.std(valid_data, dtype=np.float64)),
+    }
+
+
+def load_dem_from_geotiff(
+    filepath: str | Path,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> DEMResult:
     """
     Load a DEM from a GeoTIFF file.
 
+    Samples are returned as float32 (see RASTER_DTYPE). With a bbox, only
+    the pixels covering it are read and decompressed. The window is snapped
+    outward to whole pixels, so cell centers keep their positions in the
+    full raster.
+
     Args:
         filepath: Path to the GeoTIFF file
+        bbox: Optional (min_x, min_y, max_x, max_y) area to read
 
     Returns:
-        DEMResult containing the loaded DEM
+        DEMResult containing the loaded DEM (or the bbox window of it)
+
+    Raises:
+        ValueError: If bbox does not overlap the DEM
     """
     filepath = Path(filepath)
 
     with rasterio.open(filepath) as src:
-        data = src.read(1)
-        transform = src.transform
+        full = Window(0, 0, src.width, src.height)
+        if bbox is None:
+            window = full
+        else:
+            window = bbox_window(bbox, src.transform, full)
+
+        data = src.read(1, window=window).astype(RASTER_DTYPE, copy=False)
+        transform = src.window_transform(window)
         crs = src.crs
-        nodata = src.nodata or -9999.0
-        bounds = src.bounds
+        nodata = _raster_nodata(src.nodata)
+        left, bottom, right, top = window_bounds(window, src.transform)
 
-        # Calculate resolution
-        resolution = abs(transform.a)  # Pixel width
+    # Calculate resolution
+    resolution = abs(transform.a)  # Pixel width
 
-        valid_data = data[data != nodata]
-        min_elev = float(np.min(valid_data)) if len(valid_data) > 0 else 0.0
-        max_elev = float(np.max(valid_data)) if len(valid_data) > 0 else 0.0
+    valid_data = data[data != nodata]
+    min_elev = float(np.min(valid_data)) if len(valid_data) > 0 else 0.0
+    max_elev = float(np.max(valid_data)) if len(valid_data) > 0 else 0.0
 
-        return DEMResult(
-            data=data.astype(np.float64),
-            transform=transform,
-            crs=crs,
-            bounds=(bounds.left, bounds.bottom, bounds.right, bounds.top),
-            resolution=resolution,
-            nodata_value=nodata,
-            min_elevation=min_elev,
-            max_elevation=max_elev,
+    return DEMResult(
+        data=data,
+        transform=transform,
+        crs=crs,
+        bounds=(left, bottom, right, top),
+        resolution=resolution,
+        nodata_value=nodata,
+        min_elevation=min_elev,
+        max_elevation=max_elev,
+        width=data.shape[1],
+        height=data.shape[0],
+    )
+
+
+def _raster_nodata(nodata: float | None) -> float:
+    """Return a raster's nodata value as stored in a RASTER_DTYPE array."""
+    return float(np.dtype(RASTER_DTYPE).type(nodata or -9999.0))
+
+
+def bbox_window(
+    bbox: tuple[float, float, float, float],
+    transform: rasterio.Affine,
+    full: Window,
+) -> Window:
+    """Return the whole-pixel window covering bbox, clipped to the raster."""
+    window = window_from_bounds(*bbox, transform=transform)
+    col_off = math.floor(window.col_off)
+    row_off = math.floor(window.row_off)
+    snapped = Window(
+        col_off,
+        row_off,
+        math.ceil(window.col_off + window.width) - col_off,
+        math.ceil(window.row_off + window.height) - row_off,
+    )
+    try:
+        return snapped.intersection(full)
+    except WindowError:
+        raise ValueError("Bounding box does not overlap the DEM")
+
+
+def save_dem_as_npy(dem: DEMResult, filepath: str | Path) -> Path:
+    """
+    Save a decoded DEM as a raw .npy array plus a JSON metadata file.
+
+    The metadata goes next to the array with a .json suffix and is written
+    last, so its presence marks a complete pair. Both files are written
+    to temporary names and renamed into place.
+
+    Args:
+        dem: DEM result to save
+        filepath: Output .npy path
+
+    Returns:
+        Path to the saved array
+    """
+    filepath = Path(filepath)
+    meta_path = filepath.with_suffix(".json")
+    meta = {
+        "transform": list(dem.transform)[:6],
+        "crs": dem.crs.to_wkt() if dem.crs else None,
+        "bounds": list(dem.bounds),
+        "resolution": dem.resolution,
+        "nodata_value": dem.nodata_value,
+        "min_elevation": dem.min_elevation,
+        "max_elevation": dem.max_elevation,
+    }
+
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as fh:
+        np.save(fh, dem.data, allow_pickle=False)
+    os.replace(tmp_name, filepath)
+
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as fh:
+        json.dump(meta, fh)
+    os.replace(tmp_name, meta_path)
+
+    return filepath
+
+
+def load_dem_from_npy(filepath: str | Path) -> DEMResult:
+    """
+    Load a DEM written by save_dem_as_npy.
+
+    The array is memory-mapped read-only, so loading costs no decode and
+    pages come from the OS page cache.
+
+    Args:
+        filepath: Path to the .npy file
+
+    Returns:
+        DEMResult backed by the memory-mapped array
+    """
+    filepath = Path(filepath)
+    meta = json.loads(filepath.with_suffix(".json").read_text())
+    data = np.load(filepath, mmap_mode="r", allow_pickle=False)
+
+    return DEMResult(
+        data=data,
+        transform=rasterio.Affine(*meta["transform"]),
+        crs=CRS.from_wkt(meta["crs"]) if meta["crs"] else None,
+        bounds=tuple(meta["bounds"]),
+        resolution=meta["resolution"],
+        nodata_value=meta["nodata_value"],
+        min_elevation=meta["min_elevation"],
+        max_elevation=meta["max_elevation"],
+        width=data.shape[1],
+        height=data.shape[0],
+    )
+
+
+def read_dem_statistics(filepath: str | Path) -> dict | None:
+    """
+    Read DEM statistics and metadata without reading the pixel data.
+
+    Uses the statistics tags written by save_dem_as_geotiff, so only the
+    file headers are read.
+
+    Args:
+        filepath: Path to the GeoTIFF file
+
+    Returns:
+        Dictionary in the shape of DEMResult.get_statistics() plus width,
+        height and bounds, or None if the file carries no statistics
+    """
+    with rasterio.open(filepath) as src:
+        tags = src.tags(1)
+        if not all(tag in tags for tag in _STATS_TAGS.values()):
+            return None
+
+        stats: dict = {key: float(tags[tag]) for key, tag in _STATS_TAGS.items()}
+        stats["valid_pixels"] = int(stats["valid_pixels"])
+        bounds = src.bounds
+        stats.update(
+            total_pixels=src.width * src.height,
+            resolution=abs(src.transform.a),
             width=src.width,
             height=src.height,
+            bounds=(bounds.left, bounds.bottom, bounds.right, bounds.top),
         )
 
+    return stats
+
+
+def sample_dem_elevation(filepath: str | Path, x: float, y: float) -> float | None:
+    """
+    Read the elevation at a coordinate without loading the whole DEM.
+
+    Args:
+        filepath: Path to the GeoTIFF file
+        x: X coordinate (longitude or easting)
+        y: Y coordinate (latitude or northing)
+
+    Returns:
+        Elevation value or None if outside bounds or nodata
+    """
+    return sample_dem_elevations(filepath, [(x, y)])[0]
+
+
+def sample_dem_elevations(
+    filepath: str | Path, points: Sequence[tuple[float, float]]
+) -> list[float | None]:
+    """
+    Read the elevations at many coordinates with a single open of the DEM.
+
+    Only the blocks containing the requested pixels are read and
+    decompressed, and GDAL's block cache serves repeat hits on a block.
+
+    Args:
+        filepath: Path to the GeoTIFF file
+        points: (x, y) coordinates to sample
+
+    Returns:
+        Elevation for each point, None where outside bounds or nodata
+    """
+    elevations: list[float | None] = [None] * len(points)
+    if not points:
+        return elevations
+
+    xs, ys = np.asarray(points, dtype=np.float64).T
+
+    with rasterio.open(filepath) as src:
+        # Same pixel lookup as DEMResult.get_elevation_at (truncating)
+        cols, rows = ~src.transform * (xs, ys)
+        cols = np.trunc(cols).astype(np.int64)
+        rows = np.trunc(rows).astype(np.int64)
+        inside = (rows >= 0) & (rows < src.height) & (cols >= 0) & (cols < src.width)
+        nodata = src.nodata or -9999.0
+
+        for i in np.flatnonzero(inside):
+            window = Window(int(cols[i]), int(rows[i]), 1, 1)
+            value = src.read(1, window=window)[0, 0]
+            if value != nodata:
+                elevations[i] = float(value)
+
+    return elevations
+
+
+def read_dem_tile(
+    filepath: str | Path,
+    z: int,
+    x: int,
+    y: int,
+    tile_size: int = COG_BLOCK_SIZE,
+) -> DEMResult:
+    """
+    Read a single tile from a DEM's overview pyramid.
+
+    Zoom 0 is the coarsest overview and the highest zoom is full
+    resolution; x and y index tile_size blocks at that level. For a COG
+    this only reads the headers and the bytes of the requested tile.
+
+    Args:
+        filepath: Path to the GeoTIFF file
+        z: Zoom level
+        x: Tile column
+        y: Tile row
+        tile_size: Tile width and height in pixels
+
+    Returns:
+        DEMResult containing the tile
+
+    Raises:
+        ValueError: If the tile is outside the pyramid
+    """
+    filepath = Path(filepath)
+
+    with rasterio.open(filepath) as src:
+        max_zoom = len(src.overviews(1))
+
+    if not 0 <= z <= max_zoom:
+        raise ValueError(f"Zoom must be between 0 and {max_zoom}")
+
+    overview_level = None if z == max_zoom else max_zoom - 1 - z
+
+    with rasterio.open(filepath, overview_level=overview_level) as src:
+        col_off = x * tile_size
+        row_off = y * tile_size
+        if x < 0 or y < 0 or col_off >= src.width or row_off >= src.height:
+            raise ValueError(f"Tile {z}/{x}/{y} is outside the DEM")
+
+        window = Window(
+            col_off,
+            row_off,
+            min(tile_size, src.width - col_off),
+            min(tile_size, src.height - row_off),
+        )
+        data = src.read(1, window=window).astype(RASTER_DTYPE, copy=False)
+        transform = src.window_transform(window)
+        crs = src.crs
+        nodata = _raster_nodata(src.nodata)
+        left, bottom, right, top = window_bounds(window, src.transform)
+
+    valid_data = data[data != nodata]
+    min_elev = float(np.min(valid_data)) if len(valid_data) > 0 else 0.0
+    max_elev = float(np.max(valid_data)) if len(valid_data) > 0 else 0.0
+
+    return DEMResult(
+        data=data,
+        transform=transform,
+        crs=crs,
+        bounds=(left, bottom, right, top),
+        resolution=abs(transform.a),
+        nodata_value=nodata,
+        min_elevation=min_elev,
+        max_elevation=max_elev,
+        width=data.shape[1],
+        height=data.shape[0],
+    )
+
 
 def resample_dem(
     dem: DEMResult,
@@ -0,0 +1,132 @@
+"""
+Tests for CarbonCalculator batch paths against their scalar counterparts.
+"""
+
+import numpy as np
+
+from src.carbon import (
+    CarbonCalculator,
+    EarthworkCarbonInput,
+    EnergySource,
+    EquipmentEmissionProfile,
+    EquipmentType,
+    FuelType,
+    HaulingParameters,
+    ProjectEnergyProfile,
+)
+
+
+def test_equipment_emissions_batch_matches_scalar():
+    """Each batch row equals calculate_equipment_emissions for that scenario."""
+    calc = CarbonCalculator()
+    scenarios = [
+        {},
+        {EquipmentType.EXCAVATOR: 3},
+        {EquipmentType.BULLDOZER: 2, EquipmentType.SCRAPER: 7},
+        {equipment_type: i + 1 for i, equipment_type in enumerate(EquipmentType)},
+    ]
+
+    batch = calc.calculate_equipment_emissions_batch(scenarios)
+
+    assert batch.shape == (len(scenarios),)
+    np.testing.assert_allclose(
+        batch, [calc.calculate_equipment_emissions(s) for s in scenarios]
+    )
+
+
+def test_equipment_emissions_batch_empty():
+    """No scenarios give an empty result."""
+    assert CarbonCalculator().calculate_equipment_emissions_batch([]).shape == (0,)
+
+
+def test_material_emissions_batch_matches_scalar():
+    """Each (concrete, steel, asphalt, gravel) row matches the scalar path."""
+    calc = CarbonCalculator()
+    tons = np.array(
+        [
+            [0.0, 0.0, 0.0, 0.0],
+            [120.0, 0.0, 0.0, 0.0],
+            [0.0, 15.5, 0.0, 0.0],
+            [0.0, 0.0, 300.0, 0.0],
+            [0.0, 0.0, 0.0, 900.0],
+            [80.0, 4.0, 210.0, 650.0],
+        ]
+    )
+
+    batch = calc.calculate_material_emissions_batch(tons)
+
+    np.testing.assert_allclose(
+        batch, [calc.calculate_material_emissions(*row) for row in tons]
+    )
+
+
+def test_earthwork_emissions_batch_matches_scalar():
+    """Each batch entry equals the scalar equipment plus hauling emissions."""
+    calc = CarbonCalculator()
+    custom = [
+        EquipmentEmissionProfile(EquipmentType.GRADER, FuelType.GASOLINE, 4.0),
+        EquipmentEmissionProfile(EquipmentType.DUMP_TRUCK, FuelType.BIODIESEL_B20, 5.0),
+    ]
+    scenarios = [
+        # Days estimated from volumes, no hauling
+        EarthworkCarbonInput(cut_volume_m3=12_000.0, fill_volume_m3=8_000.0),
+        EarthworkCarbonInput(cut_volume_m3=0.0, fill_volume_m3=0.0),
+        # Explicit days with custom equipment and hauling
+        EarthworkCarbonInput(
+            cut_volume_m3=5_000.0,
+            fill_volume_m3=5_000.0,
+            import_volume_m3=450.0,
+            export_volume_m3=31.0,
+            hauling=HaulingParameters(haul_distance_km=12.0),
+            equipment_days={EquipmentType.EXCAVATOR: 4, EquipmentType.SCRAPER: 2},
+            custom_equipment=custom,
+        ),
+        # Custom equipment is ignored when days are estimated
+        EarthworkCarbonInput(
+            cut_volume_m3=3_000.0,
+            fill_volume_m3=0.0,
+            export_volume_m3=3_000.0,
+            hauling=HaulingParameters(haul_distance_km=5.0, truck_capacity_m3=20.0),
+            custom_equipment=custom,
+        ),
+    ]
+
+    batch = calc.calculate_earthwork_emissions_batch(scenarios)
+
+    expected = []
+    for earthwork in scenarios:
+        breakdown = calc.calculate_earthwork_emissions(earthwork)
+        expected.append(
+            breakdown.equipment_emissions_kg + breakdown.hauling_emissions_kg
+        )
+    np.testing.assert_allclose(batch, expected)
+
+
+def test_lifetime_curve_matches_yearly_generation():
+    """The curve is construction emissions minus the cumulative yearly offset."""
+    calc = CarbonCalculator()
+    profile = ProjectEnergyProfile(capacity_mw=5.0, project_lifetime_years=25)
+    construction_kg = 2_500_000.0
+    grid_factor = calc.grid_factors.get_factor(EnergySource.COAL)
+
+    curve = calc.calculate_lifetime_curve(
+        profile, construction_kg, grid_baseline=EnergySource.COAL
+    )
+
+    expected = construction_kg - np.cumsum(
+        [profile.annual_generation_mwh(year) * grid_factor for year in range(1, 26)]
+    )
+    np.testing.assert_allclose(curve, expected)
+
+    # The final year agrees with the lifetime offset
+    offset = calc.calculate_operational_offset(profile, EnergySource.COAL)
+    assert np.isclose(curve[-1], construction_kg - offset.lifetime_offset_kg)
+
+
+def test_lifetime_curve_custom_years():
+    """``years`` overrides the project lifetime."""
+    profile = ProjectEnergyProfile(capacity_mw=1.0, project_lifetime_years=25)
+    curve = CarbonCalculator().calculate_lifetime_curve(profile, 0.0, years=3)
+
+    assert curve.shape == (3,)
+    assert np.all(np.diff(curve) < 0)
@@ -0,0 +1,45 @@
+"""
+Tests for the carbon calculator data models.
+"""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from src.carbon import (
+    GRID_FACTORS,
+    CarbonCalculator,
+    EnergySource,
+    HaulingParameters,
+)
+
+
+def test_default_grid_factors_pickle_and_copy():
+    """The shared grid defaults survive pickling, deep copies and asdict."""
+    restored = pickle.loads(pickle.dumps(GRID_FACTORS))
+    assert restored == GRID_FACTORS
+    assert copy.deepcopy(GRID_FACTORS) == GRID_FACTORS
+    assert (
+        dataclasses.asdict(GRID_FACTORS)["source_factors"][EnergySource.COAL] == 820.0
+    )
+
+
+def test_default_calculator_pickles():
+    """A calculator built on the shared defaults can be pickled."""
+    calc = pickle.loads(pickle.dumps(CarbonCalculator()))
+    assert calc.grid_factors.get_factor(EnergySource.COAL) == 820.0
+    assert copy.deepcopy(CarbonCalculator()).grid_factors == GRID_FACTORS
+
+
+@pytest.mark.parametrize(
+    ("volume_m3", "trips"),
+    [(30.0, 2), (31.0, 3), (15.0, 1), (0.1, 1), (0.0, 0), (-5.0, 0)],
+)
+def test_trips_required(volume_m3, trips):
+    """Exact truck loads need no extra trip; any remainder needs one more."""
+    hauling = HaulingParameters(haul_distance_km=10.0, truck_capacity_m3=15.0)
+
+    assert hauling.trips_required(volume_m3) == trips
+    assert hauling.total_distance_km(volume_m3) == trips * 20.0
@@ -0,0 +1,112 @@
+"""
+Tests for grid-based cut/fill volume calculation.
+"""
+
+import numpy as np
+import pytest
+from shapely.geometry import Point, Polygon, box
+
+from src.earthwork import PadDesign, VolumeCalculator
+
+
+def _make_calculator() -> VolumeCalculator:
+    """Build a calculator over a 50x50 sloped DEM with a few nodata cells."""
+    rows, cols = np.mgrid[0:50, 0:50]
+    dem = (100.0 + 0.3 * rows - 0.2 * cols + np.sin(cols / 4.0)).astype(np.float32)
+    dem[20:23, 30:33] = -9999.0
+    return VolumeCalculator(dem, (0.0, 0.0, 50.0, 50.0), 1.0)
+
+
+def _reference_cells(
+    calc: VolumeCalculator, polygon: Polygon
+) -> list[tuple[float, float, float]]:
+    """Sample cells the way the original per-pixel loop did."""
+    minx, miny, maxx, maxy = polygon.bounds
+    row_start, col_start = calc._world_to_pixel(minx, maxy)
+    row_end, col_end = calc._world_to_pixel(maxx, miny)
+
+    cells = []
+    for row in range(max(0, row_start), min(calc.height, row_end + 1)):
+        for col in range(max(0, col_start), min(calc.width, col_end + 1)):
+            x, y = calc._pixel_to_world(row, col)
+            if polygon.contains(Point(x, y)):
+                elev = calc.dem_data.item(row, col)
+                if elev != calc.nodata_value:
+                    cells.append((x, y, float(elev)))
+    return cells
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        box(5, 5, 15, 15),
+        box(25, 15, 40, 30),  # covers the nodata block
+        box(-10, -10, 8, 8),  # partially off the raster
+        Polygon([(10, 10), (40, 12), (30, 45), (5, 30)]),
+    ],
+)
+def test_polygon_cells_match_per_pixel_loop(polygon):
+    """Vectorized sampling selects the same cells as the per-pixel loop."""
+    calc = _make_calculator()
+    xs, ys, elevations = calc._polygon_cells(polygon)
+
+    expected = _reference_cells(calc, polygon)
+    assert sorted(zip(xs.tolist(), ys.tolist(), elevations.tolist())) == sorted(
+        expected
+    )
+
+
+def test_pad_volume_matches_per_pixel_loop():
+    """Pad cut/fill equals the sums over the reference cells."""
+    calc = _make_calculator()
+    pad = PadDesign(
+        asset_id="pad-1",
+        asset_type="battery",
+        position=(20.0, 25.0),
+        dimensions=(10.0, 6.0),
+        rotation=30.0,
+        target_elevation=105.0,
+    )
+    result = calc.calculate_pad_volume(pad)
+
+    polygon = calc._create_pad_polygon(pad).buffer(pad.buffer_distance)
+    diffs = [elev - 105.0 for _, _, elev in _reference_cells(calc, polygon)]
+    cut = sum(d for d in diffs if d > 0) * calc.dem_resolution**2
+    fill = -sum(d for d in diffs if d < 0) * calc.dem_resolution**2
+
+    assert result.cut_volume == pytest.approx(cut)
+    assert result.fill_volume == pytest.approx(fill)
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        box(10, 60, 20, 70),  # above
+        box(-30, -30, -20, -20),  # left and below
+        box(-30, 10, -20, 20),  # left
+        box(60, 10, 70, 20),  # right
+        box(10, -30, 20, -20),  # below
+    ],
+)
+def test_polygon_cells_off_raster_is_empty(polygon):
+    """A polygon entirely outside the DEM samples no cells."""
+    calc = _make_calculator()
+    xs, ys, elevations = calc._polygon_cells(polygon)
+
+    assert xs.size == ys.size == elevations.size == 0
+
+
+def test_pad_volume_off_raster_is_zero():
+    """A pad entirely outside the DEM has no cut or fill."""
+    calc = _make_calculator()
+    pad = PadDesign(
+        asset_id="pad-off",
+        asset_type="battery",
+        position=(15.0, 65.0),
+        dimensions=(10.0, 10.0),
+        target_elevation=100.0,
+    )
+    result = calc.calculate_pad_volume(pad)
+
+    assert result.cut_volume == 0
+    assert result.fill_volume == 0
@@ -0,0 +1,76 @@
+"""
+Tests for habitat analysis and its batch endpoint.
+"""
+
+import random
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.app import app
+from src.habitat.services import NWIService
+
+
+def _site(i: int) -> dict:
+    """Build a small square site whose first vertex differs per site."""
+    x, y = -100.0 + i * 0.37, 35.0 + i * 0.11
+    ring = [[x, y], [x + 0.01, y], [x + 0.01, y + 0.01], [x, y + 0.01], [x, y]]
+    return {
+        "site_id": f"site-{i}",
+        "boundary": {"type": "Polygon", "coordinates": [ring]},
+        "latitude": y,
+        "longitude": x,
+    }
+
+
+def _without_date(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "analysis_date"}
+
+
+def test_simulated_wetlands_leave_global_random_alone():
+    """Wetland simulation uses its own generator, so threads can't interleave."""
+    boundary = _site(3)["boundary"]
+    expected = NWIService()._get_simulated_wetlands(boundary)
+
+    random.seed(1234)
+    state = random.getstate()
+    wetlands = NWIService()._get_simulated_wetlands(boundary)
+
+    assert random.getstate() == state
+    assert wetlands == expected
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    """Switch threads as often as possible to expose shared state."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_batch_matches_single_site_analysis(client, frequent_thread_switches):
+    """Each batch result equals what /analyze returns for that site."""
+    sites = [_site(i) for i in range(40)]
+
+    response = client.post(
+        "/api/v1/habitat/analyze/batch",
+        json={"sites": sites},
+        params={"max_concurrency": 10},
+    )
+
+    assert response.status_code == 200
+    items = response.json()
+    assert [item["site_id"] for item in items] == [s["site_id"] for s in sites]
+    for site, item in zip(sites, items):
+        assert item["error"] is None
+        single = client.post("/api/v1/habitat/analyze", json=site)
+        assert single.status_code == 200
+        assert _without_date(item["result"]) == _without_date(single.json())
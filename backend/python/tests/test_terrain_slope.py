@@ -0,0 +1,72 @@
+"""
+Tests for Horn slope calculation.
+"""
+
+import math
+
+import numpy as np
+import pytest
+from rasterio.crs import CRS
+from rasterio.transform import from_origin
+
+from src.terrain import DEMResult, SlopeUnit, calculate_slope
+
+
+def _make_plane(nodata_cell: tuple[int, int] | None = None) -> DEMResult:
+    """Build a 20x30 plane rising 0.3 per column and 0.4 per row."""
+    rows, cols = np.mgrid[0:20, 0:30]
+    data = (100.0 + 0.3 * cols + 0.4 * rows).astype(np.float32)
+    if nodata_cell is not None:
+        data[nodata_cell] = -9999.0
+    return DEMResult(
+        data=data,
+        transform=from_origin(0.0, 20.0, 1.0, 1.0),
+        crs=CRS.from_epsg(32611),
+        bounds=(0.0, 0.0, 30.0, 20.0),
+        resolution=1.0,
+        nodata_value=-9999.0,
+        min_elevation=float(data.min()),
+        max_elevation=float(data.max()),
+        width=30,
+        height=20,
+    )
+
+
+@pytest.mark.parametrize(
+    ("unit", "expected"),
+    [
+        (SlopeUnit.RATIO, 0.5),
+        (SlopeUnit.PERCENT, 50.0),
+        (SlopeUnit.DEGREES, math.degrees(math.atan(0.5))),
+    ],
+)
+def test_plane_slope(unit, expected):
+    """Interior cells of a plane have its analytic slope in every unit."""
+    slope = calculate_slope(_make_plane(), unit)
+
+    assert slope.data.dtype == np.float32
+    np.testing.assert_allclose(slope.data[1:-1, 1:-1], expected, rtol=1e-5)
+    assert slope.max_slope == pytest.approx(expected, rel=1e-5)
+
+
+def test_edges_use_clamped_neighbors():
+    """Edge cells repeat the border value, halving the gradient across it."""
+    slope = calculate_slope(_make_plane(), SlopeUnit.RATIO)
+
+    # Top row: full x gradient, half y gradient
+    np.testing.assert_allclose(slope.data[0, 1:-1], math.hypot(0.3, 0.2), rtol=1e-5)
+    # Left column: half x gradient, full y gradient
+    np.testing.assert_allclose(slope.data[1:-1, 0], math.hypot(0.15, 0.4), rtol=1e-5)
+
+
+def test_nodata_neighborhood_is_nodata():
+    """The eight Horn neighbors of a nodata cell become nodata."""
+    slope = calculate_slope(_make_plane(nodata_cell=(10, 15)), SlopeUnit.RATIO)
+
+    ring = np.ones((3, 3), dtype=bool)
+    ring[1, 1] = False  # Horn's stencil does not use the center cell
+    assert np.all(slope.data[9:12, 14:17][ring] == -9999.0)
+    assert np.count_nonzero(slope.data == -9999.0) == 8
+    assert slope.mean_slope == pytest.approx(
+        float(slope.data[slope.data != -9999.0].mean())
+    )